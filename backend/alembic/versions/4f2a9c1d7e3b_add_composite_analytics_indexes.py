@@ -0,0 +1,34 @@
+"""Add composite indexes for analytics predicates
+
+Revision ID: 4f2a9c1d7e3b
+Revises: b3d1f0c8a2e4
+Create Date: 2026-10-18 13:40:05.118342
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f2a9c1d7e3b'
+down_revision: Union[str, Sequence[str], None] = 'b3d1f0c8a2e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_workout_sessions_trainee_id_session_date', 'workout_sessions', ['trainee_id', 'session_date'], unique=False)
+    op.create_index('ix_workout_sessions_trainee_id_status', 'workout_sessions', ['trainee_id', 'status'], unique=False)
+    op.create_index('ix_exercise_logs_session_id_exercise_id_weight', 'exercise_logs', ['session_id', 'exercise_id', 'completed_weight_kg'], unique=False)
+    op.create_index('ix_health_metrics_trainee_id_recorded_at', 'health_metrics', ['trainee_id', 'recorded_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_health_metrics_trainee_id_recorded_at', table_name='health_metrics')
+    op.drop_index('ix_exercise_logs_session_id_exercise_id_weight', table_name='exercise_logs')
+    op.drop_index('ix_workout_sessions_trainee_id_status', table_name='workout_sessions')
+    op.drop_index('ix_workout_sessions_trainee_id_session_date', table_name='workout_sessions')
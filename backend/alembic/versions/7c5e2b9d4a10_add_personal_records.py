@@ -0,0 +1,87 @@
+"""Add personal_records table
+
+Revision ID: 7c5e2b9d4a10
+Revises: 4f2a9c1d7e3b
+Create Date: 2026-10-18 15:02:17.530981
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c5e2b9d4a10'
+down_revision: Union[str, Sequence[str], None] = '4f2a9c1d7e3b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Value expression per metric, as in app.crud.crud_personal_record
+METRIC_VALUES = {
+    'max_weight': 'el.completed_weight_kg',
+    'max_volume': 'el.volume_kg',
+    'estimated_1rm_epley': (
+        'CASE WHEN el.completed_reps = 1 THEN el.completed_weight_kg '
+        'WHEN el.completed_reps > 1 THEN el.completed_weight_kg * (1 + el.completed_reps / 30.0) END'
+    ),
+    'estimated_1rm_brzycki': (
+        'CASE WHEN el.completed_reps BETWEEN 1 AND 36 '
+        'THEN el.completed_weight_kg * 36.0 / (37 - el.completed_reps) END'
+    ),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('personal_records',
+    sa.Column('trainee_id', sa.Integer(), nullable=False),
+    sa.Column('exercise_id', sa.Integer(), nullable=False),
+    sa.Column('metric', sa.String(), nullable=False),
+    sa.Column('value', sa.Float(), nullable=False),
+    sa.Column('exercise_log_id', sa.Integer(), nullable=False),
+    sa.Column('achieved_date', sa.Date(), nullable=False),
+    sa.Column('weight_kg', sa.Float(), nullable=True),
+    sa.Column('sets', sa.Integer(), nullable=True),
+    sa.Column('reps', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['exercise_id'], ['exercises.id'], ),
+    sa.ForeignKeyConstraint(['trainee_id'], ['trainees.id'], ),
+    sa.PrimaryKeyConstraint('trainee_id', 'exercise_id', 'metric')
+    )
+
+    # Backfill from existing logs: best set per trainee, exercise and metric
+    for metric, value in METRIC_VALUES.items():
+        op.execute(
+            f"""
+            INSERT INTO personal_records (
+                trainee_id, exercise_id, metric, value, exercise_log_id,
+                achieved_date, weight_kg, sets, reps
+            )
+            SELECT trainee_id, exercise_id, '{metric}', value, log_id, session_date, weight, sets, reps
+            FROM (
+                SELECT
+                    ws.trainee_id AS trainee_id,
+                    el.exercise_id AS exercise_id,
+                    {value} AS value,
+                    el.id AS log_id,
+                    ws.session_date AS session_date,
+                    el.completed_weight_kg AS weight,
+                    el.completed_sets AS sets,
+                    el.completed_reps AS reps,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY ws.trainee_id, el.exercise_id
+                        ORDER BY {value} DESC, ws.session_date DESC, el.id DESC
+                    ) AS rank
+                FROM exercise_logs el
+                JOIN workout_sessions ws ON el.session_id = ws.id
+                WHERE ws.trainee_id IS NOT NULL AND el.exercise_id IS NOT NULL
+                    AND el.completed_weight_kg IS NOT NULL AND {value} IS NOT NULL
+            ) ranked
+            WHERE rank = 1
+            """
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('personal_records')
@@ -0,0 +1,67 @@
+"""Add trainee_daily_stats rollup
+
+Revision ID: 9acff6690419
+Revises: 6591fe4b79c3
+Create Date: 2026-10-18 09:12:41.204117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9acff6690419'
+down_revision: Union[str, Sequence[str], None] = '6591fe4b79c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('trainee_daily_stats',
+    sa.Column('trainee_id', sa.Integer(), nullable=False),
+    sa.Column('session_date', sa.Date(), nullable=False),
+    sa.Column('exercise_id', sa.Integer(), nullable=False),
+    sa.Column('log_count', sa.Integer(), nullable=False),
+    sa.Column('total_volume_kg', sa.Float(), nullable=False),
+    sa.Column('max_weight_kg', sa.Float(), nullable=True),
+    sa.Column('weight_sum_kg', sa.Float(), nullable=False),
+    sa.Column('weighted_log_count', sa.Integer(), nullable=False),
+    sa.Column('total_sets', sa.Integer(), nullable=False),
+    sa.Column('total_reps', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['exercise_id'], ['exercises.id'], ),
+    sa.ForeignKeyConstraint(['trainee_id'], ['trainees.id'], ),
+    sa.PrimaryKeyConstraint('trainee_id', 'session_date', 'exercise_id')
+    )
+
+    # Backfill from existing logs
+    op.execute(
+        """
+        INSERT INTO trainee_daily_stats (
+            trainee_id, session_date, exercise_id, log_count, total_volume_kg,
+            max_weight_kg, weight_sum_kg, weighted_log_count, total_sets, total_reps
+        )
+        SELECT
+            ws.trainee_id,
+            ws.session_date,
+            el.exercise_id,
+            COUNT(el.id),
+            COALESCE(SUM(el.volume_kg), 0.0),
+            MAX(el.completed_weight_kg),
+            COALESCE(SUM(el.completed_weight_kg), 0.0),
+            COUNT(el.completed_weight_kg),
+            COALESCE(SUM(el.completed_sets), 0),
+            COALESCE(SUM(el.completed_reps), 0)
+        FROM exercise_logs el
+        JOIN workout_sessions ws ON el.session_id = ws.id
+        WHERE ws.trainee_id IS NOT NULL AND el.exercise_id IS NOT NULL
+        GROUP BY ws.trainee_id, ws.session_date, el.exercise_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('trainee_daily_stats')
@@ -0,0 +1,29 @@
+"""Add users.token_version
+
+Revision ID: b3d1f0c8a2e4
+Revises: 9acff6690419
+Create Date: 2026-10-18 11:02:17.530661
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3d1f0c8a2e4'
+down_revision: Union[str, Sequence[str], None] = '9acff6690419'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('token_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_column('token_version')
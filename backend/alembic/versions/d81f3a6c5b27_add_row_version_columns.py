@@ -0,0 +1,35 @@
+"""Add row version columns
+
+Revision ID: d81f3a6c5b27
+Revises: 7c5e2b9d4a10
+Create Date: 2026-10-18 16:21:48.407215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd81f3a6c5b27'
+down_revision: Union[str, Sequence[str], None] = '7c5e2b9d4a10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+VERSIONED_TABLES = ('exercises', 'programs', 'gyms', 'trainers', 'workout_sessions', 'exercise_logs')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows share version "0"; (id, version) pairs stay unique because
+    # rows written from now on get random versions
+    for table in VERSIONED_TABLES:
+        op.add_column(table, sa.Column('version_id', sa.String(length=32), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(VERSIONED_TABLES):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column('version_id')
@@ -0,0 +1,61 @@
+"""Add full-text search indexes
+
+Revision ID: e5a7c3f19b62
+Revises: d81f3a6c5b27
+Create Date: 2026-10-18 18:05:12.731904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a7c3f19b62'
+down_revision: Union[str, Sequence[str], None] = 'd81f3a6c5b27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copy of app/db/search.py at this revision. Note that a SQLite
+# batch_alter_table on these source tables recreates them and drops the
+# triggers; re-run the trigger statements afterwards.
+SEARCH_TABLES = {'exercises': 'exercises_fts', 'programs': 'programs_fts'}
+SEARCH_DOCUMENT = "to_tsvector('english', coalesce(name, '') || ' ' || coalesce(description, ''))"
+
+
+def _sqlite_ddl(source: str, fts: str) -> list[str]:
+    columns = "name, description"
+    old = f"INSERT INTO {fts}({fts}, rowid, {columns}) VALUES ('delete', old.id, old.name, old.description);"
+    new = f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.id, new.name, new.description);"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({columns}, content='{source}', content_rowid='id', "
+        "tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {source} BEGIN {new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {source} BEGIN {old} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {columns} ON {source} BEGIN {old} {new} END",
+    ]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    for source, fts in SEARCH_TABLES.items():
+        if dialect == 'sqlite':
+            for statement in _sqlite_ddl(source, fts):
+                op.execute(statement)
+            # Index the rows that already exist
+            op.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+        elif dialect == 'postgresql':
+            op.execute(f"CREATE INDEX IF NOT EXISTS ix_{source}_search ON {source} USING gin ({SEARCH_DOCUMENT})")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    for source, fts in SEARCH_TABLES.items():
+        if dialect == 'sqlite':
+            for suffix in ('ai', 'ad', 'au'):
+                op.execute(f"DROP TRIGGER IF EXISTS {fts}_{suffix}")
+            op.execute(f"DROP TABLE IF EXISTS {fts}")
+        elif dialect == 'postgresql':
+            op.execute(f"DROP INDEX IF EXISTS ix_{source}_search")
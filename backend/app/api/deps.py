@@ -1,17 +1,34 @@
 """Common FastAPI dependencies used by API routers."""
-from typing import Generator
+from typing import AsyncGenerator, Generator, Union
+
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.db.session import SessionLocal
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal, SessionLocal
 
+# Session type handed to endpoints that depend on ``get_db_session``
+DBSession = Union[Session, AsyncSession]
 
-def get_db() -> Generator[Session, None, None]:
-    """Yield a SQLAlchemy session and ensure it is closed after use.
 
-    NOTE: Consider using an async database driver and async session for improved performance.
-    """
+def get_db() -> Generator[Session, None, None]:
+    """Yield a SQLAlchemy session and ensure it is closed after use."""
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Yield an AsyncSession; only available when DB_ASYNC_ENABLED is set."""
+    if AsyncSessionLocal is None:
+        raise RuntimeError("Async database access is disabled (DB_ASYNC_ENABLED=false)")
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# Session dependency for ``async def`` endpoints. Pair it with the
+# ``async_*`` CRUD objects, which accept either session type, so the same
+# endpoints run on the threadpool (sync) or on the event loop (async).
+get_db_session = get_async_db if settings.DB_ASYNC_ENABLED else get_db
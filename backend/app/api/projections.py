@@ -0,0 +1,27 @@
+"""
+Responses for ``view=summary`` listings.
+
+Summary queries select plain columns, so their rows are encoded as JSON
+directly instead of going through mapped objects and ``orm_mode`` schemas.
+The ``*Summary`` schemas only document the row shapes in OpenAPI.
+"""
+from datetime import date, datetime
+from typing import Any, Iterable, Optional
+
+from fastapi.responses import JSONResponse
+
+
+def row_to_dict(row: Any) -> dict[str, Any]:
+    return {
+        key: value.isoformat() if isinstance(value, (date, datetime)) else value
+        for key, value in row._mapping.items()
+    }
+
+
+def summary_response(rows: Iterable[Any]) -> JSONResponse:
+    return JSONResponse([row_to_dict(row) for row in rows])
+
+
+def summary_page_response(rows: Iterable[Any], next_cursor: Optional[str]) -> JSONResponse:
+    """Same envelope as ``Page``."""
+    return JSONResponse({"items": [row_to_dict(row) for row in rows], "next_cursor": next_cursor})
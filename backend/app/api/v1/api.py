@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import gyms, trainers, trainees, programs, exercises, health_metrics, program_exercises, workout_sessions, exercise_logs, analytics, trainer_dashboard
+from app.api.v1.endpoints import gyms, trainers, trainees, programs, exercises, health_metrics, program_exercises, workout_sessions, exercise_logs, analytics, trainer_dashboard, metrics, search
 from app.auth import api as auth_api
 
 api_router = APIRouter()
@@ -16,3 +16,5 @@ api_router.include_router(workout_sessions.router, prefix="/workout_sessions", t
 api_router.include_router(exercise_logs.router, prefix="/exercise_logs", tags=["exercise_logs"])
 api_router.include_router(analytics.router, prefix="/analytics", tags=["analytics"])
 api_router.include_router(trainer_dashboard.router, prefix="/trainer-dashboard", tags=["trainer-dashboard"])
+api_router.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
+api_router.include_router(search.router, prefix="/search", tags=["search"])
@@ -1,10 +1,12 @@
-from typing import Any, List, Generator
+from typing import Any, List, Generator, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 
 from app.crud.crud_exercise_log import exercise_log as crud_exercise_log
+from app.crud.pagination import MAX_PAGE_SIZE
 from app.schemas.exercise_log import ExerciseLog, ExerciseLogCreate, ExerciseLogUpdate
+from app.schemas.pagination import Page
 from app.api.deps import get_db
 from app.auth.deps import get_current_user
 from app.models.trainee import Trainee
@@ -24,12 +26,16 @@ def create_exercise_log(
     return exercise_log_obj
 
 
-@router.get("/", response_model=List[ExerciseLog])
+@router.get("/", response_model=Union[List[ExerciseLog], Page[ExerciseLog]])
 def read_exercise_logs(
     db: Session = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
 ) -> Any:
+    if cursor is not None:
+        exercise_logs, next_cursor = crud_exercise_log.get_page(db, cursor=cursor, limit=limit)
+        return {"items": exercise_logs, "next_cursor": next_cursor}
     exercise_logs = crud_exercise_log.get_multi(db, skip=skip, limit=limit)
     return exercise_logs
 
@@ -1,11 +1,15 @@
-from typing import Any, List
+from typing import Any, List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
 
 from app.crud.crud_exercise import exercise as crud_exercise
+from app.crud.pagination import MAX_PAGE_SIZE
+from app.crud.exercise_catalog import exercise_catalog
 from app.schemas.exercise import Exercise, ExerciseCreate, ExerciseUpdate
+from app.schemas.pagination import Page
 from app.api.deps import get_db
+from app.core.etag import make_etag, not_modified
 from app.auth.deps import get_current_user, require_trainer
 from app.models.trainee import Trainee
 
@@ -31,21 +35,52 @@ def create_exercise(
     return e
 
 
-@router.get("/", response_model=List[Exercise])
+@router.get("/", response_model=Union[List[Exercise], Page[Exercise]])
 def read_exercises(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     current_user: Trainee = Depends(get_current_user),
 ) -> Any:
     """
     Get list of exercises. Requires authentication.
     All authenticated users can view the exercise library.
+
+    Skip/limit responses carry an ETag built from row versions; send it back
+    as If-None-Match to get an empty 304 while the page is unchanged.
     """
+    if cursor is not None:
+        exercises, next_cursor = crud_exercise.get_page(db, cursor=cursor, limit=limit)
+        return {"items": exercises, "next_cursor": next_cursor}
+    etag = make_etag(["exercises", skip, limit, crud_exercise.get_versions(db, skip=skip, limit=limit)])
+    unchanged = not_modified(request, response, etag)
+    if unchanged is not None:
+        return unchanged
     exercises = crud_exercise.get_multi(db, skip=skip, limit=limit)
     return exercises
 
 
+@router.get("/search", response_model=List[Exercise])
+def search_exercises(
+    db: Session = Depends(get_db),
+    q: str = Query(..., min_length=1, max_length=100, description="Prefix of the exercise name or of any word in it"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of matches to return"),
+    current_user: Trainee = Depends(get_current_user),
+) -> Any:
+    """
+    Autocomplete over the exercise library. Requires authentication.
+
+    Served from the in-memory exercise catalog, so it normally issues no SQL.
+    Matching is case-insensitive and ignores punctuation; exact names come
+    first, then names starting with ``q``, then names with a later word
+    starting with it (e.g. ``q=squat`` finds "Back Squat").
+    """
+    return exercise_catalog.search(db, q, limit=limit)
+
+
 @router.get("/{exercise_id}", response_model=Exercise)
 def read_exercise(
     exercise_id: int,
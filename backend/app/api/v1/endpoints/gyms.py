@@ -1,10 +1,12 @@
-from typing import Any, List
+from typing import Any, List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 
 from app.crud.crud_gym import gym as crud_gym
+from app.crud.pagination import MAX_PAGE_SIZE
 from app.schemas.gym import Gym, GymCreate, GymUpdate
+from app.schemas.pagination import Page
 from app.api.deps import get_db
 from app.auth.deps import get_current_user
 from app.models.trainee import Trainee
@@ -26,12 +28,16 @@ def create_gym(
     return gym_obj
 
 
-@router.get("/", response_model=List[Gym])
+@router.get("/", response_model=Union[List[Gym], Page[Gym]])
 def read_gyms(
     db: Session = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
 ) -> Any:
+    if cursor is not None:
+        gyms, next_cursor = crud_gym.get_page(db, cursor=cursor, limit=limit)
+        return {"items": gyms, "next_cursor": next_cursor}
     gyms = crud_gym.get_multi(db, skip=skip, limit=limit)
     return gyms
 
@@ -1,11 +1,15 @@
-from typing import Any, List
+from typing import Any, List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 
 from app.crud.crud_health_metric import health_metric as crud_health_metric
-from app.schemas.health_metric import HealthMetric, HealthMetricCreate, HealthMetricUpdate
+from app.crud.pagination import MAX_PAGE_SIZE
+from app.schemas.health_metric import HealthMetric, HealthMetricCreate, HealthMetricSummary, HealthMetricUpdate
+from app.schemas.enums import ListView
+from app.schemas.pagination import Page
 from app.api.deps import get_db
+from app.api.projections import summary_page_response, summary_response
 from app.auth.deps import get_current_user, require_trainer
 from app.models.trainee import Trainee
 
@@ -13,21 +17,44 @@ router = APIRouter()  # Removed duplicate prefix
 
 
 # Protected: requires authentication - users access own metrics
-@router.get("/me", response_model=List[HealthMetric])
+@router.get(
+    "/me",
+    response_model=Union[
+        List[HealthMetric], Page[HealthMetric], List[HealthMetricSummary], Page[HealthMetricSummary]
+    ],
+)
 def read_my_health_metrics(
     *,
     db: Session = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    view: ListView = ListView.FULL,
     current_user: Trainee = Depends(get_current_user),
 ) -> Any:
     """
     Get health metrics for the current logged-in user.
     Users can only access their own health metrics.
+
+    Send ``cursor`` (empty for the first page) to page by keyset instead of
+    skip; the response is then ``{"items": [...], "next_cursor": ...}``.
+
+    ``view=summary`` returns ``HealthMetricSummary`` rows (core composition
+    only), read as plain columns.
     """
+    summary = view == ListView.SUMMARY
+    if cursor is not None:
+        health_metrics, next_cursor = crud_health_metric.get_page_by_trainee(
+            db, trainee_id=current_user.id, cursor=cursor, limit=limit, summary=summary
+        )
+        if summary:
+            return summary_page_response(health_metrics, next_cursor)
+        return {"items": health_metrics, "next_cursor": next_cursor}
     health_metrics = crud_health_metric.get_by_trainee(
-        db, trainee_id=current_user.id, skip=skip, limit=limit
+        db, trainee_id=current_user.id, skip=skip, limit=limit, summary=summary
     )
+    if summary:
+        return summary_response(health_metrics)
     return health_metrics
 
 
@@ -47,17 +74,21 @@ def create_health_metric(
     return health_metric_obj
 
 
-@router.get("/", response_model=List[HealthMetric])
+@router.get("/", response_model=Union[List[HealthMetric], Page[HealthMetric]])
 def read_health_metrics(
     db: Session = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     current_user: Trainee = Depends(require_trainer),
 ) -> Any:
     """
     Get all health metrics. Requires trainer or admin role.
     Trainers can view all trainees' health metrics for monitoring.
     """
+    if cursor is not None:
+        health_metrics, next_cursor = crud_health_metric.get_page(db, cursor=cursor, limit=limit)
+        return {"items": health_metrics, "next_cursor": next_cursor}
     health_metrics = crud_health_metric.get_multi(db, skip=skip, limit=limit)
     return health_metrics
 
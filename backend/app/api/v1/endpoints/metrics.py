@@ -0,0 +1,21 @@
+from typing import Any
+
+from fastapi import APIRouter, Depends
+
+from app.auth.deps import require_admin
+from app.core.cache import cache_stats
+from app.models.user import User
+
+router = APIRouter()
+
+
+# Protected: requires admin role
+@router.get("/caches")
+def read_cache_metrics(
+    current_user: User = Depends(require_admin),
+) -> Any:
+    """
+    Hit/miss counters for the caches, as seen by the worker serving the request.
+    Requires admin role.
+    """
+    return cache_stats()
@@ -1,10 +1,12 @@
-from typing import Any, List
+from typing import Any, List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 
 from app.crud.crud_program_exercise import program_exercise as crud_program_exercise
+from app.crud.pagination import MAX_PAGE_SIZE
 from app.schemas.program_exercise import ProgramExercise, ProgramExerciseCreate, ProgramExerciseUpdate
+from app.schemas.pagination import Page
 from app.api.deps import get_db
 from app.auth.deps import get_current_user, require_trainer
 from app.models.trainee import Trainee
@@ -28,17 +30,21 @@ def create_program_exercise(
     return program_exercise_obj
 
 
-@router.get("/", response_model=List[ProgramExercise])
+@router.get("/", response_model=Union[List[ProgramExercise], Page[ProgramExercise]])
 def read_program_exercises(
     db: Session = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     current_user: Trainee = Depends(get_current_user),
 ) -> Any:
     """
     Get program exercises. Requires authentication.
     All authenticated users can view program templates.
     """
+    if cursor is not None:
+        program_exercises, next_cursor = crud_program_exercise.get_page(db, cursor=cursor, limit=limit)
+        return {"items": program_exercises, "next_cursor": next_cursor}
     program_exercises = crud_program_exercise.get_multi(db, skip=skip, limit=limit)
     return program_exercises
 
@@ -1,11 +1,14 @@
-from typing import Any, List
+from typing import Any, List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
 from sqlalchemy.orm import Session
 
 from app.crud.crud_program import program as crud_program
+from app.crud.pagination import MAX_PAGE_SIZE
 from app.schemas.program import Program, ProgramCreate, ProgramUpdate
+from app.schemas.pagination import Page
 from app.api.deps import get_db
+from app.core.etag import make_etag, not_modified
 from app.auth.deps import get_current_user, require_trainer
 from app.models.trainee import Trainee
 
@@ -77,14 +80,27 @@ def assign_program(
 
 
 # Protected: authenticated users can view programs
-@router.get("/", response_model=List[Program])
+@router.get("/", response_model=Union[List[Program], Page[Program]])
 def read_programs(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     current_user: Trainee = Depends(get_current_user),
 ) -> Any:
-    """Retrieve programs. Requires authentication."""
+    """Retrieve programs. Requires authentication.
+
+    Skip/limit responses carry an ETag; a matching If-None-Match gets an empty 304.
+    """
+    if cursor is not None:
+        programs, next_cursor = crud_program.get_page(db, cursor=cursor, limit=limit)
+        return {"items": programs, "next_cursor": next_cursor}
+    etag = make_etag(["programs", skip, limit, crud_program.get_versions(db, skip=skip, limit=limit)])
+    unchanged = not_modified(request, response, etag)
+    if unchanged is not None:
+        return unchanged
     programs = crud_program.get_multi(db, skip=skip, limit=limit)
     return programs
 
@@ -93,10 +109,21 @@ def read_programs(
 @router.get("/{program_id}", response_model=Program)
 def read_program(
     program_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: Trainee = Depends(get_current_user),
 ) -> Any:
-    """Get program by ID. Requires authentication."""
+    """Get program by ID. Requires authentication.
+
+    The response carries an ETag; a matching If-None-Match gets an empty 304.
+    """
+    version = crud_program.get_version(db, id=program_id)
+    if version is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Program not found")
+    unchanged = not_modified(request, response, make_etag(["program", version]))
+    if unchanged is not None:
+        return unchanged
     p = crud_program.get(db, id=program_id)
     if not p:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Program not found")
@@ -0,0 +1,37 @@
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from app.crud.crud_search import search as crud_search
+from app.schemas.search import SearchResults
+from app.api.deps import get_db
+from app.auth.deps import get_current_user
+from app.models.trainee import Trainee
+
+router = APIRouter()
+
+
+# Protected: requires authentication
+@router.get("/", response_model=SearchResults)
+def search(
+    db: Session = Depends(get_db),
+    q: str = Query(..., min_length=1, max_length=200, description="Words to find in names and descriptions"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of hits per type"),
+    current_user: Trainee = Depends(get_current_user),
+) -> Any:
+    """
+    Full-text search over exercises and programs. Requires authentication.
+
+    Every word of ``q`` must match the start of a word in the name or
+    description ("bench pre" finds "Bench Press"). Hits come back per type,
+    most relevant first, with matches wrapped in ``<mark>`` in the
+    highlighted name and description snippet. Databases other than SQLite
+    and PostgreSQL have no search index and get 501 Not Implemented.
+    """
+    if not crud_search.supports(db):
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Search is not available on this database"
+        )
+    return crud_search.search(db, q=q, limit=limit)
@@ -1,24 +1,30 @@
-from typing import Any, List
+from typing import Any, List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Query
 from sqlalchemy.orm import Session
 
 from app.crud.crud_trainee import trainee as crud_trainee
+from app.crud.pagination import MAX_PAGE_SIZE
 from app.crud.crud_program import program as crud_program
-from app.schemas.trainee import Trainee, TraineeCreate, TraineeUpdate
+from app.schemas.trainee import Trainee, TraineeCreate, TraineeSummary, TraineeUpdate
+from app.schemas.enums import ListView
+from app.schemas.pagination import Page
 from app.api.deps import get_db
+from app.auth.hashing import password_hasher
+from app.crud.async_crud import run_db
+from app.api.projections import summary_page_response, summary_response
 from app.auth.deps import get_current_user, require_trainer, require_admin
 from app.models.trainee import Trainee as TraineeModel
 from app.models.user import UserRole
-from app.core.rate_limit import limiter, RATE_LIMIT_STRICT
+from app.core.rate_limit import get_client_ip, limiter, RATE_LIMIT_STRICT
 
 router = APIRouter()  # Removed duplicate prefix
 
 
 # Public endpoint for user registration
 @router.post("/", response_model=Trainee)
-@limiter.limit(RATE_LIMIT_STRICT)
-def create_trainee(
+@limiter.limit(RATE_LIMIT_STRICT, key_func=get_client_ip)
+async def create_trainee(
     *,
     request: Request,
     db: Session = Depends(get_db),
@@ -30,25 +36,48 @@ def create_trainee(
     
     Rate limit: 3 requests per minute per IP address (strict to prevent spam).
     """
-    existing = crud_trainee.get_by_email(db, email=trainee_in.email)
+    existing = await run_db(db, crud_trainee.get_by_email, email=trainee_in.email)
     if existing:
         raise HTTPException(status_code=400, detail="Trainee with this email already exists")
-    t = crud_trainee.create(db, obj_in=trainee_in)
-    return t
+    hashed_password = await password_hasher.hash_async(trainee_in.password)
+
+    def _create(db: Session) -> Trainee:
+        # Serialize here so the response's lazy loads stay off the event loop
+        return Trainee.model_validate(
+            crud_trainee.create(db, obj_in=trainee_in, hashed_password=hashed_password), from_attributes=True
+        )
 
+    return await run_db(db, _create)
 
-@router.get("/", response_model=List[Trainee])
+
+@router.get(
+    "/",
+    response_model=Union[List[Trainee], Page[Trainee], List[TraineeSummary], Page[TraineeSummary]],
+)
 def read_trainees(
     db: Session = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    view: ListView = ListView.FULL,
     current_user: TraineeModel = Depends(require_trainer),
 ) -> Any:
     """
     Get list of trainees. Requires trainer or admin role.
     Trainers need to view their trainees.
+
+    ``view=summary`` returns ``TraineeSummary`` rows (names, email and ids,
+    without the nested gym, trainer and program), read as plain columns.
     """
-    trainees = crud_trainee.get_multi(db, skip=skip, limit=limit)
+    summary = view == ListView.SUMMARY
+    if cursor is not None:
+        trainees, next_cursor = crud_trainee.get_page(db, cursor=cursor, limit=limit, summary=summary)
+        if summary:
+            return summary_page_response(trainees, next_cursor)
+        return {"items": trainees, "next_cursor": next_cursor}
+    trainees = crud_trainee.get_multi(db, skip=skip, limit=limit, summary=summary)
+    if summary:
+        return summary_response(trainees)
     return trainees
 
 
@@ -1,11 +1,15 @@
-from typing import Any, List
+from typing import Any, List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Query
 from sqlalchemy.orm import Session
 
 from app.crud.crud_trainer import trainer as crud_trainer
+from app.crud.pagination import MAX_PAGE_SIZE
 from app.schemas.trainer import Trainer, TrainerCreate, TrainerUpdate
+from app.schemas.pagination import Page
 from app.api.deps import get_db
+from app.auth.hashing import password_hasher
+from app.crud.async_crud import run_db
 from app.auth.deps import get_current_user, require_admin
 from app.models.trainee import Trainee
 from app.core.rate_limit import limiter, RATE_LIMIT_WRITE
@@ -16,7 +20,7 @@ router = APIRouter()  # Removed duplicate prefix
 # Protected: requires admin role (only admins can create trainers)
 @router.post("/", response_model=Trainer)
 @limiter.limit(RATE_LIMIT_WRITE)
-def create_trainer(
+async def create_trainer(
     *,
     request: Request,
     db: Session = Depends(get_db),
@@ -28,21 +32,32 @@ def create_trainer(
     
     Rate limit: 10 requests per minute per IP address.
     """
-    existing = crud_trainer.get_by_email(db, email=trainer_in.email)
+    existing = await run_db(db, crud_trainer.get_by_email, email=trainer_in.email)
     if existing:
         raise HTTPException(status_code=400, detail="Trainer with this email already exists")
-    t = crud_trainer.create(db, obj_in=trainer_in)
-    return t
+    hashed_password = await password_hasher.hash_async(crud_trainer.DEFAULT_PASSWORD)
+
+    def _create(db: Session) -> Trainer:
+        # Serialize here so the response's lazy loads stay off the event loop
+        return Trainer.model_validate(
+            crud_trainer.create(db, obj_in=trainer_in, hashed_password=hashed_password), from_attributes=True
+        )
+
+    return await run_db(db, _create)
 
 
 # Public: anyone can list trainers (for trainee to see available trainers)
-@router.get("/", response_model=List[Trainer])
+@router.get("/", response_model=Union[List[Trainer], Page[Trainer]])
 def read_trainers(
     db: Session = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
 ) -> Any:
     """Retrieve trainers list. Public endpoint."""
+    if cursor is not None:
+        trainers, next_cursor = crud_trainer.get_page(db, cursor=cursor, limit=limit)
+        return {"items": trainers, "next_cursor": next_cursor}
     trainers = crud_trainer.get_multi(db, skip=skip, limit=limit)
     return trainers
 
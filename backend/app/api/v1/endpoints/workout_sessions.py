@@ -1,37 +1,65 @@
-from typing import Any, Generator
+from typing import Any, Generator, Optional, Union
 from datetime import date
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
 from sqlalchemy.orm import Session
 
 from app.crud.crud_workout_session import workout_session as crud_workout_session
-from app.schemas.workout_session import WorkoutSession, WorkoutSessionCreate, WorkoutSessionUpdate
-from app.schemas.exercise_log import ExerciseLog, ExerciseLogCreate
+from app.crud.pagination import MAX_PAGE_SIZE
+from app.schemas.workout_session import WorkoutSession, WorkoutSessionCreate, WorkoutSessionSummary, WorkoutSessionUpdate
+from app.schemas.exercise_log import ExerciseLog, ExerciseLogCreate, ExerciseLogBulkCreate
+from app.schemas.pagination import Page
+from app.crud.crud_exercise import exercise as crud_exercise
 from app.crud.crud_exercise_log import exercise_log as crud_exercise_log
 from app.api.deps import get_db
-from app.schemas.enums import WorkoutSessionStatus
+from app.api.projections import summary_page_response, summary_response
+from app.core.etag import make_etag, not_modified
+from app.schemas.enums import ListView, WorkoutSessionStatus
 from app.auth.deps import get_current_user
 from app.models.trainee import Trainee
 
 router = APIRouter()  # Removed duplicate prefix
 
 # Protected: requires authentication
-@router.get("/", response_model=list[WorkoutSession])
+@router.get(
+    "/",
+    response_model=Union[
+        list[WorkoutSession], Page[WorkoutSession], list[WorkoutSessionSummary], Page[WorkoutSessionSummary]
+    ],
+)
 def read_workout_sessions(
     *,
     db: Session = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    view: ListView = ListView.FULL,
     current_user: Trainee = Depends(get_current_user),
 ) -> Any:
     """
     Retrieve workout sessions for the current user.
     
     Returns sessions ordered by session_date descending (most recent first).
+
+    Send ``cursor`` (empty for the first page) to page by keyset instead of
+    skip; the response is then ``{"items": [...], "next_cursor": ...}``.
+
+    ``view=summary`` returns ``WorkoutSessionSummary`` rows (log count and
+    total volume instead of the logs themselves), read as plain columns.
     """
+    summary = view == ListView.SUMMARY
+    if cursor is not None:
+        sessions, next_cursor = crud_workout_session.get_page_by_trainee(
+            db, trainee_id=current_user.id, cursor=cursor, limit=limit, summary=summary
+        )
+        if summary:
+            return summary_page_response(sessions, next_cursor)
+        return {"items": sessions, "next_cursor": next_cursor}
     sessions = crud_workout_session.get_multi_by_trainee(
-        db, trainee_id=current_user.id, skip=skip, limit=limit
+        db, trainee_id=current_user.id, skip=skip, limit=limit, summary=summary
     )
+    if summary:
+        return summary_response(sessions)
     return sessions
 
 
@@ -174,6 +202,63 @@ def log_exercise_in_session(
     return exercise_log
 
 
+# Protected: requires authentication
+@router.post("/{session_id}/log-exercises", response_model=list[ExerciseLog])
+def log_exercises_in_session(
+    session_id: int,
+    *,
+    db: Session = Depends(get_db),
+    bulk_in: ExerciseLogBulkCreate,
+    current_user: Trainee = Depends(get_current_user),
+) -> Any:
+    """
+    Log many exercise sets in a workout session in one request (e.g. an offline
+    client syncing a whole session). All sets are inserted in one transaction:
+    either every set is logged or none is.
+
+    - **session_id**: ID of the workout session.
+    - **logs**: Sets to log, each shaped like a single log-exercise request.
+      ``volume_kg`` is computed server-side.
+
+    Example Request:
+    ```json
+    {
+        "logs": [
+            {"exercise_id": 1, "completed_sets": 3, "completed_reps": 10, "completed_weight_kg": 50},
+            {"exercise_id": 2, "completed_sets": 3, "completed_reps": 8, "completed_weight_kg": 70}
+        ]
+    }
+    ```
+
+    Returns the created logs in request order.
+    """
+    session = crud_workout_session.get(db, id=session_id)
+    if not session:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workout session not found")
+
+    # Authorization: users can only log exercises in their own sessions
+    from app.models.user import UserRole
+    if current_user.role == UserRole.TRAINEE and session.trainee_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Cannot log exercises in other users' workout sessions"
+        )
+
+    if session.status != WorkoutSessionStatus.IN_PROGRESS:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Workout session is not in-progress")
+
+    # Reject the whole batch if any exercise is unknown, checked in one query
+    requested_ids = {log.exercise_id for log in bulk_in.logs}
+    missing_ids = requested_ids - crud_exercise.get_existing_ids(db, requested_ids)
+    if missing_ids:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Unknown exercise ids: {sorted(missing_ids)}"
+        )
+
+    return crud_exercise_log.create_multi(db, session_id=session_id, objs_in=bulk_in.logs)
+
+
 # Protected: requires authentication
 @router.put("/{session_id}/end", response_model=WorkoutSession)
 def end_workout_session(
@@ -263,46 +348,22 @@ def auto_complete_session(
             detail="Cannot auto-complete a session without a linked program"
         )
 
-    # Fetch program exercises
-    from app.models.program_exercise import ProgramExercise
-    program_exercises = db.query(ProgramExercise).filter(ProgramExercise.program_id == session.program_id).all()
-    
-    if not program_exercises:
+    # Prescriptions are copied into exercise logs and the session completed
+    # in one transaction, with a single INSERT ... SELECT
+    completed = crud_workout_session.auto_complete(db, db_obj=session)
+    if completed is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Linked program has no exercises to log"
         )
-
-    # Log each exercise
-    from app.schemas.exercise_log import ExerciseLogCreate
-    for p_ex in program_exercises:
-        # Calculate volume if possible
-        sets = p_ex.prescribed_sets or 0
-        reps = p_ex.prescribed_reps or 0
-        weight = p_ex.prescribed_weight_kg or 0.0
-        volume = sets * reps * weight
-        
-        log_in = ExerciseLogCreate(
-            session_id=session_id,
-            exercise_id=p_ex.exercise_id,
-            completed_sets=sets,
-            completed_reps=reps,
-            completed_weight_kg=weight,
-            completed_duration_minutes=p_ex.prescribed_duration_minutes,
-            volume_kg=volume,
-            is_completed=True
-        )
-        crud_exercise_log.create(db, obj_in=log_in)
-
-    # Mark session as completed
-    session_update = WorkoutSessionUpdate(status=WorkoutSessionStatus.COMPLETED)
-    session = crud_workout_session.update(db, db_obj=session, obj_in=session_update)
-    return session
+    return completed
 
 
 @router.get("/{session_id}", response_model=WorkoutSession)
 def read_workout_session(
     session_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: Trainee = Depends(get_current_user),
 ) -> Any:
@@ -335,17 +396,24 @@ def read_workout_session(
         ]
     }
     ```
+
+    The response carries an ETag covering the session, its logs and their
+    exercises; a matching If-None-Match gets an empty 304.
     """
-    session = crud_workout_session.get(db, id=session_id)
-    if not session:
+    # Session, log and exercise versions in one narrow query, before loading anything
+    versions = crud_workout_session.get_versions(db, id=session_id)
+    if not versions:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workout session not found")
     
     # Authorization: users can only view their own sessions unless they're trainer/admin
     from app.models.user import UserRole
-    if current_user.role == UserRole.TRAINEE and session.trainee_id != current_user.id:
+    if current_user.role == UserRole.TRAINEE and versions[0][0] != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Cannot view other users' workout sessions"
         )
-    
-    return session
\ No newline at end of file
+
+    unchanged = not_modified(request, response, make_etag(["workout_session", session_id, versions]))
+    if unchanged is not None:
+        return unchanged
+    return crud_workout_session.get(db, id=session_id)
\ No newline at end of file
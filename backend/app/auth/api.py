@@ -1,5 +1,5 @@
 from datetime import timedelta
-from typing import Any
+from typing import Any, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, Cookie, status
 from fastapi.security import OAuth2PasswordRequestForm
@@ -7,11 +7,14 @@ from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
 from app.core.config import settings
-from app.core.rate_limit import limiter, RATE_LIMIT_AUTH
+from app.core.rate_limit import get_client_ip, limiter, RATE_LIMIT_AUTH
 from app.auth import schemas
 from app.auth import crud as auth_crud
 from app.auth import token as auth_token
+from app.auth import refresh_store
 from app.auth.deps import get_current_user
+from app.auth.hashing import password_hasher
+from app.crud.async_crud import run_db
 from app.models.user import User as UserModel
 from app.schemas.trainee import Trainee as TraineeSchema
 
@@ -19,8 +22,10 @@ router = APIRouter(prefix="/auth")
 
 
 @router.post("/login/access-token", response_model=schemas.TokenPair)
-@limiter.limit(RATE_LIMIT_AUTH)
-def login_access_token(
+# Keyed by IP even when a bearer token is attached, which would otherwise
+# give every stolen or minted token its own password-guessing budget
+@limiter.limit(RATE_LIMIT_AUTH, key_func=get_client_ip)
+async def login_access_token(
     response: Response,
     request: Request,
     db: Session = Depends(get_db),
@@ -30,20 +35,28 @@ def login_access_token(
     OAuth2 compatible token login, get an access token for future requests.
     
     Rate limit: 5 requests per minute per IP address.
+
+    Password verification runs in the password-hashing process pool, so a
+    burst of logins does not stall other requests on this worker.
     """
-    user = auth_crud.get_user_by_email(db, email=form_data.username)
-    if not user or not auth_token.verify_password(
+    user = await run_db(db, auth_crud.get_user_by_email, email=form_data.username)
+    if not user or not await password_hasher.verify_async(
         form_data.password, user.hashed_password
     ):
         raise HTTPException(
             status_code=401, detail="Incorrect email or password"
         )
 
+    def _start_family(db: Session) -> tuple[str, str]:
+        issued = refresh_store.issue(db, user_id=user.id, token_version=user.token_version)
+        db.commit()
+        return issued
+
+    refresh_token, family_id = await run_db(db, _start_family)
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = auth_token.create_access_token(
-        user.id, expires_delta=access_token_expires
+        user.id, expires_delta=access_token_expires, token_version=user.token_version, family_id=family_id
     )
-    refresh_token = auth_token.create_refresh_token(user.id, settings.REFRESH_TOKEN_EXPIRE_DAYS)
     
     response.set_cookie(
         key="refresh_token",
@@ -75,28 +88,47 @@ def read_users_me(current_user: UserModel = Depends(get_current_user)) -> Any:
 def refresh_tokens(
     response: Response,
     payload: schemas.RefreshRequest,
+    db: Session = Depends(get_db),
     refresh_token: str = Cookie(None),
 ) -> Any:
-    """Issue new access and refresh tokens using a valid refresh token."""
-    from jose import jwt, JWTError
+    """
+    Issue new access and refresh tokens using a valid refresh token.
+
+    The presented token is consumed. Presenting it again revokes every
+    token of its family (see app.auth.refresh_store).
+    """
+    from jose import JWTError
 
     token_to_use = payload.refresh_token or refresh_token
     if not token_to_use:
         raise HTTPException(status_code=400, detail="Refresh token missing")
 
     try:
-        decoded = jwt.decode(token_to_use, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        # Refresh tokens are presented once per rotation; caching them would only evict access tokens
+        decoded = auth_token.decode_token(token_to_use, use_cache=False)
         if decoded.get("type") != "refresh":
             raise HTTPException(status_code=400, detail="Invalid token type")
         user_id = decoded.get("sub")
         if not user_id:
             raise HTTPException(status_code=400, detail="Invalid refresh token")
+        token_version = decoded.get("ver", 0)
     except JWTError:
         raise HTTPException(status_code=401, detail="Invalid or expired refresh token")
 
+    # Tokens issued before rotation was recorded have no jti and cannot be tracked
+    jti = decoded.get("jti")
+    family_id = refresh_store.rotate(db, jti=jti, user_id=int(user_id)) if jti else None
+    if family_id is None:
+        raise HTTPException(status_code=401, detail="Invalid or expired refresh token")
+    new_refresh, _ = refresh_store.issue(
+        db, user_id=int(user_id), token_version=token_version, family_id=family_id
+    )
+    db.commit()
+
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    new_access = auth_token.create_access_token(user_id, expires_delta=access_token_expires)
-    new_refresh = auth_token.create_refresh_token(user_id, settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    new_access = auth_token.create_access_token(
+        user_id, expires_delta=access_token_expires, token_version=token_version, family_id=family_id
+    )
     
     response.set_cookie(
         key="refresh_token",
@@ -108,3 +140,30 @@ def refresh_tokens(
     )
     
     return {"access_token": new_access, "refresh_token": new_refresh, "token_type": "bearer"}
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+def logout(
+    payload: Optional[schemas.RefreshRequest] = None,
+    db: Session = Depends(get_db),
+    refresh_token: str = Cookie(None),
+) -> Response:
+    """Revoke the refresh-token family of this session, including its access tokens."""
+    from jose import JWTError
+
+    token_to_use = (payload and payload.refresh_token) or refresh_token
+    response = Response(status_code=status.HTTP_204_NO_CONTENT)
+    response.delete_cookie(key="refresh_token", httponly=True, secure=True, samesite="lax")
+    if not token_to_use:
+        return response
+    try:
+        decoded = auth_token.decode_token(token_to_use, use_cache=False)
+    except JWTError:
+        # Expired or invalid: nothing left to revoke
+        return response
+    if decoded.get("type") == "refresh" and decoded.get("jti") and decoded.get("sub"):
+        family_id = refresh_store.family_of(db, jti=decoded["jti"], user_id=int(decoded["sub"]))
+        if family_id is not None:
+            refresh_store.revoke_family(db, family_id)
+            db.commit()
+    return response
@@ -0,0 +1,133 @@
+"""
+Per-process cache of authenticated principals.
+
+A ``Principal`` is a snapshot of what authorization needs about a user:
+role, active flag, token version and profile ids. ``get_current_principal``
+serves it from memory keyed by user id, and only counts as a hit when the
+token's version matches the cached one, so a cached authentication issues
+no SQL at all.
+
+Entries are dropped whenever a User, Trainee or Trainer row is flushed as
+updated/inserted/deleted and again after that transaction commits. Other
+worker processes converge within ``PRINCIPAL_CACHE_TTL_SECONDS``.
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, make_transient_to_detached, object_session
+
+from app.core.cache import TTLCache, register_cache
+from app.core.config import settings
+from app.models.trainee import Trainee
+from app.models.trainer import Trainer
+from app.models.user import User, UserRole
+
+_PENDING_INVALIDATIONS = "principal_cache_invalidations"
+
+
+@dataclass(frozen=True)
+class Principal:
+    user_id: int
+    email: str
+    role: UserRole
+    is_active: bool
+    token_version: int
+    trainee_id: Optional[int] = None
+    trainer_id: Optional[int] = None
+
+    def attach(self, db: Session) -> User:
+        """Return a persistent User for this principal without emitting a SELECT.
+
+        Columns not held by the principal (e.g. hashed_password) and
+        relationships load lazily on first access.
+        """
+        user = User(
+            id=self.user_id,
+            email=self.email,
+            role=self.role,
+            is_active=self.is_active,
+            token_version=self.token_version,
+        )
+        make_transient_to_detached(user)
+        return db.merge(user, load=False)
+
+
+principal_cache = register_cache(
+    "principal",
+    TTLCache(maxsize=settings.PRINCIPAL_CACHE_MAX_SIZE, ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS),
+)
+
+
+def get_cached_principal(user_id: int, token_version: int) -> Optional[Principal]:
+    principal = principal_cache.get(user_id)
+    if principal is None or principal.token_version != token_version:
+        return None
+    return principal
+
+
+def cache_principal(principal: Principal) -> None:
+    principal_cache.set(principal.user_id, principal)
+
+
+def invalidate_principal(user_id: Optional[int]) -> None:
+    if user_id is not None:
+        principal_cache.pop(user_id)
+
+
+def load_principal(db: Session, *, user_id: int) -> Optional[Principal]:
+    """Load the user and both profile ids in one query."""
+    row = (
+        db.query(User, Trainee.id, Trainer.id)
+        .outerjoin(Trainee, Trainee.user_id == User.id)
+        .outerjoin(Trainer, Trainer.user_id == User.id)
+        .filter(User.id == user_id)
+        .first()
+    )
+    if row is None:
+        return None
+    user, trainee_id, trainer_id = row
+    return Principal(
+        user_id=user.id,
+        email=user.email,
+        role=user.role,
+        is_active=bool(user.is_active) if user.is_active is not None else True,
+        token_version=user.token_version or 0,
+        trainee_id=trainee_id,
+        trainer_id=trainer_id,
+    )
+
+
+def _schedule_invalidation(target, user_id: Optional[int]) -> None:
+    invalidate_principal(user_id)
+    session = object_session(target)
+    if session is not None and user_id is not None:
+        session.info.setdefault(_PENDING_INVALIDATIONS, set()).add(user_id)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _user_changed(mapper, connection, target) -> None:
+    _schedule_invalidation(target, target.id)
+
+
+@event.listens_for(Trainee, "after_insert")
+@event.listens_for(Trainee, "after_update")
+@event.listens_for(Trainee, "after_delete")
+@event.listens_for(Trainer, "after_insert")
+@event.listens_for(Trainer, "after_update")
+@event.listens_for(Trainer, "after_delete")
+def _profile_changed(mapper, connection, target) -> None:
+    _schedule_invalidation(target, target.user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    # A request may have re-cached the old state between flush and commit
+    for user_id in session.info.pop(_PENDING_INVALIDATIONS, ()):
+        invalidate_principal(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_INVALIDATIONS, None)
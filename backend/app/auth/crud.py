@@ -1,21 +1,22 @@
 from sqlalchemy.orm import Session
 from typing import Optional
 
-from app.auth.token import get_password_hash
+from app.auth.hashing import password_hasher
 from app.models.user import User, UserRole
 from app.schemas.trainee import TraineeCreate # We might need a UserCreate schema later
 
 def get_user_by_email(db: Session, *, email: str) -> Optional[User]:
     return db.query(User).filter(User.email == email).first()
 
-def create_user(db: Session, *, obj_in: TraineeCreate) -> User:
+def create_user(db: Session, *, obj_in: TraineeCreate, hashed_password: Optional[str] = None) -> User:
+    """Pass ``hashed_password`` when it was already computed (e.g. with ``hash_async``)."""
     # This is a temporary adapter to keep the sign-up working for Trainees
     # In the future, we should have separate create_user logic or a unified one
     
     # 1. Create User
     db_user = User(
         email=obj_in.email,
-        hashed_password=get_password_hash(obj_in.password),
+        hashed_password=hashed_password or password_hasher.hash(obj_in.password),
         role=UserRole.TRAINEE
     )
     db.add(db_user)
@@ -2,13 +2,16 @@ from typing import Any
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import jwt, JWTError
+from jose import JWTError
 from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db
-from app.core.config import settings
+from app.api.deps import DBSession, get_db, get_db_session
+from app.auth.cache import Principal, cache_principal, get_cached_principal, load_principal
+from app.auth.refresh_store import revoked_families
 from app.auth.schemas import TokenPayload
+from app.auth.token import decode_token
+from app.crud.async_crud import run_db
 from app.models.user import User, UserRole
 
 # Explicit token URL path based on API inclusion
@@ -17,23 +20,60 @@ reusable_oauth2 = OAuth2PasswordBearer(
 )
 
 
-def get_current_user(
-    db: Session = Depends(get_db), token: str = Depends(reusable_oauth2)
-) -> User:
+async def get_current_principal(
+    db: DBSession = Depends(get_db_session), token: str = Depends(reusable_oauth2)
+) -> Principal:
+    """Resolve the bearer token to a principal; both the decoded token and the principal are cached per process."""
     try:
-        payload: dict[str, Any] = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
+        payload: dict[str, Any] = decode_token(token)
         token_data = TokenPayload(**payload)
     except (JWTError, ValidationError):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Could not validate credentials",
         )
-    user = db.query(User).filter(User.id == token_data.sub).first()
-    if not user:
+    # In-memory check; see app.auth.refresh_store
+    if token_data.fam is not None and token_data.fam in revoked_families:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Could not validate credentials",
+        )
+    principal = get_cached_principal(token_data.sub, token_data.ver)
+    if principal is not None:
+        return principal
+
+    principal = await run_db(db, load_principal, user_id=token_data.sub)
+    if not principal:
         raise HTTPException(status_code=404, detail="User not found")
-    return user
+    if principal.token_version != token_data.ver:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Could not validate credentials",
+        )
+    cache_principal(principal)
+    return principal
+
+
+def get_current_user(
+    db: Session = Depends(get_db), principal: Principal = Depends(get_current_principal)
+) -> User:
+    return principal.attach(db)
+
+
+def _check_trainer(role: UserRole) -> None:
+    if role not in [UserRole.TRAINER, UserRole.ADMIN]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Insufficient permissions. Trainer role required.",
+        )
+
+
+def _check_admin(role: UserRole) -> None:
+    if role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Insufficient permissions. Admin role required.",
+        )
 
 
 def require_trainer(
@@ -43,11 +83,7 @@ def require_trainer(
     Dependency to require trainer role or higher (trainer or admin).
     Raises 403 Forbidden if user is not a trainer or admin.
     """
-    if current_user.role not in [UserRole.TRAINER, UserRole.ADMIN]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Insufficient permissions. Trainer role required.",
-        )
+    _check_trainer(current_user.role)
     return current_user
 
 
@@ -58,9 +94,16 @@ def require_admin(
     Dependency to require admin role.
     Raises 403 Forbidden if user is not an admin.
     """
-    if current_user.role != UserRole.ADMIN:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Insufficient permissions. Admin role required.",
-        )
+    _check_admin(current_user.role)
     return current_user
+
+
+def require_trainer_principal(
+    principal: Principal = Depends(get_current_principal),
+) -> Principal:
+    """
+    Same check as require_trainer, returning the principal instead of a
+    session-bound User. Used by async endpoints.
+    """
+    _check_trainer(principal.role)
+    return principal
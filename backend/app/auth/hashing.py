@@ -0,0 +1,98 @@
+"""
+Password hashing off the request workers.
+
+pbkdf2 is deliberately CPU-bound: run on a request thread it holds the GIL
+for the whole derivation, and a burst of logins starves every other request
+served by that worker process. ``password_hasher`` sends hashing and
+verification to a dedicated process pool of ``PASSWORD_HASH_WORKERS``
+processes instead, so the web worker only waits on a future.
+
+``PASSWORD_HASH_WORKERS=0`` keeps the work in-process (on the threadpool for
+the async methods), which is what tests and one-off scripts want.
+"""
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, TypeVar
+
+from starlette.concurrency import run_in_threadpool
+
+from app.auth import token as auth_token
+from app.core.config import settings
+
+T = TypeVar("T")
+
+
+class PasswordHasher:
+    """Lazily started process pool; the size is read from settings on first use unless given."""
+
+    def __init__(self, workers: Optional[int] = None) -> None:
+        self._workers = workers
+        self._pool: Optional[Executor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def workers(self) -> int:
+        return settings.PASSWORD_HASH_WORKERS if self._workers is None else self._workers
+
+    def hash(self, password: str) -> str:
+        """Blocking variant for sync code paths; the CPU work still runs in the pool."""
+        return self._call(auth_token.get_password_hash, password)
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return self._call(auth_token.verify_password, plain_password, hashed_password)
+
+    async def hash_async(self, password: str) -> str:
+        return await self._call_async(auth_token.get_password_hash, password)
+
+    async def verify_async(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._call_async(auth_token.verify_password, plain_password, hashed_password)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _call(self, fn: Callable[..., T], *args: Any) -> T:
+        pool = self._get_pool()
+        if pool is None:
+            return fn(*args)
+        try:
+            return pool.submit(fn, *args).result()
+        except BrokenProcessPool:
+            self._discard(pool)
+            raise
+
+    async def _call_async(self, fn: Callable[..., T], *args: Any) -> T:
+        pool = self._get_pool()
+        if pool is None:
+            return await run_in_threadpool(fn, *args)
+        try:
+            return await asyncio.get_running_loop().run_in_executor(pool, fn, *args)
+        except BrokenProcessPool:
+            self._discard(pool)
+            raise
+
+    def _discard(self, pool: Executor) -> None:
+        # A killed worker breaks the whole pool; start a fresh one on the next call
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+
+    def _get_pool(self) -> Optional[Executor]:
+        if self.workers <= 0:
+            return None
+        with self._lock:
+            if self._pool is None:
+                # spawn, not fork: forking a process that already runs threads
+                # (the server's threadpool, DB pools) can copy held locks
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._pool
+
+
+password_hasher = PasswordHasher()
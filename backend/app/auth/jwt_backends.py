@@ -0,0 +1,123 @@
+"""
+Interchangeable JWT verification backends, selected by ``JWT_BACKEND``.
+
+- ``jose``: python-jose, the default and the library tokens are issued with.
+- ``pyjwt``: PyJWT with the key prepared once. Requires the optional
+  ``PyJWT`` package.
+- ``hmac``: a stdlib-only HS256/384/512 verifier that keeps a keyed HMAC
+  object and copies it per token, so the key is never re-padded.
+
+Every backend returns the claims dict and raises ``jose.JWTError``
+(``ExpiredSignatureError`` for an expired ``exp``) on any invalid token, so
+callers only handle one exception type whichever backend is configured.
+"""
+import base64
+import binascii
+import calendar
+import hashlib
+import hmac
+import json
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Protocol
+
+from jose import jwt as jose_jwt
+from jose.exceptions import ExpiredSignatureError, JWTClaimsError, JWTError
+
+HMAC_DIGESTS = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+
+
+class JWTBackend(Protocol):
+    def decode(self, token: str) -> dict[str, Any]:
+        ...
+
+
+class JoseBackend:
+    def __init__(self, secret: str, algorithm: str) -> None:
+        self._secret = secret
+        self._algorithms = [algorithm]
+
+    def decode(self, token: str) -> dict[str, Any]:
+        return jose_jwt.decode(token, self._secret, algorithms=self._algorithms)
+
+
+class PyJWTBackend:
+    def __init__(self, secret: str, algorithm: str) -> None:
+        try:
+            import jwt
+        except ImportError as exc:
+            raise RuntimeError("JWT_BACKEND=pyjwt requires the 'PyJWT' package") from exc
+        self._jwt = jwt
+        self._key = jwt.get_algorithm_by_name(algorithm).prepare_key(secret)
+        self._algorithms = [algorithm]
+
+    def decode(self, token: str) -> dict[str, Any]:
+        try:
+            return self._jwt.decode(token, self._key, algorithms=self._algorithms)
+        except self._jwt.ExpiredSignatureError as exc:
+            raise ExpiredSignatureError(str(exc)) from exc
+        except self._jwt.InvalidTokenError as exc:
+            raise JWTError(str(exc)) from exc
+
+
+def _b64decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+class HMACBackend:
+    """Verifies compact HS* tokens with ``hmac``; checks ``exp`` and ``nbf`` like python-jose."""
+
+    def __init__(self, secret: str, algorithm: str) -> None:
+        if algorithm not in HMAC_DIGESTS:
+            raise ValueError(f"JWT_BACKEND=hmac only supports {', '.join(HMAC_DIGESTS)}, not {algorithm}")
+        self._algorithm = algorithm
+        self._mac = hmac.new(secret.encode(), digestmod=HMAC_DIGESTS[algorithm])
+
+    def decode(self, token: str) -> dict[str, Any]:
+        try:
+            signing_input, _, signature = token.rpartition(".")
+            header_segment, _, payload_segment = signing_input.partition(".")
+            if not header_segment or not payload_segment or "." in payload_segment:
+                raise ValueError("Not enough segments")
+            header = json.loads(_b64decode(header_segment))
+            expected = _b64decode(signature)
+            mac = self._mac.copy()
+            mac.update(signing_input.encode("ascii"))
+        except (ValueError, TypeError, binascii.Error, UnicodeError) as exc:
+            raise JWTError("Invalid token") from exc
+        if not isinstance(header, dict) or header.get("alg") != self._algorithm:
+            raise JWTError("The specified alg value is not allowed")
+        if not hmac.compare_digest(mac.digest(), expected):
+            raise JWTError("Signature verification failed.")
+        try:
+            claims = json.loads(_b64decode(payload_segment))
+        except (ValueError, binascii.Error) as exc:
+            raise JWTError("Invalid payload string") from exc
+        if not isinstance(claims, dict):
+            raise JWTError("Invalid payload string: must be a json object")
+        self._validate_times(claims)
+        return claims
+
+    @staticmethod
+    def _validate_times(claims: dict[str, Any]) -> None:
+        now = calendar.timegm(datetime.utcnow().utctimetuple())
+        for claim in ("exp", "nbf"):
+            value = claims.get(claim, 0)
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise JWTClaimsError(f"{claim} claim must be a number.")
+        if "nbf" in claims and claims["nbf"] > now:
+            raise JWTClaimsError("The token is not yet valid (nbf)")
+        if "exp" in claims and claims["exp"] < now:
+            raise ExpiredSignatureError("Signature has expired.")
+
+
+BACKENDS: dict[str, type] = {"jose": JoseBackend, "pyjwt": PyJWTBackend, "hmac": HMACBackend}
+
+
+@lru_cache(maxsize=8)
+def get_backend(name: str, secret: str, algorithm: str) -> JWTBackend:
+    try:
+        backend = BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown JWT_BACKEND: {name!r}") from None
+    return backend(secret, algorithm)
@@ -0,0 +1,186 @@
+"""
+Refresh-token rotation with reuse detection.
+
+Each login starts a token family. ``/auth/refresh`` marks the presented
+refresh token as used and issues its successor in the same family. A token
+that is presented again after it was rotated, or after its family was
+revoked, means that someone else holds a copy, so the whole family is
+revoked. Revocation is recorded in ``refresh_tokens`` and is therefore
+shared by every worker.
+
+Access tokens carry the family id (``fam``), and ``get_current_principal``
+rejects revoked families by checking ``revoked_families``. That is an
+in-process dict lookup, so authenticating a request never queries this
+table. A family only needs to stay in memory for one access-token lifetime
+after its revocation. Revocations made by this process are added
+immediately. Those made by other workers are picked up by
+``run_sync_loop`` every ``REVOKED_FAMILIES_SYNC_SECONDS``, which also
+deletes expired rows.
+"""
+import asyncio
+import logging
+import secrets
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Optional
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.auth import token as auth_token
+from app.core.cache import register_cache
+from app.core.config import settings
+from app.models.refresh_token import RefreshToken
+
+logger = logging.getLogger(__name__)
+
+
+class RevokedFamilies:
+    """Family ids revoked within the last access-token lifetime, with O(1) membership checks."""
+
+    def __init__(self) -> None:
+        # family id -> time.time() after which its access tokens have all expired
+        self._families: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.synced_at: Optional[float] = None
+
+    @staticmethod
+    def _window() -> float:
+        return settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60.0
+
+    def add(self, family_id: str, revoked_at: Optional[float] = None) -> None:
+        until = (time.time() if revoked_at is None else revoked_at) + self._window()
+        with self._lock:
+            self._families[family_id] = max(until, self._families.get(family_id, 0.0))
+
+    def __contains__(self, family_id: object) -> bool:
+        until = self._families.get(family_id)  # type: ignore[arg-type]
+        return until is not None and until > time.time()
+
+    def replace(self, revoked: dict[str, float]) -> None:
+        """Swap in the families loaded from the database, keeping newer local revocations."""
+        now = time.time()
+        with self._lock:
+            merged = {family: until for family, until in self._families.items() if until > now}
+            for family_id, revoked_at in revoked.items():
+                merged[family_id] = max(revoked_at + self._window(), merged.get(family_id, 0.0))
+            self._families = merged
+            self.synced_at = now
+
+    def clear(self) -> None:
+        with self._lock:
+            self._families.clear()
+            self.synced_at = None
+
+    def stats(self) -> dict[str, Any]:
+        return {"size": len(self._families), "synced_at": self.synced_at}
+
+
+revoked_families = register_cache("revoked_token_families", RevokedFamilies())
+
+
+def _utcnow() -> datetime:
+    return datetime.utcnow().replace(microsecond=0)
+
+
+def _timestamp(value: datetime) -> float:
+    return (value - datetime(1970, 1, 1)).total_seconds()
+
+
+def issue(db: Session, *, user_id: int, token_version: int, family_id: Optional[str] = None) -> tuple[str, str]:
+    """Record a new refresh token (starting a family unless ``family_id`` is given).
+
+    Returns ``(refresh_token, family_id)``. The caller commits.
+    """
+    family_id = family_id or secrets.token_hex(16)
+    jti = secrets.token_hex(16)
+    expires_at = _utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    db.add(RefreshToken(jti=jti, family_id=family_id, user_id=user_id, expires_at=expires_at))
+    token = auth_token.create_refresh_token(
+        user_id, token_version=token_version, jti=jti, family_id=family_id, expire=expires_at
+    )
+    return token, family_id
+
+
+def rotate(db: Session, *, jti: str, user_id: int) -> Optional[str]:
+    """Consume refresh token ``jti`` and return its family id, or None if it may not be used.
+
+    The consuming UPDATE is conditional, so of two concurrent refreshes with
+    the same token only one succeeds. A token that was already used or
+    revoked revokes its family (committed here) before None is returned.
+    """
+    now = _utcnow()
+    consumed = db.execute(
+        update(RefreshToken)
+        .where(
+            RefreshToken.jti == jti,
+            RefreshToken.user_id == user_id,
+            RefreshToken.used_at.is_(None),
+            RefreshToken.revoked_at.is_(None),
+            RefreshToken.expires_at >= now,
+        )
+        .values(used_at=now)
+        .returning(RefreshToken.family_id)
+    ).scalar_one_or_none()
+    if consumed is not None:
+        return consumed
+
+    row = db.execute(
+        select(RefreshToken.family_id, RefreshToken.used_at, RefreshToken.revoked_at)
+        .where(RefreshToken.jti == jti, RefreshToken.user_id == user_id)
+    ).first()
+    if row is not None and (row.used_at is not None or row.revoked_at is not None):
+        logger.warning("Refresh token reuse detected; revoking family %s of user %s", row.family_id, user_id)
+        revoke_family(db, row.family_id)
+        db.commit()
+    return None
+
+
+def revoke_family(db: Session, family_id: str) -> None:
+    """Revoke every token of ``family_id``; effective in this process immediately. The caller commits."""
+    now = _utcnow()
+    db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=now)
+    )
+    revoked_families.add(family_id, _timestamp(now))
+
+
+def family_of(db: Session, *, jti: str, user_id: int) -> Optional[str]:
+    return db.execute(
+        select(RefreshToken.family_id).where(RefreshToken.jti == jti, RefreshToken.user_id == user_id)
+    ).scalar_one_or_none()
+
+
+def sync(db: Session) -> None:
+    """Reload recently revoked families and delete expired tokens."""
+    now = _utcnow()
+    since = now - timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    rows = db.execute(
+        select(RefreshToken.family_id, RefreshToken.revoked_at).where(RefreshToken.revoked_at >= since)
+    ).all()
+    db.execute(delete(RefreshToken).where(RefreshToken.expires_at < now))
+    db.commit()
+    revoked: dict[str, float] = {}
+    for family_id, revoked_at in rows:
+        revoked[family_id] = max(_timestamp(revoked_at), revoked.get(family_id, 0.0))
+    revoked_families.replace(revoked)
+
+
+async def run_sync_loop(session_factory: Callable[[], Session]) -> None:
+    """Call ``sync`` every ``REVOKED_FAMILIES_SYNC_SECONDS`` until cancelled."""
+    def sync_once() -> None:
+        db = session_factory()
+        try:
+            sync(db)
+        except SQLAlchemyError:
+            logger.warning("Could not sync revoked refresh-token families", exc_info=True)
+        finally:
+            db.close()
+
+    while True:
+        await asyncio.to_thread(sync_once)
+        await asyncio.sleep(settings.REVOKED_FAMILIES_SYNC_SECONDS)
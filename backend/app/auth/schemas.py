@@ -10,6 +10,8 @@ class Token(BaseModel):
 class TokenPayload(BaseModel):
     sub: Optional[int] = None
     type: Optional[str] = None  # 'access' or 'refresh'
+    ver: int = 0  # User.token_version at issue time
+    fam: Optional[str] = None  # Refresh-token family the token was issued in
 
 
 class RefreshRequest(BaseModel):
@@ -1,9 +1,12 @@
+import time
 from datetime import datetime, timedelta
 from typing import Any, Union
 
 from jose import jwt
 from passlib.context import CryptContext
 
+from app.auth.jwt_backends import get_backend
+from app.core.cache import TTLCache, register_cache
 from app.core.config import settings
 
 # Use pbkdf2_sha256 to avoid bcrypt backend issues in this environment
@@ -11,9 +14,19 @@ pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
 
 ALGORITHM = settings.ALGORITHM
 
+# Raw token string -> verified claims. Tokens are immutable, so an entry can
+# only go stale through expiry, which bounds its lifetime.
+token_cache = register_cache(
+    "jwt_decode",
+    TTLCache(maxsize=settings.JWT_DECODE_CACHE_MAX_SIZE, ttl=settings.JWT_DECODE_CACHE_TTL_SECONDS),
+)
+
 
 def create_access_token(
-    subject: Union[str, Any], expires_delta: timedelta | None = None
+    subject: Union[str, Any],
+    expires_delta: timedelta | None = None,
+    token_version: int = 0,
+    family_id: str | None = None,
 ) -> str:
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
@@ -21,7 +34,9 @@ def create_access_token(
         expire = datetime.utcnow() + timedelta(
             minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
         )
-    to_encode = {"exp": expire, "sub": str(subject), "type": "access"}
+    to_encode = {"exp": expire, "sub": str(subject), "type": "access", "ver": token_version}
+    if family_id is not None:
+        to_encode["fam"] = family_id
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
@@ -35,9 +50,38 @@ def get_password_hash(password: str) -> str:
 
 
 def create_refresh_token(
-    subject: Union[str, Any], expires_days: int | None = None
+    subject: Union[str, Any],
+    expires_days: int | None = None,
+    token_version: int = 0,
+    jti: str | None = None,
+    family_id: str | None = None,
+    expire: datetime | None = None,
 ) -> str:
-    expire = datetime.utcnow() + timedelta(days=expires_days or settings.REFRESH_TOKEN_EXPIRE_DAYS)
-    to_encode = {"exp": expire, "sub": str(subject), "type": "refresh"}
+    expire = expire or datetime.utcnow() + timedelta(days=expires_days or settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    to_encode = {"exp": expire, "sub": str(subject), "type": "refresh", "ver": token_version}
+    if jti is not None:
+        to_encode["jti"] = jti
+    if family_id is not None:
+        to_encode["fam"] = family_id
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
+
+
+def decode_token(token: str, *, use_cache: bool = True) -> dict[str, Any]:
+    """Verify ``token`` with the configured ``JWT_BACKEND`` and return its claims.
+
+    Verified claims are cached until the token's ``exp`` (or the cache TTL,
+    whichever is sooner). Invalid tokens are never cached and raise
+    ``jose.JWTError``. Callers must not mutate the returned dict.
+    """
+    if use_cache:
+        claims = token_cache.get(token)
+        if claims is not None:
+            return claims
+    claims = get_backend(settings.JWT_BACKEND, settings.SECRET_KEY, settings.ALGORITHM).decode(token)
+    if use_cache:
+        exp = claims.get("exp")
+        ttl = settings.JWT_DECODE_CACHE_TTL_SECONDS if exp is None else min(exp - time.time(), settings.JWT_DECODE_CACHE_TTL_SECONDS)
+        if ttl > 0:
+            token_cache.set(token, claims, ttl=ttl)
+    return claims
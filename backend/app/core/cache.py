@@ -0,0 +1,196 @@
+"""
+Caching primitives.
+
+Provides a small thread-safe LRU cache with per-entry expiry, a Redis-backed
+cache with the same interface, and a registry so every cache's hit/miss
+counters can be reported from one metrics endpoint. ``TTLCache`` is per
+worker process; anything that must be consistent across workers has to
+tolerate the TTL as a staleness bound. Caches built with ``create_cache``
+use the configured ``CACHE_BACKEND``.
+"""
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire ``ttl`` seconds after insertion."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store ``value``; ``ttl`` overrides the cache default for this entry."""
+        if self.maxsize <= 0:
+            return
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return entry[1] if entry is not None else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+class RedisCache:
+    """``TTLCache``-compatible cache stored on a Redis (or protocol-compatible) server.
+
+    Entries are shared by every worker using the same server. Keys and values
+    are stored as JSON under ``prefix``, so only JSON-serialisable values can
+    be cached. Requires the optional ``redis`` package. While the server is
+    unreachable, ``get`` misses and ``set`` is dropped, so callers fall back
+    to uncached work instead of failing.
+    """
+
+    def __init__(self, url: str, *, prefix: str, ttl: float = 60.0, client: Any = None) -> None:
+        try:
+            import redis
+        except ImportError as exc:
+            if client is None:
+                raise RuntimeError("CACHE_BACKEND=redis requires the 'redis' package") from exc
+            redis = None
+        if client is None:
+            client = redis.Redis.from_url(url)
+        self._client = client
+        # Builtin ConnectionError/TimeoutError are OSErrors; redis-py has its own
+        self._errors: tuple[type[Exception], ...] = (OSError,) if redis is None else (
+            OSError, redis.exceptions.ConnectionError, redis.exceptions.TimeoutError
+        )
+        self.prefix = prefix
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, key: Hashable) -> str:
+        return f"{self.prefix}:{json.dumps(key, default=str, separators=(',', ':'))}"
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        try:
+            raw = self._client.get(self._key(key))
+        except self._errors:
+            logger.warning("Redis cache %s unavailable; treating get as a miss", self.prefix, exc_info=True)
+            raw = None
+        with self._lock:
+            if raw is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return default if raw is None else json.loads(raw)
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store ``value``; ``ttl`` overrides the cache default for this entry."""
+        expires_ms = max(1, int((self.ttl if ttl is None else ttl) * 1000))
+        try:
+            self._client.set(self._key(key), json.dumps(value, separators=(",", ":")), px=expires_ms)
+        except self._errors:
+            logger.warning("Redis cache %s unavailable; dropping set", self.prefix, exc_info=True)
+
+    def pop(self, key: Hashable) -> Any:
+        pipe = self._client.pipeline()
+        pipe.get(self._key(key))
+        pipe.delete(self._key(key))
+        raw, _ = pipe.execute()
+        return None if raw is None else json.loads(raw)
+
+    def clear(self) -> None:
+        keys = list(self._client.scan_iter(match=f"{self.prefix}:*"))
+        if keys:
+            self._client.delete(*keys)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._client.scan_iter(match=f"{self.prefix}:*"))
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "backend": "redis",
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+_registry: dict[str, Any] = {}
+
+
+def register_cache(name: str, cache: Any) -> Any:
+    """Expose ``cache.stats()`` under ``name`` in :func:`cache_stats`."""
+    _registry[name] = cache
+    return cache
+
+
+def cache_stats() -> dict[str, dict[str, Any]]:
+    return {name: cache.stats() for name, cache in sorted(_registry.items())}
+
+
+def create_cache(name: str, *, maxsize: int, ttl: float) -> Any:
+    """Build a cache on the configured ``CACHE_BACKEND`` and register it under ``name``.
+
+    ``maxsize`` only bounds the in-process backend; Redis evicts by its own
+    ``maxmemory`` policy.
+    """
+    if settings.CACHE_BACKEND == "redis":
+        cache = RedisCache(settings.CACHE_REDIS_URL, prefix=name, ttl=ttl)
+    elif settings.CACHE_BACKEND == "memory":
+        cache = TTLCache(maxsize=maxsize, ttl=ttl)
+    else:
+        raise ValueError(f"Unknown CACHE_BACKEND: {settings.CACHE_BACKEND!r}")
+    return register_cache(name, cache)
@@ -1,6 +1,6 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field, model_validator
-from typing import Any
+from typing import Any, Optional
 
 
 import os
@@ -13,6 +13,21 @@ class Settings(BaseSettings):
         description="Database connection string"
     )
     API_V1_STR: str = "/api/v1"
+
+    # Serve the async endpoints from an AsyncSession (aiosqlite/asyncpg) instead of
+    # running sync sessions in the threadpool
+    DB_ASYNC_ENABLED: bool = False
+
+    # Connection pool (server databases such as Postgres; per worker process)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_TIMEOUT_SECONDS: int = 30
+
+    # SQLite connection pragmas (WAL and synchronous=NORMAL are always applied to file databases)
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_MMAP_SIZE: int = 268435456  # 256 MiB
+    SQLITE_CACHE_SIZE: int = -65536  # negative = KiB, i.e. 64 MiB per connection
     
     # JWT settings
     SECRET_KEY: str = Field(
@@ -24,6 +39,46 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7  # 7 days default
 
+    # Token verification: "jose", "pyjwt" (optional PyJWT package) or "hmac" (stdlib, HS* only)
+    JWT_BACKEND: str = "jose"
+    # Decoded access-token claims, per worker process; entries never outlive the token's exp. 0 disables it
+    JWT_DECODE_CACHE_TTL_SECONDS: int = 300
+    JWT_DECODE_CACHE_MAX_SIZE: int = 10000
+
+    # How often each worker reloads refresh-token families revoked by other workers; 0 disables the loop
+    REVOKED_FAMILIES_SYNC_SECONDS: int = 30
+
+    # Processes that run pbkdf2 hashing/verification off the request workers; 0 = in-process
+    PASSWORD_HASH_WORKERS: int = 2
+
+    # Authenticated-principal cache (per worker process); 0 disables it
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10000
+
+    # Directory owned by this deployment for runtime files shared by its workers
+    # (created with mode 0700), and a name that keeps deployments sharing it apart
+    RUNTIME_DIR: str = "./run"
+    DEPLOYMENT_NAME: str = "fitness-tracker"
+
+    # Rate-limit counters: unset = a SQLite file in RUNTIME_DIR shared by this host's
+    # workers; "redis://host:6379" shares them across hosts
+    RATE_LIMIT_STORAGE_URI: Optional[str] = None
+
+    # Backend for shared caches: "memory" (per worker process) or "redis"
+    CACHE_BACKEND: str = "memory"
+    CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+
+    # Analytics response cache; entries are also dropped when the trainee's data changes.
+    # Unset = only with CACHE_BACKEND=redis: in-process invalidation does not reach other
+    # workers, so set it true only for a single worker process
+    ANALYTICS_CACHE_ENABLED: Optional[bool] = None
+    ANALYTICS_CACHE_TTL_SECONDS: int = 300
+    ANALYTICS_CACHE_MAX_SIZE: int = 10000
+
+    # In-memory exercise catalog behind /exercises/search; reloaded after local writes
+    EXERCISE_CATALOG_TTL_SECONDS: int = 300
+    EXERCISE_CATALOG_PRELOAD: bool = True
+
     # Admin Setup
     FIRST_SUPERUSER: str = "admin@example.com"
     FIRST_SUPERUSER_PASSWORD: str = "admin"
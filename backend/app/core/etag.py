@@ -0,0 +1,39 @@
+"""
+Strong ETags and conditional GET handling.
+
+Read endpoints derive an ETag from something cheaper than the response
+itself (row versions, a cached body) and answer a matching If-None-Match
+with an empty 304 before loading or serializing anything.
+"""
+import hashlib
+import json
+from typing import Any, Optional
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+# Clients must revalidate every time, which is a cheap 304 when nothing changed
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(value: Any) -> str:
+    """Strong ETag for any JSON-serialisable ``value`` (tuples count as lists)."""
+    rendered = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str).encode()
+    return f'"{hashlib.blake2b(rendered, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against ``etag`` (RFC 9110)."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def not_modified(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """Tag ``response`` with ``etag``; return a 304 to send instead if the client has it."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+    return None
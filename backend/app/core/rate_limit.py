@@ -5,12 +5,26 @@ This module provides rate limiting for API endpoints to prevent abuse:
 - Authentication endpoints (login, register)
 - Sensitive operations (create, update, delete)
 - High-frequency endpoints
+
+Limits are token buckets (see token_bucket) keyed per authenticated user,
+so members sharing a gym's NAT address do not throttle each other;
+anonymous requests are keyed per client IP. Login and sign-up
+(RATE_LIMIT_AUTH, RATE_LIMIT_STRICT) always key by client IP: pass
+``key_func=get_client_ip`` with those limits.
 """
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 from fastapi import Request
+from jose import JWTError
+from limits import parse
 import os
 
+from app.auth.token import decode_token
+from app.core.config import settings
+# Register the sqlite:// storage scheme and the token-bucket strategy
+from app.core import rate_limit_storage  # noqa: F401
+from app.core.token_bucket import bucket_limit
+
 
 def get_client_ip(request: Request) -> str:
     """
@@ -32,17 +46,73 @@ def get_client_ip(request: Request) -> str:
     return get_remote_address(request)
 
 
-# Rate limiter instance
-# Storage: in-memory (for production, use Redis)
+def get_rate_limit_key(request: Request) -> str:
+    """
+    Key requests by authenticated user, falling back to client IP.
+
+    A valid bearer access token yields "user:<id>"; anything else (no
+    token, invalid or expired token, refresh token) yields "ip:<address>".
+    The token is verified, so a forged one cannot pick someone else's
+    bucket, and decoded tokens are cached, so this adds no work to the
+    authentication that follows.
+    """
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and token:
+        try:
+            claims = decode_token(token)
+        except JWTError:
+            claims = {}
+        if claims.get("type") == "access" and claims.get("sub"):
+            return f"user:{claims['sub']}"
+    return f"ip:{get_client_ip(request)}"
+
+
+KEY_FUNCS = {"user": get_rate_limit_key, "ip": get_client_ip}
+
+
+def default_storage_uri() -> str:
+    """
+    SQLite counters shared by this deployment's workers on this host.
+
+    The file lives in the app-owned RUNTIME_DIR rather than a world-writable
+    temp directory, and is named after DEPLOYMENT_NAME so deployments that
+    share the directory keep separate counters. The storage creates the
+    directory when it first connects.
+    """
+    path = os.path.abspath(os.path.join(settings.RUNTIME_DIR, f"{settings.DEPLOYMENT_NAME}-rate-limits.db"))
+    return "sqlite:///" + path
+
+
+# Counters shared by all worker processes on this host (see rate_limit_storage)
+STORAGE_URI = settings.RATE_LIMIT_STORAGE_URI or default_storage_uri()
+
+# Rate limiter instance. Token buckets need the sqlite:// storage; other
+# storages (e.g. Redis) fall back to fixed windows of the same bucket limits
 limiter = Limiter(
-    key_func=get_client_ip,
+    key_func=KEY_FUNCS[os.getenv("RATE_LIMIT_KEY", "user")],
     default_limits=["1000 per hour"],  # Global default limit
-    storage_uri=os.getenv("RATE_LIMIT_STORAGE_URI", "memory://"),
-    # For production with Redis: "redis://localhost:6379"
+    storage_uri=STORAGE_URI,
+    strategy=os.getenv(
+        "RATE_LIMIT_STRATEGY", "token-bucket" if STORAGE_URI.startswith("sqlite://") else "fixed-window"
+    ),
 )
 
-# Common rate limit strings (can be overridden via environment variables)
-RATE_LIMIT_AUTH = os.getenv("RATE_LIMIT_AUTH", "5 per minute")  # Login, register
-RATE_LIMIT_WRITE = os.getenv("RATE_LIMIT_WRITE", "10 per minute")  # Create, update, delete
-RATE_LIMIT_READ = os.getenv("RATE_LIMIT_READ", "100 per minute")  # Read operations
-RATE_LIMIT_STRICT = os.getenv("RATE_LIMIT_STRICT", "3 per minute")  # Extra strict for sensitive ops
+
+def _group_limit(group: str, rate: str, burst_factor: int) -> str:
+    """
+    Token-bucket limit for a route group.
+
+    RATE_LIMIT_<GROUP> sets the sustained rate. RATE_LIMIT_<GROUP>_BURST
+    sets how many requests may arrive at once, and defaults to
+    ``burst_factor`` times the rate's amount.
+    """
+    rate = os.getenv(f"RATE_LIMIT_{group}", rate)
+    burst = os.getenv(f"RATE_LIMIT_{group}_BURST")
+    return bucket_limit(rate, int(burst) if burst else parse(rate).amount * burst_factor)
+
+
+# Common rate limits per route group (can be overridden via environment variables)
+RATE_LIMIT_AUTH = _group_limit("AUTH", "5 per minute", 1)  # Login, register; keyed by IP
+RATE_LIMIT_WRITE = _group_limit("WRITE", "10 per minute", 3)  # Create, update, delete
+RATE_LIMIT_READ = _group_limit("READ", "100 per minute", 3)  # Read operations
+RATE_LIMIT_STRICT = _group_limit("STRICT", "3 per minute", 1)  # Extra strict for sensitive ops; keyed by IP
@@ -0,0 +1,205 @@
+"""
+Host-local rate-limit storage shared by every worker process.
+
+slowapi's ``memory://`` storage keeps counters per process, so with N
+gunicorn workers a client gets N times the configured limit. ``SQLiteStorage``
+keeps the counters in one SQLite file instead. Every worker on the host
+opens the same file, and each hit is a single atomic upsert (WAL mode,
+``synchronous=OFF``: counters are disposable, so they are never fsynced).
+
+Importing this module registers the ``sqlite://`` scheme with ``limits``, so
+``RATE_LIMIT_STORAGE_URI=sqlite:////var/run/app/rate-limits.db`` selects it.
+The path rules match SQLAlchemy URLs (three slashes for a relative path, four
+for an absolute one). Any other ``limits`` URI, e.g. ``redis://host:6379``,
+still works for limits shared across hosts.
+
+Supports the fixed-window and moving-window strategies, plus the
+token-bucket strategy in ``app.core.token_bucket``.
+"""
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+
+from limits.errors import ConfigurationError
+from limits.storage import MovingWindowSupport, Storage
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS rate_limit_counters "
+    "(key TEXT PRIMARY KEY, value INTEGER NOT NULL, expires_at REAL NOT NULL) WITHOUT ROWID",
+    "CREATE TABLE IF NOT EXISTS rate_limit_events (key TEXT NOT NULL, at REAL NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS ix_rate_limit_events_key_at ON rate_limit_events (key, at)",
+    "CREATE TABLE IF NOT EXISTS rate_limit_buckets "
+    "(key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL, allowed INTEGER NOT NULL) WITHOUT ROWID",
+)
+
+# Restart a window whose expiry has passed, otherwise add to it
+_INCR = (
+    "INSERT INTO rate_limit_counters (key, value, expires_at) VALUES (:key, :amount, :expires_at) "
+    "ON CONFLICT (key) DO UPDATE SET "
+    "value = CASE WHEN expires_at <= :now THEN excluded.value ELSE value + excluded.value END, "
+    "expires_at = CASE WHEN expires_at <= :now THEN excluded.expires_at ELSE expires_at END "
+    "RETURNING value"
+)
+
+# Refill the bucket for the time since its last update, then take :amount
+# tokens if that many are available. SET expressions all see the old row,
+# so the refill is computed once per column from the same state. ``allowed``
+# is stored only so that RETURNING can report the decision.
+_REFILLED = "min(:capacity, tokens + max(0, :now - updated_at) * :rate)"
+_TAKE_TOKENS = (
+    "INSERT INTO rate_limit_buckets (key, tokens, updated_at, allowed) "
+    "VALUES (:key, :capacity - :amount, :now, 1) "
+    "ON CONFLICT (key) DO UPDATE SET "
+    f"tokens = {_REFILLED} - CASE WHEN {_REFILLED} >= :amount THEN :amount ELSE 0 END, "
+    f"allowed = {_REFILLED} >= :amount, "
+    "updated_at = :now "
+    "RETURNING allowed, tokens"
+)
+
+# Seconds between sweeps of expired rows, per process
+PURGE_INTERVAL = 60.0
+
+
+class SQLiteStorage(Storage, MovingWindowSupport):
+    STORAGE_SCHEME = ["sqlite"]
+
+    def __init__(self, uri: str, wrap_exceptions: bool = False, timeout: float = 5.0, **options: Any) -> None:
+        path = uri.split("://", 1)[1][1:]
+        if not path or path == ":memory:":
+            raise ConfigurationError("sqlite:// rate-limit storage needs a file path shared by the workers")
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        self._purged_at = 0.0
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+
+    @property
+    def base_exceptions(self) -> type[Exception]:
+        return sqlite3.Error
+
+    def _connection(self) -> sqlite3.Connection:
+        # One connection per thread, reopened in forked children
+        conn: Optional[sqlite3.Connection] = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            # Only this app's user needs the directory; a no-op if it exists
+            os.makedirs(os.path.dirname(self.path) or ".", mode=0o700, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            self._enable_wal(conn)
+            conn.execute("PRAGMA synchronous=OFF")
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def _enable_wal(self, conn: sqlite3.Connection) -> None:
+        # Switching the file to WAL fails with "database is locked" without
+        # waiting on the busy timeout while another worker opens it, so retry
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                return
+            except sqlite3.OperationalError:
+                if time.monotonic() >= deadline:
+                    raise
+                time.sleep(0.01)
+
+    def _maybe_purge(self, conn: sqlite3.Connection, now: float) -> None:
+        if now - self._purged_at < PURGE_INTERVAL:
+            return
+        self._purged_at = now
+        conn.execute("DELETE FROM rate_limit_counters WHERE expires_at <= ?", (now,))
+        # Moving-window entries outlive any realistic window, and idle buckets
+        # have refilled, after a day
+        conn.execute("DELETE FROM rate_limit_events WHERE at < ?", (now - 86400,))
+        conn.execute("DELETE FROM rate_limit_buckets WHERE updated_at < ?", (now - 86400,))
+
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        now = time.time()
+        conn = self._connection()
+        self._maybe_purge(conn, now)
+        row = conn.execute(_INCR, {"key": key, "amount": amount, "expires_at": now + expiry, "now": now}).fetchone()
+        return row[0]
+
+    def get(self, key: str) -> int:
+        row = self._connection().execute(
+            "SELECT value FROM rate_limit_counters WHERE key = ? AND expires_at > ?", (key, time.time())
+        ).fetchone()
+        return row[0] if row else 0
+
+    def get_expiry(self, key: str) -> float:
+        now = time.time()
+        row = self._connection().execute(
+            "SELECT expires_at FROM rate_limit_counters WHERE key = ? AND expires_at > ?", (key, now)
+        ).fetchone()
+        return row[0] if row else now
+
+    def check(self) -> bool:
+        try:
+            self._connection().execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def reset(self) -> int:
+        conn = self._connection()
+        count = conn.execute("DELETE FROM rate_limit_counters").rowcount
+        count += conn.execute("DELETE FROM rate_limit_events").rowcount
+        count += conn.execute("DELETE FROM rate_limit_buckets").rowcount
+        return count
+
+    def clear(self, key: str) -> None:
+        conn = self._connection()
+        conn.execute("DELETE FROM rate_limit_counters WHERE key = ?", (key,))
+        conn.execute("DELETE FROM rate_limit_events WHERE key = ?", (key,))
+        conn.execute("DELETE FROM rate_limit_buckets WHERE key = ?", (key,))
+
+    def acquire_entry(self, key: str, limit: int, expiry: int, amount: int = 1) -> bool:
+        if amount > limit:
+            return False
+        conn = self._connection()
+        now = time.time()
+        # IMMEDIATE takes the write lock up front, so count-then-insert is atomic across processes
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM rate_limit_events WHERE key = ? AND at < ?", (key, now - expiry))
+            (count,) = conn.execute("SELECT count(*) FROM rate_limit_events WHERE key = ?", (key,)).fetchone()
+            acquired = count + amount <= limit
+            if acquired:
+                conn.executemany("INSERT INTO rate_limit_events (key, at) VALUES (?, ?)", [(key, now)] * amount)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return acquired
+
+    def get_moving_window(self, key: str, limit: int, expiry: int) -> tuple[float, int]:
+        now = time.time()
+        oldest, count = self._connection().execute(
+            "SELECT min(at), count(*) FROM rate_limit_events WHERE key = ? AND at >= ?", (key, now - expiry)
+        ).fetchone()
+        return (oldest if count else now), count
+
+    def take_tokens(self, key: str, capacity: int, rate: float, amount: int = 1) -> tuple[bool, float]:
+        """Take ``amount`` tokens from the bucket refilled at ``rate`` per second.
+
+        Returns whether they were taken and the tokens left.
+        """
+        if amount > capacity:
+            return False, float(capacity)
+        now = time.time()
+        conn = self._connection()
+        self._maybe_purge(conn, now)
+        allowed, tokens = conn.execute(
+            _TAKE_TOKENS, {"key": key, "capacity": capacity, "rate": rate, "amount": amount, "now": now}
+        ).fetchone()
+        return bool(allowed), tokens
+
+    def get_tokens(self, key: str, capacity: int, rate: float) -> float:
+        row = self._connection().execute(
+            f"SELECT {_REFILLED} FROM rate_limit_buckets WHERE key = :key",
+            {"key": key, "capacity": capacity, "rate": rate, "now": time.time()},
+        ).fetchone()
+        return float(capacity) if row is None else row[0]
@@ -0,0 +1,60 @@
+"""
+Token-bucket rate limiting strategy for slowapi/limits.
+
+A limit item "B per T seconds" is read as a bucket of capacity ``B``
+refilled continuously at ``B / T`` tokens per second. A client can burst
+``B`` requests at once and sustain ``B / T`` per second afterwards, instead
+of being cut off at a window boundary. ``bucket_limit`` builds such an item
+from a sustained rate and a burst size.
+
+Importing this module registers the strategy as ``"token-bucket"``. It needs
+a storage with ``take_tokens``/``get_tokens``, i.e. ``sqlite://`` (see
+``app.core.rate_limit_storage``).
+"""
+import math
+import time
+
+from limits import RateLimitItem, parse
+from limits.strategies import STRATEGIES, RateLimiter
+from limits.util import WindowStats
+
+
+def bucket_limit(rate: str, burst: int) -> str:
+    """Limit string for a bucket of ``burst`` tokens refilled at ``rate`` (e.g. "100 per minute")."""
+    item = parse(rate)
+    burst = max(burst, 1)
+    seconds = max(1, round(item.get_expiry() * burst / item.amount))
+    return f"{burst} per {seconds} second"
+
+
+def _bucket(item: RateLimitItem) -> tuple[int, float]:
+    return item.amount, item.amount / item.get_expiry()
+
+
+class TokenBucketRateLimiter(RateLimiter):
+    def __init__(self, storage) -> None:
+        if not hasattr(storage, "take_tokens"):
+            raise NotImplementedError(
+                f"Token bucket rate limiting is not implemented for storage of type {storage.__class__}"
+            )
+        super().__init__(storage)
+
+    def hit(self, item: RateLimitItem, *identifiers: str, cost: int = 1) -> bool:
+        capacity, rate = _bucket(item)
+        allowed, _ = self.storage.take_tokens(item.key_for(*identifiers), capacity, rate, cost)
+        return allowed
+
+    def test(self, item: RateLimitItem, *identifiers: str, cost: int = 1) -> bool:
+        capacity, rate = _bucket(item)
+        return self.storage.get_tokens(item.key_for(*identifiers), capacity, rate) >= cost
+
+    def get_window_stats(self, item: RateLimitItem, *identifiers: str) -> WindowStats:
+        """Remaining whole tokens; the reset time is when the next token arrives if empty, else when full."""
+        capacity, rate = _bucket(item)
+        tokens = self.storage.get_tokens(item.key_for(*identifiers), capacity, rate)
+        remaining = math.floor(tokens)
+        missing = (1 - tokens) if remaining < 1 else (capacity - tokens)
+        return WindowStats(time.time() + missing / rate, remaining)
+
+
+STRATEGIES.setdefault("token-bucket", TokenBucketRateLimiter)
@@ -0,0 +1,141 @@
+"""
+Response cache for the trainee analytics endpoints.
+
+Entries are keyed by endpoint, trainee id, the trainee's data version,
+request parameters and today's date (the endpoints report windows relative
+to today). The version is an opaque token per trainee that is replaced
+whenever one of the trainee's workout sessions, exercise logs or health
+metrics is written, both at flush and again after commit. A write therefore
+orphans all of the trainee's cached responses at once; they age out through
+the TTL.
+
+Each entry stores the response body with its ETag so conditional requests
+can be answered without touching the database.
+
+Versions live in the configured cache backend, so they are only seen by
+every worker with ``CACHE_BACKEND=redis``. With the in-process backend a
+write would not invalidate other workers' entries, so responses are then
+only cached if ``ANALYTICS_CACHE_ENABLED`` says so (see ``response_cache_enabled``).
+"""
+import uuid
+from datetime import date
+from typing import Any, Optional
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session, object_session
+from sqlalchemy.orm.util import identity_key
+
+from app.core.cache import create_cache
+from app.core.config import settings
+from app.core.etag import make_etag
+from app.models.exercise_log import ExerciseLog
+from app.models.health_metric import HealthMetric
+from app.models.workout_session import WorkoutSession
+
+_PENDING_BUMPS = "analytics_cache_bumps"
+
+analytics_cache = create_cache(
+    "analytics",
+    maxsize=settings.ANALYTICS_CACHE_MAX_SIZE,
+    ttl=settings.ANALYTICS_CACHE_TTL_SECONDS,
+)
+# Outlives the responses so an idle trainee keeps hitting the same entries
+trainee_versions = create_cache(
+    "analytics_versions",
+    maxsize=settings.ANALYTICS_CACHE_MAX_SIZE,
+    ttl=settings.ANALYTICS_CACHE_TTL_SECONDS * 2,
+)
+
+
+def response_cache_enabled() -> bool:
+    """Whether responses are cached; by default only on a backend shared by the workers."""
+    if settings.ANALYTICS_CACHE_ENABLED is not None:
+        return settings.ANALYTICS_CACHE_ENABLED
+    return settings.CACHE_BACKEND != "memory"
+
+
+def trainee_version(trainee_id: int) -> str:
+    version = trainee_versions.get(trainee_id)
+    if version is None:
+        version = uuid.uuid4().hex
+        trainee_versions.set(trainee_id, version)
+    return version
+
+
+def bump_trainee_version(trainee_id: Optional[int]) -> None:
+    if trainee_id is not None:
+        trainee_versions.set(trainee_id, uuid.uuid4().hex)
+
+
+def cache_key(endpoint: str, trainee_id: int, version: str, params: dict[str, Any]) -> tuple:
+    return (endpoint, trainee_id, version, date.today().isoformat(), tuple(sorted(params.items())))
+
+
+def make_entry(body: Any) -> dict[str, Any]:
+    """Wrap ``body`` with a strong ETag derived from its JSON rendering."""
+    return {"etag": make_etag(body), "body": body}
+
+
+def mark_trainee_changed(db: Session, trainee_id: Optional[int]) -> None:
+    """Invalidate now and again once ``db`` commits.
+
+    Bulk statements (``insert(...).returning``) bypass mapper events, so
+    their callers report the affected trainee here.
+    """
+    bump_trainee_version(trainee_id)
+    if trainee_id is not None:
+        db.info.setdefault(_PENDING_BUMPS, set()).add(trainee_id)
+
+
+def _session_trainee_id(connection, target: ExerciseLog, session_id: Optional[int]) -> Optional[int]:
+    if session_id is None:
+        return None
+    session = object_session(target)
+    workout = session.identity_map.get(identity_key(WorkoutSession, session_id)) if session is not None else None
+    if workout is not None:
+        return workout.trainee_id
+    return connection.execute(
+        select(WorkoutSession.trainee_id).where(WorkoutSession.id == session_id)
+    ).scalar()
+
+
+def _changed(target, trainee_ids) -> None:
+    session = object_session(target)
+    for trainee_id in trainee_ids:
+        if session is None:
+            bump_trainee_version(trainee_id)
+        else:
+            mark_trainee_changed(session, trainee_id)
+
+
+@event.listens_for(WorkoutSession, "after_insert")
+@event.listens_for(WorkoutSession, "after_update")
+@event.listens_for(WorkoutSession, "after_delete")
+@event.listens_for(HealthMetric, "after_insert")
+@event.listens_for(HealthMetric, "after_update")
+@event.listens_for(HealthMetric, "after_delete")
+def _owned_row_changed(mapper, connection, target) -> None:
+    # Include the previous owner if the row was reassigned
+    history = inspect(target).attrs.trainee_id.history
+    _changed(target, {target.trainee_id, *history.deleted})
+
+
+@event.listens_for(ExerciseLog, "after_insert")
+@event.listens_for(ExerciseLog, "after_update")
+@event.listens_for(ExerciseLog, "after_delete")
+def _log_changed(mapper, connection, target) -> None:
+    history = inspect(target).attrs.session_id.history
+    session_ids = {target.session_id, *history.deleted}
+    _changed(target, {_session_trainee_id(connection, target, session_id) for session_id in session_ids})
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_after_commit(session: Session) -> None:
+    # A request may have cached the pre-commit state under the new version
+    for trainee_id in session.info.pop(_PENDING_BUMPS, ()):
+        bump_trainee_version(trainee_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_BUMPS, None)
@@ -0,0 +1,51 @@
+"""Async variants of the CRUD singletons.
+
+The CRUD classes are written against a synchronous ``Session``. Rather than
+maintaining a second copy of every query, ``AsyncCRUD`` exposes the same
+methods as coroutines:
+
+* with an ``AsyncSession`` the sync implementation runs through
+  ``AsyncSession.run_sync`` on the event loop's async driver;
+* with a plain ``Session`` (DB_ASYNC_ENABLED=false) it runs in the threadpool,
+  exactly as a ``def`` endpoint would.
+
+Return values must be fully loaded before they leave the call: lazy loads on
+an AsyncSession-owned object fail outside ``run_sync``.
+"""
+from typing import Any, Callable, TypeVar, Union
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+T = TypeVar("T")
+
+
+async def run_db(
+    db: Union[Session, AsyncSession], fn: Callable[..., T], *args: Any, **kwargs: Any
+) -> T:
+    """Call ``fn(session, *args, **kwargs)`` without blocking the event loop."""
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn, *args, **kwargs)
+    return await run_in_threadpool(fn, db, *args, **kwargs)
+
+
+class AsyncCRUD:
+    """Expose every method of a sync CRUD object as a coroutine taking either session type."""
+
+    def __init__(self, crud: Any) -> None:
+        self.crud = crud
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.crud, name)
+        if not callable(attr):
+            return attr
+
+        async def method(db: Union[Session, AsyncSession], *args: Any, **kwargs: Any) -> Any:
+            return await run_db(db, attr, *args, **kwargs)
+
+        method.__name__ = name
+        method.__doc__ = attr.__doc__
+        # Cache the wrapper so subsequent lookups skip __getattr__
+        setattr(self, name, method)
+        return method
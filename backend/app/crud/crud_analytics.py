@@ -0,0 +1,222 @@
+"""Read-only aggregate queries backing the trainee analytics endpoints.
+
+Log-derived figures (counts, volume, weights) are read from the
+``trainee_daily_stats`` rollup rather than from raw exercise logs. Personal
+records are read from the ``personal_records`` table, maintained the same way.
+"""
+from datetime import date, timedelta
+from typing import Any, Optional
+
+from sqlalchemy import case, desc, func
+from sqlalchemy.orm import Session
+
+from app.models.exercise import Exercise
+from app.models.personal_record import PersonalRecord
+from app.models.trainee_daily_stat import TraineeDailyStat
+from app.models.workout_session import WorkoutSession
+from app.schemas.enums import PersonalRecordMetric
+from app.crud.async_crud import AsyncCRUD
+
+# Distinct session dates fetched per round trip while walking a streak.
+# A month covers the common case in one query.
+STREAK_SCAN_BATCH = 31
+
+
+class CRUDAnalytics:
+    def get_exercise_frequency(self, db: Session, *, trainee_id: int, days: int, today: Optional[date] = None) -> dict[str, Any]:
+        today = today or date.today()
+        cutoff_date = today - timedelta(days=days)
+        weekly_cutoff = today - timedelta(days=7)
+
+        rows = (
+            db.query(
+                TraineeDailyStat.session_date,
+                func.sum(TraineeDailyStat.log_count).label("count"),
+            )
+            .filter(TraineeDailyStat.trainee_id == trainee_id)
+            .filter(TraineeDailyStat.session_date >= cutoff_date)
+            .group_by(TraineeDailyStat.session_date)
+            .order_by(TraineeDailyStat.session_date)
+            .all()
+        )
+
+        return {
+            "daily": [{"date": row.session_date.isoformat(), "count": row.count} for row in rows],
+            "weekly_total": sum(row.count for row in rows if row.session_date >= weekly_cutoff),
+            "monthly_total": sum(row.count for row in rows),
+        }
+
+    def get_top_exercises(self, db: Session, *, trainee_id: int, days: int, limit: int, today: Optional[date] = None) -> list[dict[str, Any]]:
+        cutoff_date = (today or date.today()) - timedelta(days=days)
+
+        results = (
+            db.query(
+                Exercise.id,
+                Exercise.name,
+                func.sum(TraineeDailyStat.log_count).label("count"),
+                func.sum(TraineeDailyStat.total_volume_kg).label("total_volume"),
+                func.sum(TraineeDailyStat.weight_sum_kg).label("weight_sum"),
+                func.sum(TraineeDailyStat.weighted_log_count).label("weighted_count"),
+            )
+            .join(TraineeDailyStat, Exercise.id == TraineeDailyStat.exercise_id)
+            .filter(TraineeDailyStat.trainee_id == trainee_id)
+            .filter(TraineeDailyStat.session_date >= cutoff_date)
+            .group_by(Exercise.id, Exercise.name)
+            .order_by(desc("count"))
+            .limit(limit)
+            .all()
+        )
+
+        return [
+            {
+                "exercise_id": row.id,
+                "exercise_name": row.name,
+                "count": row.count,
+                "total_volume_kg": float(row.total_volume or 0),
+                "avg_weight_kg": float(row.weight_sum / row.weighted_count) if row.weighted_count else 0.0,
+            }
+            for row in results
+        ]
+
+    def get_volume_trend(self, db: Session, *, trainee_id: int, days: int, today: Optional[date] = None) -> list[dict[str, Any]]:
+        cutoff_date = (today or date.today()) - timedelta(days=days)
+
+        results = (
+            db.query(
+                TraineeDailyStat.session_date,
+                func.sum(TraineeDailyStat.total_volume_kg).label("daily_volume"),
+            )
+            .filter(TraineeDailyStat.trainee_id == trainee_id)
+            .filter(TraineeDailyStat.session_date >= cutoff_date)
+            .group_by(TraineeDailyStat.session_date)
+            .order_by(TraineeDailyStat.session_date)
+            .all()
+        )
+
+        return [
+            {"date": row.session_date.isoformat(), "volume_kg": float(row.daily_volume or 0)}
+            for row in results
+        ]
+
+    def get_summary(self, db: Session, *, trainee_id: int, today: Optional[date] = None) -> dict[str, Any]:
+        """Dashboard summary cards: one aggregate query plus a bounded streak scan."""
+        today = today or date.today()
+        week_ago = today - timedelta(days=7)
+        month_ago = today - timedelta(days=30)
+
+        total_exercises = (
+            db.query(func.sum(TraineeDailyStat.log_count))
+            .filter(TraineeDailyStat.trainee_id == trainee_id)
+            .scalar_subquery()
+        )
+        total_volume = (
+            db.query(func.sum(TraineeDailyStat.total_volume_kg))
+            .filter(TraineeDailyStat.trainee_id == trainee_id)
+            .scalar_subquery()
+        )
+        totals = (
+            db.query(
+                func.count(case((WorkoutSession.status == "completed", WorkoutSession.id))).label("total_workouts"),
+                func.count(case((WorkoutSession.session_date >= week_ago, WorkoutSession.id))).label("workouts_week"),
+                func.count(case((WorkoutSession.session_date >= month_ago, WorkoutSession.id))).label("workouts_month"),
+                total_exercises.label("total_exercises"),
+                total_volume.label("total_volume"),
+            )
+            .filter(WorkoutSession.trainee_id == trainee_id)
+            .one()
+        )
+
+        return {
+            "total_workouts": totals.total_workouts or 0,
+            "total_exercises_logged": totals.total_exercises or 0,
+            "total_volume_kg": float(totals.total_volume or 0),
+            "current_streak_days": self.get_current_streak(db, trainee_id=trainee_id, today=today),
+            "workouts_this_week": totals.workouts_week or 0,
+            "workouts_this_month": totals.workouts_month or 0,
+        }
+
+    def get_personal_records(self, db: Session, *, trainee_id: int) -> list[dict[str, Any]]:
+        """Return the heaviest set per exercise plus the best estimated 1RM.
+
+        Reads the ``personal_records`` table (one primary-key range query);
+        exercises without a weighted set have no records and are omitted.
+        """
+        rows = (
+            db.query(PersonalRecord, Exercise.name)
+            .join(Exercise, Exercise.id == PersonalRecord.exercise_id)
+            .filter(PersonalRecord.trainee_id == trainee_id)
+            .all()
+        )
+        by_exercise: dict[int, dict[str, Any]] = {}
+        names: dict[int, str] = {}
+        for record, name in rows:
+            by_exercise.setdefault(record.exercise_id, {})[record.metric] = record
+            names[record.exercise_id] = name
+
+        def value(records: dict[str, Any], metric: PersonalRecordMetric) -> Optional[float]:
+            record = records.get(metric.value)
+            return round(float(record.value), 1) if record is not None else None
+
+        prs = []
+        for exercise_id, records in by_exercise.items():
+            best = records.get(PersonalRecordMetric.MAX_WEIGHT.value)
+            if best is None:
+                continue
+            prs.append({
+                "exercise_id": exercise_id,
+                "exercise_name": names[exercise_id],
+                "max_weight_kg": float(best.value),
+                "achieved_date": best.achieved_date.isoformat(),
+                "sets": best.sets or 0,
+                "reps": best.reps or 0,
+                "max_volume_kg": value(records, PersonalRecordMetric.MAX_VOLUME),
+                "estimated_1rm_epley_kg": value(records, PersonalRecordMetric.ESTIMATED_1RM_EPLEY),
+                "estimated_1rm_brzycki_kg": value(records, PersonalRecordMetric.ESTIMATED_1RM_BRZYCKI),
+            })
+        prs.sort(key=lambda pr: (-pr["max_weight_kg"], pr["exercise_id"]))
+        return prs
+
+    def get_current_streak(
+        self,
+        db: Session,
+        *,
+        trainee_id: int,
+        today: Optional[date] = None,
+        batch_size: int = STREAK_SCAN_BATCH,
+    ) -> int:
+        """Count consecutive workout days ending today (or yesterday).
+
+        Walks distinct session dates newest first in batches of ``batch_size``
+        and stops at the first gap, so cost depends on the streak length rather
+        than on the trainee's full history.
+        """
+        current_date = today or date.today()
+        streak = 0
+        upper_bound = None
+
+        while True:
+            query = (
+                db.query(WorkoutSession.session_date)
+                .filter(WorkoutSession.trainee_id == trainee_id)
+            )
+            if upper_bound is not None:
+                query = query.filter(WorkoutSession.session_date < upper_bound)
+            session_dates = [
+                row.session_date
+                for row in query.distinct().order_by(desc(WorkoutSession.session_date)).limit(batch_size).all()
+            ]
+
+            for session_date in session_dates:
+                if session_date == current_date or (current_date - session_date).days <= 1:
+                    streak += 1
+                    current_date = session_date
+                else:
+                    return streak
+
+            if len(session_dates) < batch_size:
+                return streak
+            upper_bound = session_dates[-1]
+
+
+analytics = CRUDAnalytics()
+async_analytics = AsyncCRUD(analytics)
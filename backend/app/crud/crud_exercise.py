@@ -1,7 +1,11 @@
+from typing import Optional
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.models.exercise import Exercise
 from app.schemas.exercise import ExerciseCreate, ExerciseUpdate
+from app.crud.async_crud import AsyncCRUD
+from app.crud.pagination import paginate
 
 
 class CRUDExercise:
@@ -11,8 +15,24 @@ class CRUDExercise:
     def get_by_name(self, db: Session, name: str):
         return db.query(Exercise).filter(Exercise.name == name).first()
 
+    def get_existing_ids(self, db: Session, ids) -> set[int]:
+        """Subset of ``ids`` that exist, in one query."""
+        ids = set(ids)
+        if not ids:
+            return set()
+        return set(db.scalars(select(Exercise.id).where(Exercise.id.in_(ids))))
+
     def get_multi(self, db: Session, skip: int = 0, limit: int = 100):
-        return db.query(Exercise).offset(skip).limit(limit).all()
+        return db.query(Exercise).order_by(Exercise.id).offset(skip).limit(limit).all()
+
+    def get_versions(self, db: Session, *, skip: int = 0, limit: int = 100) -> list[tuple]:
+        """``(id, version_id)`` of the rows ``get_multi`` returns, without loading them."""
+        query = db.query(Exercise.id, Exercise.version_id).order_by(Exercise.id).offset(skip).limit(limit)
+        return [tuple(row) for row in query]
+
+    def get_page(self, db: Session, *, cursor: Optional[str] = None, limit: int = 100):
+        """Keyset-paginated ``get_multi`` ordered by id; returns ``(items, next_cursor)``."""
+        return paginate(db.query(Exercise), id_column=Exercise.id, cursor=cursor, limit=limit)
 
     def create(self, db: Session, *, obj_in: ExerciseCreate | dict):
         """Create an Exercise from Pydantic model or dict."""
@@ -60,3 +80,4 @@ class CRUDExercise:
 
 
 exercise = CRUDExercise()
+async_exercise = AsyncCRUD(exercise)
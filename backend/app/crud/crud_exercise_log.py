@@ -1,6 +1,14 @@
-from sqlalchemy.orm import Session
+from typing import Optional
+from sqlalchemy import insert
+from sqlalchemy.orm import Session, selectinload
 from app.models.exercise_log import ExerciseLog
+from app.models.workout_session import WorkoutSession
 from app.schemas.exercise_log import ExerciseLogCreate, ExerciseLogUpdate
+from app.crud.crud_trainee_daily_stat import trainee_daily_stat as crud_trainee_daily_stat
+from app.crud.crud_personal_record import personal_record as crud_personal_record
+from app.crud.analytics_cache import mark_trainee_changed
+from app.crud.async_crud import AsyncCRUD
+from app.crud.pagination import paginate
 
 class CRUDExerciseLog:
     def get(self, db: Session, id: int):
@@ -9,6 +17,10 @@ class CRUDExerciseLog:
     def get_multi(self, db: Session, skip: int = 0, limit: int = 100):
         return db.query(ExerciseLog).offset(skip).limit(limit).all()
 
+    def get_page(self, db: Session, *, cursor: Optional[str] = None, limit: int = 100):
+        """Keyset-paginated ``get_multi`` ordered by id; returns ``(items, next_cursor)``."""
+        return paginate(db.query(ExerciseLog), id_column=ExerciseLog.id, cursor=cursor, limit=limit)
+
     def create(self, db: Session, *, obj_in: ExerciseLogCreate):
         db_obj = ExerciseLog(
             session_id=obj_in.session_id,
@@ -20,19 +32,76 @@ class CRUDExerciseLog:
             is_completed=obj_in.is_completed,
         )
         db.add(db_obj)
+        crud_trainee_daily_stat.add_logs(db, session_id=db_obj.session_id, logs=[db_obj])
+        new_records = crud_personal_record.add_logs(db, session_id=db_obj.session_id, logs=[db_obj])
         db.commit()
         db.refresh(db_obj)
+        # Not a column: reported by the response schema as new_personal_records
+        db_obj.new_personal_records = new_records.get(db_obj.id, [])
         return db_obj
 
+    def create_multi(self, db: Session, *, session_id: int, objs_in: list[ExerciseLogCreate], commit: bool = True):
+        """Insert many logs for one session with a single batched INSERT ... RETURNING.
+
+        ``volume_kg`` is always derived as sets x reps x weight (missing values
+        count as 0) and ``is_completed`` is always True, matching the single
+        log-exercise endpoint: a set logged into a session was performed. The rollup and
+        personal records are updated in the same transaction. With
+        ``commit=False`` the caller owns the transaction and the inserted rows
+        are returned as-is.
+        """
+        rows = [
+            {
+                "session_id": session_id,
+                "exercise_id": obj_in.exercise_id,
+                "completed_sets": obj_in.completed_sets,
+                "completed_reps": obj_in.completed_reps,
+                "completed_weight_kg": obj_in.completed_weight_kg,
+                "volume_kg": (obj_in.completed_sets or 0) * (obj_in.completed_reps or 0) * (obj_in.completed_weight_kg or 0.0),
+                "is_completed": True,
+            }
+            for obj_in in objs_in
+        ]
+        if not rows:
+            return []
+        # render_nulls keeps rows with missing values in the same batch.
+        # sort_by_parameter_order would make SQLite fall back to one INSERT per
+        # row; ids are assigned in VALUES order, so sorting by id restores it.
+        stmt = insert(ExerciseLog).returning(ExerciseLog).execution_options(render_nulls=True)
+        db_objs = sorted(db.scalars(stmt, rows), key=lambda obj: obj.id)
+        crud_trainee_daily_stat.add_logs(db, session_id=session_id, logs=db_objs)
+        new_records = crud_personal_record.add_logs(db, session_id=session_id, logs=db_objs)
+        for db_obj in db_objs:
+            db_obj.new_personal_records = new_records.get(db_obj.id, [])
+        # The bulk INSERT skips mapper events; already loaded by the rollup
+        session = db.get(WorkoutSession, session_id)
+        mark_trainee_changed(db, session.trainee_id if session is not None else None)
+        if not commit:
+            return db_objs
+        db.commit()
+        # Reload with exercises in one extra query rather than one refresh per row
+        ids = [db_obj.id for db_obj in db_objs]
+        by_id = {
+            db_obj.id: db_obj
+            for db_obj in db.query(ExerciseLog)
+            .options(selectinload(ExerciseLog.exercise))
+            .filter(ExerciseLog.id.in_(ids))
+        }
+        return [by_id[id] for id in ids]
+
     def update(self, db: Session, *, db_obj: ExerciseLog, obj_in: ExerciseLogUpdate):
         if isinstance(obj_in, dict):
             update_data = obj_in
         else:
             update_data = obj_in.dict(exclude_unset=True)
+        old_key = (db_obj.session_id, db_obj.exercise_id)
         for field, value in update_data.items():
             if hasattr(db_obj, field):
                 setattr(db_obj, field, update_data[field])
         db.add(db_obj)
+        # The log may have moved between buckets; rebuild both from raw logs
+        crud_trainee_daily_stat.recompute(db, keys=[old_key, (db_obj.session_id, db_obj.exercise_id)])
+        crud_personal_record.recompute(db, keys=[old_key, (db_obj.session_id, db_obj.exercise_id)])
         db.commit()
         db.refresh(db_obj)
         return db_obj
@@ -42,7 +111,10 @@ class CRUDExerciseLog:
         if obj is None:
             return None
         db.delete(obj)
+        crud_trainee_daily_stat.recompute(db, keys=[(obj.session_id, obj.exercise_id)])
+        crud_personal_record.recompute(db, keys=[(obj.session_id, obj.exercise_id)])
         db.commit()
         return obj
 
 exercise_log = CRUDExerciseLog()
+async_exercise_log = AsyncCRUD(exercise_log)
@@ -1,7 +1,10 @@
+from typing import Optional
 from sqlalchemy.orm import Session
 
 from app.models.gym import Gym
 from app.schemas.gym import GymCreate, GymUpdate
+from app.crud.async_crud import AsyncCRUD
+from app.crud.pagination import paginate
 
 
 class CRUDGym:
@@ -11,6 +14,10 @@ class CRUDGym:
     def get_multi(self, db: Session, skip: int = 0, limit: int = 100):
         return db.query(Gym).offset(skip).limit(limit).all()
 
+    def get_page(self, db: Session, *, cursor: Optional[str] = None, limit: int = 100):
+        """Keyset-paginated ``get_multi`` ordered by id; returns ``(items, next_cursor)``."""
+        return paginate(db.query(Gym), id_column=Gym.id, cursor=cursor, limit=limit)
+
     def get_by_name(self, db: Session, *, name: str):
         return db.query(Gym).filter(Gym.name == name).first()
 
@@ -51,3 +58,4 @@ class CRUDGym:
 
 
 gym = CRUDGym()
+async_gym = AsyncCRUD(gym)
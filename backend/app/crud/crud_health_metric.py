@@ -1,6 +1,19 @@
+from typing import Optional
 from sqlalchemy.orm import Session
 from app.models.health_metric import HealthMetric
 from app.schemas.health_metric import HealthMetricCreate, HealthMetricUpdate
+from app.crud.async_crud import AsyncCRUD
+from app.crud.pagination import paginate
+
+# Columns of ``HealthMetricSummary``, selected as plain rows for ``summary=True``
+SUMMARY_COLUMNS = (
+    HealthMetric.id,
+    HealthMetric.recorded_at,
+    HealthMetric.weight_kg,
+    HealthMetric.body_fat_percentage,
+    HealthMetric.skeletal_muscle_mass_kg,
+    HealthMetric.bmi,
+)
 
 class CRUDHealthMetric:
     def get(self, db: Session, id: int):
@@ -9,10 +22,17 @@ class CRUDHealthMetric:
     def get_multi(self, db: Session, skip: int = 0, limit: int = 100):
         return db.query(HealthMetric).offset(skip).limit(limit).all()
 
-    def get_by_trainee(self, db: Session, *, trainee_id: int, skip: int = 0, limit: int = 100):
-        """Get health metrics for a specific trainee, ordered by most recent first."""
+    def get_page(self, db: Session, *, cursor: Optional[str] = None, limit: int = 100):
+        """Keyset-paginated ``get_multi`` ordered by id; returns ``(items, next_cursor)``."""
+        return paginate(db.query(HealthMetric), id_column=HealthMetric.id, cursor=cursor, limit=limit)
+
+    def get_by_trainee(self, db: Session, *, trainee_id: int, skip: int = 0, limit: int = 100, summary: bool = False):
+        """Get health metrics for a specific trainee, ordered by most recent first.
+
+        With ``summary`` the result is ``SUMMARY_COLUMNS`` rows instead of objects.
+        """
         return (
-            db.query(HealthMetric)
+            db.query(*SUMMARY_COLUMNS if summary else (HealthMetric,))
             .filter(HealthMetric.trainee_id == trainee_id)
             .order_by(HealthMetric.recorded_at.desc())
             .offset(skip)
@@ -20,6 +40,19 @@ class CRUDHealthMetric:
             .all()
         )
 
+    def get_page_by_trainee(
+        self, db: Session, *, trainee_id: int, cursor: Optional[str] = None, limit: int = 100, summary: bool = False
+    ):
+        """Keyset-paginated ``get_by_trainee``: most recent first by (recorded_at, id)."""
+        return paginate(
+            db.query(*SUMMARY_COLUMNS if summary else (HealthMetric,)).filter(HealthMetric.trainee_id == trainee_id),
+            sort_column=HealthMetric.recorded_at,
+            id_column=HealthMetric.id,
+            descending=True,
+            cursor=cursor,
+            limit=limit,
+        )
+
     def create(self, db: Session, *, obj_in: HealthMetricCreate):
         db_obj = HealthMetric(
             trainee_id=obj_in.trainee_id,
@@ -54,3 +87,4 @@ class CRUDHealthMetric:
         return obj
 
 health_metric = CRUDHealthMetric()
+async_health_metric = AsyncCRUD(health_metric)
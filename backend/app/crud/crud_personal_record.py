@@ -0,0 +1,282 @@
+"""Maintenance of the ``personal_records`` table.
+
+Writers call ``add_logs``/``recompute`` inside their own transaction, before
+committing, exactly like the ``trainee_daily_stats`` rollup. Only sets with a
+recorded weight count. For every metric the record is the set with the
+highest value; ties go to the most recent session, then to the latest log,
+the same order ``_best_logs`` ranks raw logs in.
+"""
+import math
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import case, delete, func, insert, literal
+from sqlalchemy.orm import Session
+
+from app.models.exercise_log import ExerciseLog
+from app.models.personal_record import PersonalRecord
+from app.models.workout_session import WorkoutSession
+from app.schemas.enums import PersonalRecordMetric
+from app.crud.async_crud import AsyncCRUD
+
+RECORD_FIELDS = ("value", "exercise_log_id", "achieved_date", "weight_kg", "sets", "reps")
+
+_weight = ExerciseLog.completed_weight_kg
+_reps = ExerciseLog.completed_reps
+
+# SQL expression for each metric's value; must agree with ``metric_values``
+METRIC_COLUMNS = {
+    PersonalRecordMetric.MAX_WEIGHT.value: _weight,
+    PersonalRecordMetric.MAX_VOLUME.value: ExerciseLog.volume_kg,
+    # A single rep is already a 1RM; Brzycki is undefined from 37 reps on
+    PersonalRecordMetric.ESTIMATED_1RM_EPLEY.value: case(
+        (_reps == 1, _weight), (_reps > 1, _weight * (1 + _reps / 30.0))
+    ),
+    PersonalRecordMetric.ESTIMATED_1RM_BRZYCKI.value: case(
+        (_reps.between(1, 36), _weight * 36.0 / (37 - _reps))
+    ),
+}
+
+
+def epley_1rm(weight: Optional[float], reps: Optional[int]) -> Optional[float]:
+    if weight is None or reps is None or reps < 1:
+        return None
+    return weight if reps == 1 else weight * (1 + reps / 30.0)
+
+
+def brzycki_1rm(weight: Optional[float], reps: Optional[int]) -> Optional[float]:
+    if weight is None or reps is None or not 1 <= reps <= 36:
+        return None
+    return weight * 36.0 / (37 - reps)
+
+
+def metric_values(log: Any) -> dict[str, Optional[float]]:
+    """Value of each metric for one logged set; empty for unweighted sets."""
+    weight = log.completed_weight_kg
+    if weight is None:
+        return {}
+    return {
+        PersonalRecordMetric.MAX_WEIGHT.value: weight,
+        PersonalRecordMetric.MAX_VOLUME.value: log.volume_kg,
+        PersonalRecordMetric.ESTIMATED_1RM_EPLEY.value: epley_1rm(weight, log.completed_reps),
+        PersonalRecordMetric.ESTIMATED_1RM_BRZYCKI.value: brzycki_1rm(weight, log.completed_reps),
+    }
+
+
+def _same(expected: Any, actual: Any) -> bool:
+    if isinstance(expected, float) or isinstance(actual, float):
+        if expected is None or actual is None:
+            return expected is None and actual is None
+        return math.isclose(expected, actual, rel_tol=1e-9, abs_tol=1e-6)
+    return expected == actual
+
+
+class CRUDPersonalRecord:
+    def get_by_trainee(self, db: Session, *, trainee_id: int):
+        return (
+            db.query(PersonalRecord)
+            .filter(PersonalRecord.trainee_id == trainee_id)
+            .order_by(PersonalRecord.exercise_id, PersonalRecord.metric)
+            .all()
+        )
+
+    def add_logs(self, db: Session, *, session_id: Optional[int], logs: Iterable[Any]) -> dict[int, list[str]]:
+        """Fold newly inserted logs of one session into the records (no commit).
+
+        ``logs`` need the attributes of an ExerciseLog; pending logs are
+        flushed here so that they have ids. Returns, per log id, the metrics
+        in which that log set a new record. A log that only ties a record
+        takes it over (it is more recent) but is not reported.
+        """
+        session = db.get(WorkoutSession, session_id) if session_id is not None else None
+        if session is None or session.trainee_id is None:
+            return {}
+
+        candidates = [(log, metric_values(log)) for log in logs if log.exercise_id is not None]
+        candidates = [(log, values) for log, values in candidates if values]
+        if not candidates:
+            return {}
+        # Records point at log ids, so pending logs must be inserted first
+        # (the session does not autoflush)
+        db.flush()
+
+        existing = {
+            (record.exercise_id, record.metric): record
+            for record in db.query(PersonalRecord).filter(
+                PersonalRecord.trainee_id == session.trainee_id,
+                PersonalRecord.exercise_id.in_({log.exercise_id for log, _ in candidates}),
+            )
+        }
+        new_records: dict[int, list[str]] = {}
+        for log, values in candidates:
+            for metric, value in values.items():
+                if value is None:
+                    continue
+                record = existing.get((log.exercise_id, metric))
+                if record is not None and (value, session.session_date, log.id) < (
+                    record.value, record.achieved_date, record.exercise_log_id
+                ):
+                    continue
+                if record is None or value > record.value:
+                    new_records.setdefault(log.id, []).append(metric)
+                if record is None:
+                    record = PersonalRecord(trainee_id=session.trainee_id, exercise_id=log.exercise_id, metric=metric)
+                    existing[(log.exercise_id, metric)] = record
+                    db.add(record)
+                record.value = value
+                record.exercise_log_id = log.id
+                record.achieved_date = session.session_date
+                record.weight_kg = log.completed_weight_kg
+                record.sets = log.completed_sets
+                record.reps = log.completed_reps
+        db.flush()
+        return new_records
+
+    def recompute(self, db: Session, *, keys: Iterable[tuple[Optional[int], Optional[int]]]) -> None:
+        """Rebuild the records touched by ``(session_id, exercise_id)`` pairs from raw logs.
+
+        Used when logs are edited or deleted, where the next-best set has to
+        be found again. Pending changes are flushed first.
+        """
+        db.flush()
+        touched: dict[int, set[int]] = {}
+        for session_id, exercise_id in keys:
+            if session_id is None or exercise_id is None:
+                continue
+            session = db.get(WorkoutSession, session_id)
+            if session is None or session.trainee_id is None:
+                continue
+            touched.setdefault(session.trainee_id, set()).add(exercise_id)
+        self.recompute_trainees(db, touched=touched)
+
+    def recompute_trainees(self, db: Session, *, touched: dict[int, set[int]]) -> None:
+        """Rebuild the records of the given ``trainee_id -> exercise ids`` from raw logs.
+
+        Pending changes are flushed first.
+        """
+        db.flush()
+        for trainee_id, exercise_ids in touched.items():
+            fresh = {
+                (row.exercise_id, row.metric): row
+                for row in self._best_logs(
+                    db,
+                    WorkoutSession.trainee_id == trainee_id,
+                    ExerciseLog.exercise_id.in_(exercise_ids),
+                ).all()
+            }
+            existing = {
+                (record.exercise_id, record.metric): record
+                for record in db.query(PersonalRecord).filter(
+                    PersonalRecord.trainee_id == trainee_id,
+                    PersonalRecord.exercise_id.in_(exercise_ids),
+                )
+            }
+            for key in set(fresh) | set(existing):
+                row = fresh.get(key)
+                record = existing.get(key)
+                if row is None:
+                    db.delete(record)
+                    continue
+                if record is None:
+                    record = PersonalRecord(trainee_id=trainee_id, exercise_id=key[0], metric=key[1])
+                    db.add(record)
+                for field in RECORD_FIELDS:
+                    setattr(record, field, getattr(row, field))
+        db.flush()
+
+    def backfill(self, db: Session, *, trainee_id: Optional[int] = None) -> int:
+        """Rebuild the records from raw logs, for everyone or a single trainee."""
+        clear = delete(PersonalRecord)
+        criteria = []
+        if trainee_id is not None:
+            clear = clear.where(PersonalRecord.trainee_id == trainee_id)
+            criteria.append(WorkoutSession.trainee_id == trainee_id)
+        db.execute(clear)
+        db.execute(
+            insert(PersonalRecord).from_select(
+                ["trainee_id", "exercise_id", "metric", *RECORD_FIELDS],
+                self._best_logs(db, *criteria).statement,
+            )
+        )
+        db.commit()
+        count = db.query(func.count()).select_from(PersonalRecord)
+        if trainee_id is not None:
+            count = count.filter(PersonalRecord.trainee_id == trainee_id)
+        return count.scalar() or 0
+
+    def find_inconsistencies(self, db: Session, *, trainee_id: Optional[int] = None) -> list[dict[str, Any]]:
+        """Compare stored records with the best sets ranked from raw logs.
+
+        Returns one entry per mismatching record; an empty list means the
+        table is consistent.
+        """
+        criteria = []
+        stored_query = db.query(PersonalRecord)
+        if trainee_id is not None:
+            criteria.append(WorkoutSession.trainee_id == trainee_id)
+            stored_query = stored_query.filter(PersonalRecord.trainee_id == trainee_id)
+
+        raw = {(row.trainee_id, row.exercise_id, row.metric): row for row in self._best_logs(db, *criteria).all()}
+        stored = {(record.trainee_id, record.exercise_id, record.metric): record for record in stored_query.all()}
+
+        problems = []
+        for key in sorted(set(raw) | set(stored)):
+            expected = raw.get(key)
+            actual = stored.get(key)
+            entry = {"trainee_id": key[0], "exercise_id": key[1], "metric": key[2]}
+            if expected is None or actual is None:
+                problems.append({**entry, "problem": "missing record" if actual is None else "no matching logs"})
+                continue
+            fields = [
+                field for field in RECORD_FIELDS
+                if not _same(getattr(expected, field), getattr(actual, field))
+            ]
+            if fields:
+                problems.append({
+                    **entry,
+                    "problem": "mismatch",
+                    "fields": {
+                        field: {"expected": getattr(expected, field), "actual": getattr(actual, field)}
+                        for field in fields
+                    },
+                })
+        return problems
+
+    def _best_logs(self, db: Session, *criteria: Any):
+        """Best raw-log set per (trainee, exercise, metric), shaped like a record row.
+
+        One ``ROW_NUMBER()`` window per metric, combined with UNION ALL so all
+        metrics come back in a single statement.
+        """
+        trainee_id = WorkoutSession.trainee_id
+        exercise_id = ExerciseLog.exercise_id
+        per_metric = []
+        for metric, value in METRIC_COLUMNS.items():
+            ranked = (
+                db.query(
+                    trainee_id.label("trainee_id"),
+                    exercise_id.label("exercise_id"),
+                    literal(metric).label("metric"),
+                    value.label("value"),
+                    ExerciseLog.id.label("exercise_log_id"),
+                    WorkoutSession.session_date.label("achieved_date"),
+                    _weight.label("weight_kg"),
+                    ExerciseLog.completed_sets.label("sets"),
+                    _reps.label("reps"),
+                    func.row_number().over(
+                        partition_by=(trainee_id, exercise_id),
+                        order_by=(value.desc(), WorkoutSession.session_date.desc(), ExerciseLog.id.desc()),
+                    ).label("rank"),
+                )
+                .join(WorkoutSession, ExerciseLog.session_id == WorkoutSession.id)
+                .filter(trainee_id.isnot(None), exercise_id.isnot(None), _weight.isnot(None), value.isnot(None), *criteria)
+                .subquery()
+            )
+            per_metric.append(
+                db.query(*(ranked.c[name] for name in ("trainee_id", "exercise_id", "metric", *RECORD_FIELDS)))
+                .filter(ranked.c.rank == 1)
+            )
+        return per_metric[0].union_all(*per_metric[1:])
+
+
+personal_record = CRUDPersonalRecord()
+async_personal_record = AsyncCRUD(personal_record)
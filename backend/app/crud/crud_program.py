@@ -1,7 +1,13 @@
+from typing import Optional
 from sqlalchemy.orm import Session
 
+from app.models.gym import Gym
 from app.models.program import Program
+from app.models.trainer import Trainer
+from app.models.user import User
 from app.schemas.program import ProgramCreate, ProgramUpdate
+from app.crud.async_crud import AsyncCRUD
+from app.crud.pagination import paginate
 
 
 class CRUDProgram:
@@ -9,7 +15,33 @@ class CRUDProgram:
         return db.query(Program).filter(Program.id == id).first()
 
     def get_multi(self, db: Session, skip: int = 0, limit: int = 100):
-        return db.query(Program).offset(skip).limit(limit).all()
+        return db.query(Program).order_by(Program.id).offset(skip).limit(limit).all()
+
+    def get_versions(self, db: Session, *, skip: int = 0, limit: int = 100) -> list[tuple]:
+        """Version key of each row ``get_multi`` returns, without loading them.
+
+        The response nests the trainer (with their user's email and gym), so
+        their versions are part of each program's key.
+        """
+        query = self._versions(db).order_by(Program.id).offset(skip).limit(limit)
+        return [tuple(row) for row in query]
+
+    def get_version(self, db: Session, *, id: int) -> Optional[tuple]:
+        """Version key of one program as in ``get_versions``; None if it does not exist."""
+        row = self._versions(db).filter(Program.id == id).first()
+        return tuple(row) if row is not None else None
+
+    def _versions(self, db: Session):
+        return (
+            db.query(Program.id, Program.version_id, Trainer.version_id, User.email, Gym.version_id)
+            .outerjoin(Trainer, Trainer.id == Program.trainer_id)
+            .outerjoin(User, User.id == Trainer.user_id)
+            .outerjoin(Gym, Gym.id == Trainer.gym_id)
+        )
+
+    def get_page(self, db: Session, *, cursor: Optional[str] = None, limit: int = 100):
+        """Keyset-paginated ``get_multi`` ordered by id; returns ``(items, next_cursor)``."""
+        return paginate(db.query(Program), id_column=Program.id, cursor=cursor, limit=limit)
 
     def create(self, db: Session, *, obj_in: ProgramCreate | dict):
         """Create a Program from Pydantic model or dict.
@@ -60,3 +92,4 @@ class CRUDProgram:
 
 
 program = CRUDProgram()
+async_program = AsyncCRUD(program)
@@ -1,6 +1,9 @@
+from typing import Optional
 from sqlalchemy.orm import Session
 from app.models.program_exercise import ProgramExercise
 from app.schemas.program_exercise import ProgramExerciseCreate, ProgramExerciseUpdate
+from app.crud.async_crud import AsyncCRUD
+from app.crud.pagination import paginate
 
 class CRUDProgramExercise:
     def get(self, db: Session, id: int):
@@ -9,6 +12,10 @@ class CRUDProgramExercise:
     def get_multi(self, db: Session, skip: int = 0, limit: int = 100):
         return db.query(ProgramExercise).offset(skip).limit(limit).all()
 
+    def get_page(self, db: Session, *, cursor: Optional[str] = None, limit: int = 100):
+        """Keyset-paginated ``get_multi`` ordered by id; returns ``(items, next_cursor)``."""
+        return paginate(db.query(ProgramExercise), id_column=ProgramExercise.id, cursor=cursor, limit=limit)
+
     def create(self, db: Session, *, obj_in: ProgramExerciseCreate):
         db_obj = ProgramExercise(
             program_id=obj_in.program_id,
@@ -45,3 +52,4 @@ class CRUDProgramExercise:
         return obj
 
 program_exercise = CRUDProgramExercise()
+async_program_exercise = AsyncCRUD(program_exercise)
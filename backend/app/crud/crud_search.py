@@ -0,0 +1,105 @@
+"""Full-text search over exercise and program names and descriptions.
+
+Queries the indexes defined in ``app.db.search``: FTS5 with ``bm25()`` on
+SQLite, ``tsvector`` with ``ts_rank_cd()`` on PostgreSQL. User input is
+reduced to word tokens, each matched as a prefix, and all of them must
+match. Name matches rank above description matches on SQLite; the
+PostgreSQL document does not weight them.
+"""
+import html
+import re
+from typing import Any, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.db.search import SEARCH_DOCUMENT, SEARCH_TABLES
+from app.crud.async_crud import AsyncCRUD
+
+# Markers the database puts around matches; replaced after HTML escaping
+_START, _STOP = "\x02", "\x03"
+# bm25 column weights for (name, description)
+NAME_WEIGHT, DESCRIPTION_WEIGHT = 10.0, 1.0
+SNIPPET_WORDS = 16
+# Dialects with a search index in app.db.search
+SUPPORTED_DIALECTS = ("sqlite", "postgresql")
+
+
+def _tokens(q: str) -> list[str]:
+    return re.findall(r"\w+", q.casefold())
+
+
+def _mark(value: Optional[str]) -> Optional[str]:
+    if value is None:
+        return None
+    return html.escape(value).replace(_START, "<mark>").replace(_STOP, "</mark>")
+
+
+class CRUDSearch:
+    def supports(self, db: Session) -> bool:
+        """Whether ``db`` is a database with search indexes."""
+        return db.get_bind().dialect.name in SUPPORTED_DIALECTS
+
+    def search(self, db: Session, *, q: str, limit: int = 20) -> dict[str, list[dict[str, Any]]]:
+        """Best ``limit`` exercises and programs matching ``q``, most relevant first."""
+        tokens = _tokens(q)
+        results: dict[str, list[dict[str, Any]]] = {source: [] for source in SEARCH_TABLES}
+        if not tokens or limit <= 0:
+            return results
+        if not self.supports(db):
+            raise NotImplementedError(f"Full-text search is not available on {db.get_bind().dialect.name}")
+        dialect = db.get_bind().dialect.name
+        for source, fts in SEARCH_TABLES.items():
+            if dialect == "sqlite":
+                rows = self._sqlite(db, source, fts, tokens, limit)
+            else:
+                rows = self._postgresql(db, source, tokens, limit)
+            results[source] = [
+                {
+                    "id": row.id,
+                    "name": row.name,
+                    "name_highlight": _mark(row.name_highlight),
+                    "description_snippet": _mark(row.description_snippet) if row.description else None,
+                    "score": row.score,
+                }
+                for row in rows
+            ]
+        return results
+
+    def _sqlite(self, db: Session, source: str, fts: str, tokens: list[str], limit: int):
+        # Tokens are \w+ only, so quoting them cannot inject FTS5 syntax
+        match = " ".join(f'"{token}"*' for token in tokens)
+        return db.execute(
+            text(
+                f"SELECT s.id, s.name, s.description, "
+                f"highlight({fts}, 0, :start, :stop) AS name_highlight, "
+                f"snippet({fts}, 1, :start, :stop, '…', {SNIPPET_WORDS}) AS description_snippet, "
+                f"-bm25({fts}, {NAME_WEIGHT}, {DESCRIPTION_WEIGHT}) AS score "
+                f"FROM {fts} JOIN {source} s ON s.id = {fts}.rowid "
+                f"WHERE {fts} MATCH :match ORDER BY bm25({fts}, {NAME_WEIGHT}, {DESCRIPTION_WEIGHT}), s.id LIMIT :limit"
+            ),
+            {"start": _START, "stop": _STOP, "match": match, "limit": limit},
+        ).all()
+
+    def _postgresql(self, db: Session, source: str, tokens: list[str], limit: int):
+        headline = f"StartSel={_START}, StopSel={_STOP}"
+        return db.execute(
+            text(
+                f"SELECT id, name, description, "
+                f"ts_headline('english', name, query, :name_options) AS name_highlight, "
+                f"ts_headline('english', coalesce(description, ''), query, :snippet_options) AS description_snippet, "
+                f"ts_rank_cd({SEARCH_DOCUMENT}, query) AS score "
+                f"FROM {source}, to_tsquery('english', :match) AS query "
+                f"WHERE {SEARCH_DOCUMENT} @@ query ORDER BY score DESC, id LIMIT :limit"
+            ),
+            {
+                "name_options": f"{headline}, HighlightAll=true",
+                "snippet_options": f"{headline}, MaxFragments=1, MaxWords={SNIPPET_WORDS}, MinWords=5",
+                "match": " & ".join(f"{token}:*" for token in tokens),
+                "limit": limit,
+            },
+        ).all()
+
+
+search = CRUDSearch()
+async_search = AsyncCRUD(search)
@@ -1,7 +1,11 @@
+from typing import Optional
 from sqlalchemy.orm import Session
 
 from app.models.trainee import Trainee
+from app.models.user import User
 from app.schemas.trainee import TraineeCreate, TraineeUpdate
+from app.crud.async_crud import AsyncCRUD
+from app.crud.pagination import paginate
 
 
 class CRUDTrainee:
@@ -11,13 +15,28 @@ class CRUDTrainee:
     def get_by_email(self, db: Session, email: str):
         return db.query(Trainee).filter(Trainee.email == email).first()
 
-    def get_multi(self, db: Session, skip: int = 0, limit: int = 100):
-        return db.query(Trainee).offset(skip).limit(limit).all()
+    def get_multi(self, db: Session, skip: int = 0, limit: int = 100, summary: bool = False):
+        """With ``summary``, ``TraineeSummary``-shaped rows instead of objects."""
+        return self._query(db, summary).offset(skip).limit(limit).all()
 
-    def create(self, db: Session, *, obj_in: TraineeCreate | dict):
-        """Create a Trainee from either a Pydantic model or a plain dict."""
+    def get_page(self, db: Session, *, cursor: Optional[str] = None, limit: int = 100, summary: bool = False):
+        """Keyset-paginated ``get_multi`` ordered by id; returns ``(items, next_cursor)``."""
+        return paginate(self._query(db, summary), id_column=Trainee.id, cursor=cursor, limit=limit)
+
+    def _query(self, db: Session, summary: bool):
+        if not summary:
+            return db.query(Trainee)
+        return db.query(
+            Trainee.id, Trainee.first_name, Trainee.last_name, User.email, Trainee.trainer_id, Trainee.program_id
+        ).join(User, User.id == Trainee.user_id)
+
+    def create(self, db: Session, *, obj_in: TraineeCreate | dict, hashed_password: Optional[str] = None):
+        """Create a Trainee from either a Pydantic model or a plain dict.
+
+        Pass ``hashed_password`` when it was already computed (e.g. with ``hash_async``).
+        """
         from app.models.user import User, UserRole
-        from app.auth.token import get_password_hash
+        from app.auth.hashing import password_hasher
 
         if isinstance(obj_in, dict):
             first_name = obj_in.get("first_name")
@@ -39,7 +58,7 @@ class CRUDTrainee:
         # 1. Create User
         db_user = User(
             email=email,
-            hashed_password=get_password_hash(password),
+            hashed_password=hashed_password or password_hasher.hash(password),
             role=UserRole.TRAINEE
         )
         db.add(db_user)
@@ -85,3 +104,4 @@ class CRUDTrainee:
 
 
 trainee = CRUDTrainee()
+async_trainee = AsyncCRUD(trainee)
@@ -0,0 +1,257 @@
+"""Maintenance of the ``trainee_daily_stats`` rollup.
+
+Writers call ``add_logs``/``recompute`` inside their own transaction, before
+committing, so the rollup always commits together with the raw logs.
+"""
+import math
+from datetime import date
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import delete, func, insert
+from sqlalchemy.orm import Session
+
+from app.models.exercise_log import ExerciseLog
+from app.models.trainee_daily_stat import TraineeDailyStat
+from app.models.workout_session import WorkoutSession
+from app.crud.async_crud import AsyncCRUD
+
+STAT_FIELDS = (
+    "log_count",
+    "total_volume_kg",
+    "max_weight_kg",
+    "weight_sum_kg",
+    "weighted_log_count",
+    "total_sets",
+    "total_reps",
+)
+
+
+def _empty_stats() -> dict[str, Any]:
+    return {
+        "log_count": 0,
+        "total_volume_kg": 0.0,
+        "max_weight_kg": None,
+        "weight_sum_kg": 0.0,
+        "weighted_log_count": 0,
+        "total_sets": 0,
+        "total_reps": 0,
+    }
+
+
+def _same(expected: Any, actual: Any) -> bool:
+    if expected is None or actual is None:
+        return expected is None and actual is None
+    return math.isclose(float(expected), float(actual), rel_tol=1e-9, abs_tol=1e-6)
+
+
+class CRUDTraineeDailyStat:
+    def get_by_trainee(self, db: Session, *, trainee_id: int):
+        return (
+            db.query(TraineeDailyStat)
+            .filter(TraineeDailyStat.trainee_id == trainee_id)
+            .order_by(TraineeDailyStat.session_date, TraineeDailyStat.exercise_id)
+            .all()
+        )
+
+    def add_logs(self, db: Session, *, session_id: Optional[int], logs: Iterable[Any]) -> None:
+        """Fold newly inserted logs of one session into the rollup (no commit)."""
+        session = db.get(WorkoutSession, session_id) if session_id is not None else None
+        if session is None or session.trainee_id is None:
+            return
+
+        deltas: dict[int, dict[str, Any]] = {}
+        for log in logs:
+            if log.exercise_id is None:
+                continue
+            delta = deltas.setdefault(log.exercise_id, _empty_stats())
+            weight = log.completed_weight_kg
+            delta["log_count"] += 1
+            delta["total_volume_kg"] += log.volume_kg or 0.0
+            delta["total_sets"] += log.completed_sets or 0
+            delta["total_reps"] += log.completed_reps or 0
+            if weight is not None:
+                delta["weight_sum_kg"] += weight
+                delta["weighted_log_count"] += 1
+                if delta["max_weight_kg"] is None or weight > delta["max_weight_kg"]:
+                    delta["max_weight_kg"] = weight
+        if not deltas:
+            return
+
+        existing = {
+            stat.exercise_id: stat
+            for stat in db.query(TraineeDailyStat).filter(
+                TraineeDailyStat.trainee_id == session.trainee_id,
+                TraineeDailyStat.session_date == session.session_date,
+                TraineeDailyStat.exercise_id.in_(list(deltas)),
+            )
+        }
+        for exercise_id, delta in deltas.items():
+            stat = existing.get(exercise_id)
+            if stat is None:
+                db.add(TraineeDailyStat(
+                    trainee_id=session.trainee_id,
+                    session_date=session.session_date,
+                    exercise_id=exercise_id,
+                    **delta,
+                ))
+                continue
+            stat.log_count += delta["log_count"]
+            stat.total_volume_kg += delta["total_volume_kg"]
+            stat.weight_sum_kg += delta["weight_sum_kg"]
+            stat.weighted_log_count += delta["weighted_log_count"]
+            stat.total_sets += delta["total_sets"]
+            stat.total_reps += delta["total_reps"]
+            if delta["max_weight_kg"] is not None and (
+                stat.max_weight_kg is None or delta["max_weight_kg"] > stat.max_weight_kg
+            ):
+                stat.max_weight_kg = delta["max_weight_kg"]
+        db.flush()
+
+    def recompute(self, db: Session, *, keys: Iterable[tuple[Optional[int], Optional[int]]]) -> None:
+        """Rebuild the buckets touched by ``(session_id, exercise_id)`` pairs from raw logs.
+
+        Used when logs are edited or deleted, where a running max cannot be
+        decremented incrementally. Pending changes are flushed first.
+        """
+        db.flush()
+        buckets: dict[tuple, set[int]] = {}
+        for session_id, exercise_id in keys:
+            if session_id is None or exercise_id is None:
+                continue
+            session = db.get(WorkoutSession, session_id)
+            if session is None or session.trainee_id is None:
+                continue
+            buckets.setdefault((session.trainee_id, session.session_date), set()).add(exercise_id)
+        self.recompute_buckets(db, buckets=buckets)
+
+    def recompute_buckets(self, db: Session, *, buckets: dict[tuple[int, date], set[int]]) -> None:
+        """Rebuild the given ``(trainee_id, session_date) -> exercise ids`` buckets from raw logs.
+
+        For callers that know buckets a session no longer maps to, e.g. after
+        its date or trainee changed. Pending changes are flushed first.
+        """
+        db.flush()
+        for (trainee_id, session_date), exercise_ids in buckets.items():
+            fresh = {
+                row.exercise_id: row
+                for row in self._aggregate_logs(db)
+                .filter(
+                    WorkoutSession.trainee_id == trainee_id,
+                    WorkoutSession.session_date == session_date,
+                    ExerciseLog.exercise_id.in_(exercise_ids),
+                )
+                .all()
+            }
+            existing = {
+                stat.exercise_id: stat
+                for stat in db.query(TraineeDailyStat).filter(
+                    TraineeDailyStat.trainee_id == trainee_id,
+                    TraineeDailyStat.session_date == session_date,
+                    TraineeDailyStat.exercise_id.in_(exercise_ids),
+                )
+            }
+            for exercise_id in exercise_ids:
+                row = fresh.get(exercise_id)
+                stat = existing.get(exercise_id)
+                if row is None:
+                    if stat is not None:
+                        db.delete(stat)
+                    continue
+                if stat is None:
+                    stat = TraineeDailyStat(
+                        trainee_id=trainee_id,
+                        session_date=session_date,
+                        exercise_id=exercise_id,
+                    )
+                    db.add(stat)
+                for field in STAT_FIELDS:
+                    setattr(stat, field, getattr(row, field))
+        db.flush()
+
+    def backfill(self, db: Session, *, trainee_id: Optional[int] = None) -> int:
+        """Rebuild the rollup from raw logs, for everyone or a single trainee."""
+        clear = delete(TraineeDailyStat)
+        source = self._aggregate_logs(db)
+        if trainee_id is not None:
+            clear = clear.where(TraineeDailyStat.trainee_id == trainee_id)
+            source = source.filter(WorkoutSession.trainee_id == trainee_id)
+        db.execute(clear)
+        db.execute(
+            insert(TraineeDailyStat).from_select(
+                ["trainee_id", "session_date", "exercise_id", *STAT_FIELDS],
+                source.statement,
+            )
+        )
+        db.commit()
+        count = db.query(func.count()).select_from(TraineeDailyStat)
+        if trainee_id is not None:
+            count = count.filter(TraineeDailyStat.trainee_id == trainee_id)
+        return count.scalar() or 0
+
+    def find_inconsistencies(self, db: Session, *, trainee_id: Optional[int] = None) -> list[dict[str, Any]]:
+        """Compare the rollup with an aggregate over raw logs.
+
+        Returns one entry per mismatching bucket; an empty list means the
+        rollup is consistent.
+        """
+        raw_query = self._aggregate_logs(db)
+        stored_query = db.query(TraineeDailyStat)
+        if trainee_id is not None:
+            raw_query = raw_query.filter(WorkoutSession.trainee_id == trainee_id)
+            stored_query = stored_query.filter(TraineeDailyStat.trainee_id == trainee_id)
+
+        raw = {(row.trainee_id, row.session_date, row.exercise_id): row for row in raw_query.all()}
+        stored = {(stat.trainee_id, stat.session_date, stat.exercise_id): stat for stat in stored_query.all()}
+
+        problems = []
+        for key in sorted(set(raw) | set(stored), key=lambda k: (k[0], k[1], k[2])):
+            expected = raw.get(key)
+            actual = stored.get(key)
+            if expected is None or actual is None:
+                problems.append({
+                    "trainee_id": key[0],
+                    "session_date": key[1].isoformat(),
+                    "exercise_id": key[2],
+                    "problem": "missing from rollup" if actual is None else "no matching logs",
+                })
+                continue
+            fields = [
+                field for field in STAT_FIELDS
+                if not _same(getattr(expected, field), getattr(actual, field))
+            ]
+            if fields:
+                problems.append({
+                    "trainee_id": key[0],
+                    "session_date": key[1].isoformat(),
+                    "exercise_id": key[2],
+                    "problem": "mismatch",
+                    "fields": {
+                        field: {"expected": getattr(expected, field), "actual": getattr(actual, field)}
+                        for field in fields
+                    },
+                })
+        return problems
+
+    def _aggregate_logs(self, db: Session):
+        """Raw-log aggregate with the same shape as a rollup row."""
+        return (
+            db.query(
+                WorkoutSession.trainee_id.label("trainee_id"),
+                WorkoutSession.session_date.label("session_date"),
+                ExerciseLog.exercise_id.label("exercise_id"),
+                func.count(ExerciseLog.id).label("log_count"),
+                func.coalesce(func.sum(ExerciseLog.volume_kg), 0.0).label("total_volume_kg"),
+                func.max(ExerciseLog.completed_weight_kg).label("max_weight_kg"),
+                func.coalesce(func.sum(ExerciseLog.completed_weight_kg), 0.0).label("weight_sum_kg"),
+                func.count(ExerciseLog.completed_weight_kg).label("weighted_log_count"),
+                func.coalesce(func.sum(ExerciseLog.completed_sets), 0).label("total_sets"),
+                func.coalesce(func.sum(ExerciseLog.completed_reps), 0).label("total_reps"),
+            )
+            .join(WorkoutSession, ExerciseLog.session_id == WorkoutSession.id)
+            .filter(WorkoutSession.trainee_id.isnot(None), ExerciseLog.exercise_id.isnot(None))
+            .group_by(WorkoutSession.trainee_id, WorkoutSession.session_date, ExerciseLog.exercise_id)
+        )
+
+
+trainee_daily_stat = CRUDTraineeDailyStat()
+async_trainee_daily_stat = AsyncCRUD(trainee_daily_stat)
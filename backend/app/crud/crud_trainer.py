@@ -1,10 +1,16 @@
+from typing import Optional
 from sqlalchemy.orm import Session
 
 from app.models.trainer import Trainer
 from app.schemas.trainer import TrainerCreate, TrainerUpdate
+from app.crud.async_crud import AsyncCRUD
+from app.crud.pagination import paginate
 
 
 class CRUDTrainer:
+    # Trainers created by admin get a default password
+    DEFAULT_PASSWORD = "TrainerPassword123!"
+
     def get(self, db: Session, id: int):
         return db.query(Trainer).filter(Trainer.id == id).first()
 
@@ -14,16 +20,19 @@ class CRUDTrainer:
     def get_multi(self, db: Session, skip: int = 0, limit: int = 100):
         return db.query(Trainer).offset(skip).limit(limit).all()
 
-    def create(self, db: Session, *, obj_in: TrainerCreate):
+    def get_page(self, db: Session, *, cursor: Optional[str] = None, limit: int = 100):
+        """Keyset-paginated ``get_multi`` ordered by id; returns ``(items, next_cursor)``."""
+        return paginate(db.query(Trainer), id_column=Trainer.id, cursor=cursor, limit=limit)
+
+    def create(self, db: Session, *, obj_in: TrainerCreate, hashed_password: Optional[str] = None):
+        """Pass ``hashed_password`` when it was already computed (e.g. with ``hash_async``)."""
         from app.models.user import User, UserRole
-        from app.auth.token import get_password_hash
+        from app.auth.hashing import password_hasher
         
         # 1. Create User
-        # Trainers created by admin get a default password
-        password = "TrainerPassword123!" 
         db_user = User(
             email=obj_in.email,
-            hashed_password=get_password_hash(password),
+            hashed_password=hashed_password or password_hasher.hash(self.DEFAULT_PASSWORD),
             role=UserRole.TRAINER
         )
         db.add(db_user)
@@ -67,3 +76,4 @@ class CRUDTrainer:
 
 
 trainer = CRUDTrainer()
+async_trainer = AsyncCRUD(trainer)
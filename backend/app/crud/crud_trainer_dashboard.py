@@ -0,0 +1,250 @@
+"""Read-only aggregate queries backing the trainer dashboard.
+
+Every method here answers a whole dashboard widget with a fixed number of
+statements, independent of how many clients a trainer has.
+"""
+from datetime import date, timedelta
+from typing import Any, Optional
+
+from sqlalchemy import and_, case, desc, distinct, func
+from sqlalchemy.orm import Session, joinedload
+
+from app.models.exercise_log import ExerciseLog
+from app.models.program import Program
+from app.models.trainee import Trainee
+from app.models.user import User
+from app.models.workout_session import WorkoutSession
+from app.crud.async_crud import AsyncCRUD
+
+# Expected cadence used for adherence: 12 workouts per 30 days (3/week)
+EXPECTED_WORKOUTS_PER_MONTH = 12
+
+
+def adherence_rate(recent_workouts: int) -> float:
+    """Percentage of the expected monthly workouts actually logged."""
+    if not recent_workouts:
+        return 0.0
+    return round((recent_workouts / EXPECTED_WORKOUTS_PER_MONTH) * 100, 1)
+
+
+class CRUDTrainerDashboard:
+    def get_roster(
+        self,
+        db: Session,
+        *,
+        trainer_id: Optional[int],
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[dict[str, Any]]:
+        """Return one page of clients with their workout metrics in a single query.
+
+        ``trainer_id=None`` lists every trainee (admin view).
+        """
+        thirty_days_ago = date.today() - timedelta(days=30)
+
+        page_ids = db.query(Trainee.id)
+        if trainer_id is not None:
+            page_ids = page_ids.filter(Trainee.trainer_id == trainer_id)
+        page_ids = page_ids.order_by(Trainee.id).offset(skip).limit(limit)
+
+        # Aggregate sessions for the requested page only, grouped per trainee
+        stats = (
+            db.query(
+                WorkoutSession.trainee_id.label("trainee_id"),
+                func.sum(case((WorkoutSession.status == "completed", 1), else_=0)).label("total_workouts"),
+                func.max(WorkoutSession.session_date).label("last_workout_date"),
+                func.sum(case((WorkoutSession.session_date >= thirty_days_ago, 1), else_=0)).label("recent_workouts"),
+            )
+            .filter(WorkoutSession.trainee_id.in_(page_ids.subquery().select()))
+            .group_by(WorkoutSession.trainee_id)
+            .subquery()
+        )
+
+        query = (
+            db.query(
+                Trainee.id,
+                Trainee.first_name,
+                Trainee.last_name,
+                User.email,
+                Trainee.program_id,
+                Program.name.label("program_name"),
+                Trainee.created_at,
+                stats.c.total_workouts,
+                stats.c.last_workout_date,
+                stats.c.recent_workouts,
+            )
+            .outerjoin(User, User.id == Trainee.user_id)
+            .outerjoin(Program, Program.id == Trainee.program_id)
+            .outerjoin(stats, stats.c.trainee_id == Trainee.id)
+        )
+        if trainer_id is not None:
+            query = query.filter(Trainee.trainer_id == trainer_id)
+        rows = query.order_by(Trainee.id).offset(skip).limit(limit).all()
+
+        clients = []
+        for row in rows:
+            recent_workouts = row.recent_workouts or 0
+            clients.append({
+                "id": row.id,
+                "first_name": row.first_name,
+                "last_name": row.last_name,
+                "email": row.email,
+                "program_id": row.program_id,
+                "program_name": row.program_name or "No program assigned",
+                "total_workouts": row.total_workouts or 0,
+                "last_workout_date": row.last_workout_date.isoformat() if row.last_workout_date else None,
+                "workouts_last_30_days": recent_workouts,
+                "adherence_rate": adherence_rate(recent_workouts),
+                "created_at": row.created_at.isoformat() if row.created_at else None,
+            })
+        return clients
+
+    def get_client(self, db: Session, *, client_id: int) -> Optional[Trainee]:
+        """Load a trainee with the user and program that ``get_client_progress`` reports."""
+        return (
+            db.query(Trainee)
+            .options(joinedload(Trainee.user), joinedload(Trainee.program))
+            .filter(Trainee.id == client_id)
+            .first()
+        )
+
+    def get_client_progress(self, db: Session, *, trainee: Trainee, days: int) -> dict[str, Any]:
+        """Progress report for one client in two statements.
+
+        ``trainee`` should come from ``get_client`` on the same session, so
+        its user and program are already loaded. Every figure except the
+        recent sessions covers the last ``days`` days.
+        """
+        client_id = trainee.id
+        cutoff_date = date.today() - timedelta(days=days)
+
+        # Workout frequency, volume trend and summary from one per-day aggregate
+        daily = (
+            db.query(
+                WorkoutSession.session_date,
+                func.count(distinct(WorkoutSession.id)).label("count"),
+                func.count(distinct(case((WorkoutSession.status == "completed", WorkoutSession.id)))).label("completed"),
+                func.count(ExerciseLog.id).label("log_count"),
+                func.sum(ExerciseLog.volume_kg).label("total_volume"),
+            )
+            .outerjoin(ExerciseLog, WorkoutSession.id == ExerciseLog.session_id)
+            .filter(WorkoutSession.trainee_id == client_id)
+            .filter(WorkoutSession.session_date >= cutoff_date)
+            .group_by(WorkoutSession.session_date)
+            .order_by(WorkoutSession.session_date)
+            .all()
+        )
+        workout_frequency = [
+            {"date": str(day.session_date), "count": day.count}
+            for day in daily
+        ]
+        # Only days with logged exercises have a volume
+        volume_trend = [
+            {"date": str(day.session_date), "volume_kg": float(day.total_volume or 0)}
+            for day in daily
+            if day.log_count
+        ]
+        total_volume = sum(point["volume_kg"] for point in volume_trend)
+        total_workouts = sum(day.completed for day in daily)
+
+        # Recent sessions (last 10) with their exercise counts
+        recent = (
+            db.query(WorkoutSession.id, WorkoutSession.session_date, WorkoutSession.status)
+            .filter(WorkoutSession.trainee_id == client_id)
+            .order_by(desc(WorkoutSession.session_date), desc(WorkoutSession.id))
+            .limit(10)
+            .subquery()
+        )
+        recent_sessions = (
+            db.query(
+                recent.c.id,
+                recent.c.session_date,
+                recent.c.status,
+                func.count(ExerciseLog.id).label("exercise_count"),
+            )
+            .outerjoin(ExerciseLog, ExerciseLog.session_id == recent.c.id)
+            .group_by(recent.c.id, recent.c.session_date, recent.c.status)
+            .order_by(desc(recent.c.session_date), desc(recent.c.id))
+            .all()
+        )
+        sessions_list = [
+            {
+                "id": session.id,
+                "date": session.session_date.isoformat(),
+                "status": session.status,
+                "exercise_count": session.exercise_count
+            }
+            for session in recent_sessions
+        ]
+
+        return {
+            "client": {
+                "id": trainee.id,
+                "name": f"{trainee.first_name} {trainee.last_name}",
+                "email": trainee.email,
+                "program": trainee.program.name if trainee.program else None
+            },
+            "summary": {
+                "total_workouts": total_workouts,
+                "total_volume_kg": float(total_volume),
+                "timeframe_days": days
+            },
+            "workout_frequency": workout_frequency,
+            "volume_trend": volume_trend,
+            "recent_sessions": sessions_list
+        }
+
+    def get_dashboard_stats(self, db: Session, *, trainer_id: Optional[int]) -> dict[str, Any]:
+        """Headline numbers for a trainer's clients; ``trainer_id=None`` covers every trainee (admin view).
+
+        Two statements whatever the roster size: client figures come from one
+        grouped query over the trainer's clients' last 30 days of sessions,
+        and programs are counted separately.
+        """
+        seven_days_ago = date.today() - timedelta(days=7)
+        thirty_days_ago = date.today() - timedelta(days=30)
+
+        # One row per client with their sessions in the adherence window
+        per_client = (
+            db.query(
+                func.count(WorkoutSession.id).label("recent_workouts"),
+                func.max(WorkoutSession.session_date).label("last_workout_date"),
+            )
+            .select_from(Trainee)
+            .outerjoin(
+                WorkoutSession,
+                and_(WorkoutSession.trainee_id == Trainee.id, WorkoutSession.session_date >= thirty_days_ago),
+            )
+        )
+        if trainer_id is not None:
+            per_client = per_client.filter(Trainee.trainer_id == trainer_id)
+        per_client = per_client.group_by(Trainee.id).subquery()
+
+        clients = db.query(
+            func.count().label("total_clients"),
+            # Active: worked out in the last 7 days
+            func.count(case((per_client.c.last_workout_date >= seven_days_ago, 1))).label("active_clients"),
+            func.coalesce(func.sum(per_client.c.recent_workouts), 0).label("recent_workouts"),
+        ).one()
+
+        programs = db.query(func.count(Program.id))
+        if trainer_id is not None:
+            programs = programs.filter(Program.trainer_id == trainer_id)
+        total_programs = programs.scalar() or 0
+
+        # Mean of each client's adherence rate, unrounded per client
+        avg_adherence = (
+            round(clients.recent_workouts / EXPECTED_WORKOUTS_PER_MONTH * 100 / clients.total_clients, 1)
+            if clients.total_clients else 0.0
+        )
+
+        return {
+            "total_clients": clients.total_clients,
+            "active_clients": clients.active_clients,
+            "total_programs": total_programs,
+            "average_adherence_rate": avg_adherence
+        }
+
+
+trainer_dashboard = CRUDTrainerDashboard()
+async_trainer_dashboard = AsyncCRUD(trainer_dashboard)
@@ -6,13 +6,19 @@
     back to enums on response (via orm_mode).
 
 NOTE:
-- Consider using an async database driver for improved performance.
-- Consider eager loading relationships (joinedload) for heavy read endpoints.
+- ``async_workout_session`` exposes the same methods for async endpoints.
+- Reads eager-load what the ``WorkoutSession`` schema embeds (logs and their
+    exercises), so a page of sessions costs a fixed number of statements.
 """
 from typing import Optional, Union
 from datetime import date
-from sqlalchemy.orm import Session
+from sqlalchemy import func, insert, literal, select, true
+from sqlalchemy.orm import Session, selectinload
 
+from app.db.base_class import new_row_version
+from app.models.exercise import Exercise
+from app.models.exercise_log import ExerciseLog
+from app.models.program_exercise import ProgramExercise
 from app.models.workout_session import WorkoutSession
 from app.schemas.enums import WorkoutSessionStatus
 from app.schemas.workout_session import (
@@ -20,22 +26,59 @@ from app.schemas.workout_session import (
         WorkoutSessionUpdate,
         WorkoutSessionBase,
 )
+from app.crud.crud_trainee_daily_stat import trainee_daily_stat as crud_trainee_daily_stat
+from app.crud.crud_personal_record import personal_record as crud_personal_record
+from app.crud.async_crud import AsyncCRUD
+from app.crud.pagination import paginate
+
+
+# Logs in one extra SELECT ... WHERE session_id IN (...), joined to their exercise
+WITH_LOGS = selectinload(WorkoutSession.exercise_logs).joinedload(ExerciseLog.exercise)
 
 
 class CRUDWorkoutSession:
     def get(self, db: Session, id: int) -> Optional[WorkoutSession]:
-        return db.query(WorkoutSession).filter(WorkoutSession.id == id).first()
+        return db.query(WorkoutSession).options(WITH_LOGS).filter(WorkoutSession.id == id).first()
+
+    def get_versions(self, db: Session, *, id: int) -> list[tuple]:
+        """Version key of a session as returned by ``get``, without loading it.
+
+        One ``(trainee_id, session version, log id, log version, exercise
+        version)`` row per exercise log (log fields are None when there are
+        none); empty if the session does not exist.
+        """
+        query = (
+            db.query(
+                WorkoutSession.trainee_id,
+                WorkoutSession.version_id,
+                ExerciseLog.id,
+                ExerciseLog.version_id,
+                Exercise.version_id,
+            )
+            .outerjoin(ExerciseLog, ExerciseLog.session_id == WorkoutSession.id)
+            .outerjoin(Exercise, Exercise.id == ExerciseLog.exercise_id)
+            .filter(WorkoutSession.id == id)
+            .order_by(ExerciseLog.id)
+        )
+        return [tuple(row) for row in query]
 
     def get_multi(self, db: Session, skip: int = 0, limit: int = 100):
-        # NOTE: Consider using joinedload for trainee/program if needed to reduce N+1 queries.
-        return db.query(WorkoutSession).offset(skip).limit(limit).all()
+        return db.query(WorkoutSession).options(WITH_LOGS).offset(skip).limit(limit).all()
+
+    def get_page(self, db: Session, *, cursor: Optional[str] = None, limit: int = 100):
+        """Keyset-paginated ``get_multi`` ordered by id; returns ``(items, next_cursor)``."""
+        return paginate(db.query(WorkoutSession).options(WITH_LOGS), id_column=WorkoutSession.id, cursor=cursor, limit=limit)
 
     def get_multi_by_trainee(
-        self, db: Session, *, trainee_id: int, skip: int = 0, limit: int = 100
+        self, db: Session, *, trainee_id: int, skip: int = 0, limit: int = 100, summary: bool = False
     ):
-        """Get all workout sessions for a specific trainee, ordered by date descending."""
+        """Get all workout sessions for a specific trainee, ordered by date descending.
+
+        With ``summary``, ``WorkoutSessionSummary``-shaped rows (log count and
+        volume aggregated in SQL) instead of objects with their logs.
+        """
         return (
-            db.query(WorkoutSession)
+            self._query(db, summary)
             .filter(WorkoutSession.trainee_id == trainee_id)
             .order_by(WorkoutSession.session_date.desc())
             .offset(skip)
@@ -43,6 +86,35 @@ class CRUDWorkoutSession:
             .all()
         )
 
+    def get_page_by_trainee(
+        self, db: Session, *, trainee_id: int, cursor: Optional[str] = None, limit: int = 100, summary: bool = False
+    ):
+        """Keyset-paginated ``get_multi_by_trainee``: newest first by (session_date, id)."""
+        return paginate(
+            self._query(db, summary).filter(WorkoutSession.trainee_id == trainee_id),
+            sort_column=WorkoutSession.session_date,
+            id_column=WorkoutSession.id,
+            descending=True,
+            cursor=cursor,
+            limit=limit,
+        )
+
+    def _query(self, db: Session, summary: bool):
+        if not summary:
+            return db.query(WorkoutSession).options(WITH_LOGS)
+        return (
+            db.query(
+                WorkoutSession.id,
+                WorkoutSession.program_id,
+                WorkoutSession.session_date,
+                WorkoutSession.status,
+                func.count(ExerciseLog.id).label("log_count"),
+                func.coalesce(func.sum(ExerciseLog.volume_kg), 0.0).label("total_volume_kg"),
+            )
+            .outerjoin(ExerciseLog, ExerciseLog.session_id == WorkoutSession.id)
+            .group_by(WorkoutSession.id)
+        )
+
     def create(
         self,
         db: Session,
@@ -74,6 +146,7 @@ class CRUDWorkoutSession:
         update_data = obj_in if isinstance(obj_in, dict) else obj_in.dict(exclude_unset=True)
         from typing import Any as _Any
         _obj: _Any = db_obj
+        old_bucket = (db_obj.trainee_id, db_obj.session_date)
         for field, value in update_data.items():
             if field == "status" and isinstance(value, WorkoutSessionStatus):
                 setattr(_obj, field, value.value)
@@ -81,6 +154,73 @@ class CRUDWorkoutSession:
             if hasattr(_obj, field):
                 setattr(_obj, field, value)
         db.add(db_obj)
+        new_bucket = (db_obj.trainee_id, db_obj.session_date)
+        if new_bucket != old_bucket:
+            # The session's logs moved to another trainee and/or day
+            self._recompute_rollups(db, exercise_ids=self._exercise_ids(db, db_obj.id), buckets=[old_bucket, new_bucket])
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
+
+    def auto_complete(self, db: Session, *, db_obj: WorkoutSession) -> Optional[WorkoutSession]:
+        """Log every prescribed exercise of the session's program and mark it completed.
+
+        One INSERT ... SELECT copies the prescriptions into exercise_logs, and
+        the rollup, personal records and status flip share its transaction, so
+        the session is either fully logged or untouched. Returns None (nothing written) when
+        the program has no exercises.
+        """
+        sets = func.coalesce(ProgramExercise.prescribed_sets, 0)
+        reps = func.coalesce(ProgramExercise.prescribed_reps, 0)
+        weight = func.coalesce(ProgramExercise.prescribed_weight_kg, 0.0)
+        prescriptions = (
+            select(
+                literal(db_obj.id),
+                ProgramExercise.exercise_id,
+                sets,
+                reps,
+                weight,
+                ProgramExercise.prescribed_duration_minutes,
+                sets * reps * weight,
+                true(),
+                # INSERT ... SELECT skips Python-side defaults; one version per statement
+                literal(new_row_version()),
+            )
+            .where(ProgramExercise.program_id == db_obj.program_id)
+            .order_by(ProgramExercise.order, ProgramExercise.id)
+        )
+        stmt = (
+            insert(ExerciseLog)
+            .from_select(
+                [
+                    "session_id",
+                    "exercise_id",
+                    "completed_sets",
+                    "completed_reps",
+                    "completed_weight_kg",
+                    "completed_duration_minutes",
+                    "volume_kg",
+                    "is_completed",
+                    "version_id",
+                ],
+                prescriptions,
+            )
+            .returning(
+                ExerciseLog.id,
+                ExerciseLog.exercise_id,
+                ExerciseLog.completed_sets,
+                ExerciseLog.completed_reps,
+                ExerciseLog.completed_weight_kg,
+                ExerciseLog.volume_kg,
+            )
+        )
+        logged = db.execute(stmt).all()
+        if not logged:
+            return None
+        crud_trainee_daily_stat.add_logs(db, session_id=db_obj.id, logs=logged)
+        crud_personal_record.add_logs(db, session_id=db_obj.id, logs=logged)
+        db_obj.status = WorkoutSessionStatus.COMPLETED.value
+        db.add(db_obj)
         db.commit()
         db.refresh(db_obj)
         return db_obj
@@ -89,9 +229,29 @@ class CRUDWorkoutSession:
         obj = db.query(WorkoutSession).get(id)
         if obj is None:
             return None
+        exercise_ids = self._exercise_ids(db, id)
         db.delete(obj)
+        # Its logs no longer count towards the trainee's rollup and records
+        self._recompute_rollups(db, exercise_ids=exercise_ids, buckets=[(obj.trainee_id, obj.session_date)])
         db.commit()
         return obj
 
+    def _exercise_ids(self, db: Session, session_id: int) -> set[int]:
+        return {
+            exercise_id
+            for (exercise_id,) in db.query(ExerciseLog.exercise_id)
+            .filter(ExerciseLog.session_id == session_id, ExerciseLog.exercise_id.isnot(None))
+            .distinct()
+        }
+
+    def _recompute_rollups(self, db: Session, *, exercise_ids: set[int], buckets: list[tuple]) -> None:
+        """Rebuild daily stats and personal records for ``(trainee_id, session_date)`` buckets."""
+        buckets = [(trainee_id, day) for trainee_id, day in buckets if trainee_id is not None]
+        if not exercise_ids or not buckets:
+            return
+        crud_trainee_daily_stat.recompute_buckets(db, buckets={bucket: exercise_ids for bucket in buckets})
+        crud_personal_record.recompute_trainees(db, touched={trainee_id: exercise_ids for trainee_id, _ in buckets})
+
 
-workout_session = CRUDWorkoutSession()
\ No newline at end of file
+workout_session = CRUDWorkoutSession()
+async_workout_session = AsyncCRUD(workout_session)
@@ -0,0 +1,159 @@
+"""
+In-process catalog of the exercise library for autocomplete.
+
+Every exercise is held in memory together with a sorted index of the
+suffixes of its normalised name that start at a word boundary, so a prefix
+lookup is a binary search plus a scan over the matches and issues no SQL.
+
+The catalog loads at startup (or on first use) and is marked stale whenever
+an Exercise row is flushed as inserted, updated or deleted, and again after
+that transaction commits; the next lookup reloads it with one query. Other
+worker processes converge within ``EXERCISE_CATALOG_TTL_SECONDS``.
+"""
+import re
+import threading
+import time
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from app.core.cache import register_cache
+from app.core.config import settings
+from app.models.exercise import Exercise
+
+_PENDING_REFRESH = "exercise_catalog_refresh"
+
+# Ranks, best first: whole name, start of the name, start of a later word
+EXACT, NAME_PREFIX, WORD_PREFIX = range(3)
+
+
+def normalize(text: str) -> str:
+    """Casefold and reduce punctuation/whitespace runs to single spaces ("Pull-Up" -> "pull up")."""
+    return " ".join(re.findall(r"\w+", text.casefold()))
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    id: int
+    name: str
+    description: Optional[str] = None
+    video_url: Optional[str] = None
+
+
+class _Index:
+    """Immutable snapshot; swapped in whole so readers never see a partial build."""
+
+    def __init__(self, entries: list[CatalogEntry]) -> None:
+        self.entries = entries
+        self.names = [normalize(entry.name) for entry in entries]
+        keys = []
+        for position, name in enumerate(self.names):
+            for match in re.finditer(r"\w+", name):
+                keys.append((name[match.start():], position))
+        keys.sort()
+        self.keys = [key for key, _ in keys]
+        self.positions = [position for _, position in keys]
+
+    def search(self, prefix: str, limit: int) -> list[CatalogEntry]:
+        ranks: dict[int, int] = {}
+        i = bisect_left(self.keys, prefix)
+        while i < len(self.keys) and self.keys[i].startswith(prefix):
+            position = self.positions[i]
+            name = self.names[position]
+            if name == prefix:
+                rank = EXACT
+            elif len(self.keys[i]) == len(name):
+                rank = NAME_PREFIX
+            else:
+                rank = WORD_PREFIX
+            ranks[position] = min(rank, ranks.get(position, rank))
+            i += 1
+        best = sorted(ranks, key=lambda p: (ranks[p], len(self.names[p]), self.names[p], self.entries[p].id))
+        return [self.entries[position] for position in best[:limit]]
+
+
+class ExerciseCatalog:
+    def __init__(self, ttl: float = 300.0) -> None:
+        self.ttl = ttl
+        self._index: Optional[_Index] = None
+        self._loaded_at = 0.0
+        # Bumped on every invalidation so a load racing with a write is not kept as fresh
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.loads = 0
+
+    def load(self, db: Session) -> None:
+        generation = self._generation
+        rows = db.query(Exercise.id, Exercise.name, Exercise.description, Exercise.video_url).all()
+        index = _Index([CatalogEntry(*row) for row in rows])
+        with self._lock:
+            self._index = index
+            self.loads += 1
+            self._loaded_at = time.monotonic() if generation == self._generation else 0.0
+
+    def search(self, db: Session, q: str, *, limit: int = 20) -> list[CatalogEntry]:
+        """Exercises whose name, or a word in it, starts with ``q``; best matches first.
+
+        Exact names rank first, then names starting with ``q``, then names
+        with a later word starting with it; shorter names win ties.
+        """
+        prefix = normalize(q)
+        if not prefix or limit <= 0:
+            return []
+        if self._stale():
+            self.load(db)
+        else:
+            self.hits += 1
+        return self._index.search(prefix, limit)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._loaded_at = 0.0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._index = None
+            self._loaded_at = 0.0
+
+    def __len__(self) -> int:
+        index = self._index
+        return len(index.entries) if index is not None else 0
+
+    def stats(self) -> dict[str, Any]:
+        return {"size": len(self), "ttl_seconds": self.ttl, "hits": self.hits, "loads": self.loads}
+
+    def _stale(self) -> bool:
+        return self._index is None or not self._loaded_at or time.monotonic() - self._loaded_at >= self.ttl
+
+
+exercise_catalog = register_cache("exercise_catalog", ExerciseCatalog(ttl=settings.EXERCISE_CATALOG_TTL_SECONDS))
+
+
+@event.listens_for(Exercise, "after_insert")
+@event.listens_for(Exercise, "after_update")
+@event.listens_for(Exercise, "after_delete")
+def _exercise_changed(mapper, connection, target) -> None:
+    exercise_catalog.invalidate()
+    session = object_session(target)
+    if session is not None:
+        session.info[_PENDING_REFRESH] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    # A lookup may have reloaded the uncommitted state between flush and commit
+    if session.info.pop(_PENDING_REFRESH, False):
+        exercise_catalog.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _invalidate_after_rollback(session: Session) -> None:
+    # Unlike the other caches, a reload during the flush saw rows that are now gone
+    if session.info.pop(_PENDING_REFRESH, False):
+        exercise_catalog.invalidate()
@@ -0,0 +1,102 @@
+"""Keyset (cursor) pagination for list queries.
+
+Instead of ``OFFSET n``, which makes the database walk and discard ``n`` rows,
+each page continues strictly after the last row of the previous one:
+
+    WHERE (sort_key, id) < (:last_sort_key, :last_id) ORDER BY sort_key DESC, id DESC LIMIT :n
+
+so page N costs the same index seek as page 1. The cursor handed to clients is
+opaque (URL-safe base64 of the last row's key values).
+"""
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import func, literal, select, tuple_
+from sqlalchemy.orm import Query
+
+
+# Largest page a list endpoint serves
+MAX_PAGE_SIZE = 1000
+
+
+class InvalidCursorError(ValueError):
+    """Raised for cursors that were not produced by :func:`encode_cursor` for this listing."""
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    payload = [v.isoformat() if isinstance(v, (date, datetime)) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, python_types: Sequence[type]) -> list[Any]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if not isinstance(payload, list) or len(payload) != len(python_types):
+            raise ValueError("wrong arity")
+        values = []
+        for value, python_type in zip(payload, python_types):
+            if python_type is datetime:
+                values.append(datetime.fromisoformat(value))
+            elif python_type is date:
+                values.append(date.fromisoformat(value))
+            elif python_type is int and isinstance(value, int):
+                values.append(value)
+            elif python_type is str and isinstance(value, str):
+                values.append(value)
+            else:
+                raise ValueError("unexpected value type")
+        return values
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise InvalidCursorError("Invalid pagination cursor")
+
+
+def _after(sort_column: Any, id_column: Any, last_value: Any, last_id: int, descending: bool) -> Any:
+    # Compare against the stored key of the cursor row where it still exists:
+    # SQLite keeps CURRENT_TIMESTAMP and bound datetimes in different text
+    # formats, so re-binding a decoded datetime would not compare equal.
+    # The encoded value only matters if that row has since been deleted.
+    anchor = select(sort_column).where(id_column == last_id).correlate(None).scalar_subquery()
+    boundary = func.coalesce(anchor, literal(last_value, sort_column.type))
+    key = tuple_(sort_column, id_column)
+    bound = tuple_(boundary, literal(last_id))
+    return key < bound if descending else key > bound
+
+
+def paginate(
+    query: Query,
+    *,
+    id_column: Any,
+    sort_column: Any = None,
+    descending: bool = False,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+) -> tuple[list[Any], Optional[str]]:
+    """Return one page of ``query`` and the cursor for the next one (None on the last page).
+
+    Rows are ordered by ``(sort_column, id_column)``, or by ``id_column`` alone;
+    ``query`` must not already be ordered. An empty cursor starts at the top.
+    Raises ValueError if ``limit`` is less than 1.
+    """
+    if limit < 1:
+        raise ValueError(f"Page limit must be at least 1, got {limit}")
+    columns = [id_column] if sort_column is None else [sort_column, id_column]
+    if cursor:
+        values = decode_cursor(cursor, [column.type.python_type for column in columns])
+        if sort_column is None:
+            query = query.filter(id_column < values[0] if descending else id_column > values[0])
+        else:
+            query = query.filter(_after(sort_column, id_column, values[0], values[1], descending))
+
+    order = [column.desc() if descending else column.asc() for column in columns]
+    # One extra row tells whether another page exists without a COUNT
+    items = query.order_by(*order).limit(limit + 1).all()
+    if len(items) <= limit:
+        return items, None
+    items = items[:limit]
+    last = items[-1]
+    return items, encode_cursor([getattr(last, column.key) for column in columns])
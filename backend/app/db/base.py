@@ -11,3 +11,8 @@ from app.models.health_metric import HealthMetric
 from app.models.program_exercise import ProgramExercise
 from app.models.workout_session import WorkoutSession
 from app.models.exercise_log import ExerciseLog
+from app.models.trainee_daily_stat import TraineeDailyStat
+from app.models.personal_record import PersonalRecord
+from app.models.refresh_token import RefreshToken
+# Full-text search DDL, attached to Base.metadata
+from app.db import search
@@ -1,5 +1,19 @@
+import uuid
+from typing import Optional
+
 from sqlalchemy.ext.declarative import as_declarative, declared_attr
 
+
+def new_row_version(current: Optional[str] = None) -> str:
+    """Fresh value for a ``version_id`` column (also its mapper ``version_id_generator``).
+
+    Versioned rows get a new value on every UPDATE, which both guards against
+    lost updates and lets read endpoints derive ETags without loading rows.
+    Random rather than a counter, so a row recreated under a reused id never
+    repeats an old (id, version) pair.
+    """
+    return uuid.uuid4().hex
+
 @as_declarative()
 class Base:
     id: any
@@ -0,0 +1,53 @@
+"""
+Full-text search indexes over exercise and program names/descriptions.
+
+SQLite: one external-content FTS5 table per source table (``exercises_fts``,
+``programs_fts``) keyed by the source row id, kept in sync by triggers, so
+bulk statements and writes from other tools are indexed too. Only the
+inverted index is stored; the text stays in the source table.
+
+PostgreSQL: a GIN expression index over ``SEARCH_DOCUMENT``; queries must
+repeat that expression to use it.
+
+The statements are attached to ``Base.metadata`` so ``create_all`` builds
+them (tests, fresh databases); the alembic migration creates the same
+objects for existing ones.
+"""
+from sqlalchemy import DDL, event
+
+from app.db.base_class import Base
+
+# Source table -> FTS5 table
+SEARCH_TABLES = {"exercises": "exercises_fts", "programs": "programs_fts"}
+
+SEARCH_DOCUMENT = "to_tsvector('english', coalesce(name, '') || ' ' || coalesce(description, ''))"
+
+
+def is_search_table(name: str) -> bool:
+    """True for the FTS5 tables and their shadow tables, which have no model."""
+    return any(name == fts or name.startswith(f"{fts}_") for fts in SEARCH_TABLES.values())
+
+
+def sqlite_ddl(source: str, fts: str) -> list[str]:
+    columns = "name, description"
+    old = f"INSERT INTO {fts}({fts}, rowid, {columns}) VALUES ('delete', old.id, old.name, old.description);"
+    new = f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.id, new.name, new.description);"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({columns}, content='{source}', content_rowid='id', "
+        "tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {source} BEGIN {new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {source} BEGIN {old} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {columns} ON {source} BEGIN {old} {new} END",
+    ]
+
+
+def postgresql_ddl(source: str) -> list[str]:
+    return [f"CREATE INDEX IF NOT EXISTS ix_{source}_search ON {source} USING gin ({SEARCH_DOCUMENT})"]
+
+
+for _source, _fts in SEARCH_TABLES.items():
+    for _statement in sqlite_ddl(_source, _fts):
+        event.listen(Base.metadata, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+    for _statement in postgresql_ddl(_source):
+        event.listen(Base.metadata, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+    event.listen(Base.metadata, "before_drop", DDL(f"DROP TABLE IF EXISTS {_fts}").execute_if(dialect="sqlite"))
@@ -1,6 +1,108 @@
-from sqlalchemy import create_engine
+from typing import Any
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
-engine = create_engine(settings.SQLALCHEMY_DATABASE_URI, pool_pre_ping=True)
+
+def _is_memory_sqlite(url) -> bool:
+    database = url.database or ""
+    return database in ("", ":memory:") or url.query.get("mode") == "memory"
+
+
+def engine_options(database_uri: str) -> dict[str, Any]:
+    """Keyword arguments for ``create_engine`` derived from settings.
+
+    Pool sizing only applies to server databases; SQLite picks its own pool
+    class and serializes writers on the file lock regardless.
+    """
+    options: dict[str, Any] = {"pool_pre_ping": True}
+    url = make_url(database_uri)
+    if url.get_backend_name() == "sqlite":
+        # Python-level wait, matched to the busy_timeout pragma below
+        options["connect_args"] = {
+            "check_same_thread": False,
+            "timeout": settings.SQLITE_BUSY_TIMEOUT_MS / 1000,
+        }
+    else:
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+            pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        )
+    return options
+
+
+def _sqlite_pragmas(url) -> list[str]:
+    pragmas = [
+        f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}",
+        f"PRAGMA cache_size={settings.SQLITE_CACHE_SIZE}",
+    ]
+    if not _is_memory_sqlite(url):
+        # WAL lets readers proceed while one writer commits; NORMAL is durable
+        # across application crashes in WAL mode and skips an fsync per commit.
+        pragmas += [
+            "PRAGMA journal_mode=WAL",
+            "PRAGMA synchronous=NORMAL",
+            f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE}",
+        ]
+    return pragmas
+
+
+# Async drivers used when DB_ASYNC_ENABLED derives the async URL from the sync one
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def async_database_uri(database_uri: str) -> str:
+    url = make_url(database_uri)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for '{backend}' databases")
+    return url.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+
+def _install_sqlite_pragmas(db_engine: Engine) -> None:
+    pragmas = _sqlite_pragmas(db_engine.url)
+
+    @event.listens_for(db_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+def create_db_engine(database_uri: str) -> Engine:
+    db_engine = create_engine(database_uri, **engine_options(database_uri))
+    if db_engine.dialect.name == "sqlite":
+        _install_sqlite_pragmas(db_engine)
+    return db_engine
+
+
+def create_async_db_engine(database_uri: str) -> AsyncEngine:
+    """Async engine for ``database_uri`` (a sync URL), with the same pool and pragma settings."""
+    db_engine = create_async_engine(async_database_uri(database_uri), **engine_options(database_uri))
+    if db_engine.dialect.name == "sqlite":
+        _install_sqlite_pragmas(db_engine.sync_engine)
+    return db_engine
+
+
+def async_session_factory(db_engine: AsyncEngine) -> async_sessionmaker:
+    # Objects stay readable after commit; lazy loads cannot run outside run_sync
+    return async_sessionmaker(bind=db_engine, autoflush=False, expire_on_commit=False)
+
+
+engine = create_db_engine(settings.SQLALCHEMY_DATABASE_URI)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Only built when enabled so the async drivers stay optional for sync deployments
+async_engine = create_async_db_engine(settings.SQLALCHEMY_DATABASE_URI) if settings.DB_ASYNC_ENABLED else None
+AsyncSessionLocal = async_session_factory(async_engine) if async_engine is not None else None
@@ -1,4 +1,5 @@
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
@@ -6,9 +7,17 @@ from slowapi.errors import RateLimitExceeded
 from app.api.v1.api import api_router
 from app.core.config import settings
 from app.core.rate_limit import limiter
+from app.crud.pagination import InvalidCursorError
 from app.core.logging import setup_logging, request_id_ctx_var
+from app.auth import refresh_store
+from app.auth.hashing import password_hasher
+from app.crud.exercise_catalog import exercise_catalog
+from app.db.session import SessionLocal
+import asyncio
+import logging
 import uuid
 from fastapi import Request
+from sqlalchemy.exc import SQLAlchemyError
 
 setup_logging()
 
@@ -20,6 +29,44 @@ app = FastAPI(
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
+
+@app.exception_handler(InvalidCursorError)
+async def invalid_cursor_handler(request: Request, exc: InvalidCursorError):
+    return JSONResponse(status_code=400, content={"detail": str(exc)})
+
+
+@app.on_event("startup")
+def preload_exercise_catalog() -> None:
+    # Best effort: search loads the catalog itself if this fails
+    if not settings.EXERCISE_CATALOG_PRELOAD:
+        return
+    db = SessionLocal()
+    try:
+        exercise_catalog.load(db)
+    except SQLAlchemyError:
+        logging.getLogger(__name__).warning("Could not preload the exercise catalog", exc_info=True)
+    finally:
+        db.close()
+
+
+@app.on_event("startup")
+async def start_revoked_families_sync() -> None:
+    if settings.REVOKED_FAMILIES_SYNC_SECONDS > 0:
+        app.state.revoked_families_sync = asyncio.create_task(refresh_store.run_sync_loop(SessionLocal))
+
+
+@app.on_event("shutdown")
+def stop_password_hasher() -> None:
+    password_hasher.shutdown()
+
+
+@app.on_event("shutdown")
+async def stop_revoked_families_sync() -> None:
+    task = getattr(app.state, "revoked_families_sync", None)
+    if task is not None:
+        task.cancel()
+
+
 @app.middleware("http")
 async def request_id_middleware(request: Request, call_next):
     request_id = str(uuid.uuid4())
@@ -1,6 +1,6 @@
 from sqlalchemy import Column, Integer, String, Text
 from sqlalchemy.orm import relationship
-from app.db.base_class import Base
+from app.db.base_class import Base, new_row_version
 
 class Exercise(Base):
     __tablename__ = 'exercises'
@@ -10,5 +10,8 @@ class Exercise(Base):
     description = Column(Text, nullable=True)
     video_url = Column(String(255), nullable=True)
 
+    version_id = Column(String(32), nullable=False, default=new_row_version, server_default="0")
+    __mapper_args__ = {"version_id_col": version_id, "version_id_generator": new_row_version}
+
     programs = relationship("ProgramExercise", back_populates="exercise")
     exercise_logs = relationship("ExerciseLog", back_populates="exercise")
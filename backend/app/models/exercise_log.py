@@ -1,9 +1,13 @@
-from sqlalchemy import Column, Integer, Float, Boolean, DateTime, func, ForeignKey
+from sqlalchemy import Column, Integer, Float, Boolean, DateTime, String, func, ForeignKey, Index
 from sqlalchemy.orm import relationship
-from app.db.base_class import Base
+from app.db.base_class import Base, new_row_version
 
 class ExerciseLog(Base):
     __tablename__ = 'exercise_logs'
+    __table_args__ = (
+        # Covers session -> exercise joins and per-exercise max weight lookups
+        Index("ix_exercise_logs_session_id_exercise_id_weight", "session_id", "exercise_id", "completed_weight_kg"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     session_id = Column(Integer, ForeignKey("workout_sessions.id"), index=True)
@@ -16,5 +20,8 @@ class ExerciseLog(Base):
     is_completed = Column(Boolean, default=True)
     logged_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    version_id = Column(String(32), nullable=False, default=new_row_version, server_default="0")
+    __mapper_args__ = {"version_id_col": version_id, "version_id_generator": new_row_version}
+
     session = relationship("WorkoutSession", back_populates="exercise_logs")
     exercise = relationship("Exercise", back_populates="exercise_logs")
@@ -1,6 +1,6 @@
 from sqlalchemy import Column, Integer, String, DateTime, func
 from sqlalchemy.orm import relationship
-from app.db.base_class import Base
+from app.db.base_class import Base, new_row_version
 
 class Gym(Base):
     id = Column(Integer, primary_key=True, index=True)
@@ -8,5 +8,8 @@ class Gym(Base):
     address = Column(String(255), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    version_id = Column(String(32), nullable=False, default=new_row_version, server_default="0")
+    __mapper_args__ = {"version_id_col": version_id, "version_id_generator": new_row_version}
+
     trainers = relationship("Trainer", back_populates="gym")
     trainees = relationship("Trainee", back_populates="gym")
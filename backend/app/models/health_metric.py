@@ -1,9 +1,12 @@
-from sqlalchemy import Column, Integer, Float, DateTime, func, ForeignKey
+from sqlalchemy import Column, Integer, Float, DateTime, func, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.db.base_class import Base
 
 class HealthMetric(Base):
     __tablename__ = 'health_metrics'
+    __table_args__ = (
+        Index("ix_health_metrics_trainee_id_recorded_at", "trainee_id", "recorded_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     trainee_id = Column(Integer, ForeignKey("trainees.id"), index=True)
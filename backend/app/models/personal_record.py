@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Integer, Float, Date, String, ForeignKey
+from app.db.base_class import Base
+
+class PersonalRecord(Base):
+    """Best set per trainee, exercise and metric (see ``PersonalRecordMetric``).
+
+    Maintained on write by the exercise log CRUD layer alongside
+    ``trainee_daily_stats``, so reading PRs is a primary-key range lookup.
+    """
+    __tablename__ = 'personal_records'
+
+    trainee_id = Column(Integer, ForeignKey("trainees.id"), primary_key=True)
+    exercise_id = Column(Integer, ForeignKey("exercises.id"), primary_key=True)
+    metric = Column(String, primary_key=True)
+    value = Column(Float, nullable=False)
+    # The set that achieved the record. Not a foreign key: deleting that log
+    # flushes before the record is recomputed.
+    exercise_log_id = Column(Integer, nullable=False)
+    achieved_date = Column(Date, nullable=False)
+    weight_kg = Column(Float, nullable=True)
+    sets = Column(Integer, nullable=True)
+    reps = Column(Integer, nullable=True)
@@ -1,6 +1,6 @@
 from sqlalchemy import Column, Integer, String, DateTime, func, ForeignKey, Text
 from sqlalchemy.orm import relationship
-from app.db.base_class import Base
+from app.db.base_class import Base, new_row_version
 
 class Program(Base):
     __tablename__ = 'programs'
@@ -11,6 +11,9 @@ class Program(Base):
     trainer_id = Column(Integer, ForeignKey("trainers.id"))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    version_id = Column(String(32), nullable=False, default=new_row_version, server_default="0")
+    __mapper_args__ = {"version_id_col": version_id, "version_id_generator": new_row_version}
+
     trainer = relationship("Trainer", back_populates="programs")
     trainees = relationship("Trainee", back_populates="program")
     exercises = relationship("ProgramExercise", back_populates="program")
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, func
+from app.db.base_class import Base
+
+class RefreshToken(Base):
+    """One issued refresh token, identified by its ``jti`` claim.
+
+    Every token rotated from the same login shares a ``family_id``, which is
+    also embedded in the access tokens of that family. Presenting a token
+    that was already rotated revokes the whole family (see
+    ``app.auth.refresh_store``).
+    """
+    __tablename__ = 'refresh_tokens'
+
+    jti = Column(String(32), primary_key=True)
+    family_id = Column(String(32), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    # Naive UTC, like the token's exp claim
+    expires_at = Column(DateTime, nullable=False, index=True)
+    used_at = Column(DateTime, nullable=True)  # rotated into a successor
+    revoked_at = Column(DateTime, nullable=True, index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Integer, Float, Date, ForeignKey
+from app.db.base_class import Base
+
+class TraineeDailyStat(Base):
+    """Per-trainee, per-day, per-exercise rollup of exercise_logs.
+
+    Maintained on write by the exercise log CRUD layer so analytics never
+    rescan raw logs.
+    """
+    __tablename__ = 'trainee_daily_stats'
+
+    trainee_id = Column(Integer, ForeignKey("trainees.id"), primary_key=True)
+    session_date = Column(Date, primary_key=True)
+    exercise_id = Column(Integer, ForeignKey("exercises.id"), primary_key=True)
+    log_count = Column(Integer, nullable=False, default=0)
+    total_volume_kg = Column(Float, nullable=False, default=0.0)
+    max_weight_kg = Column(Float, nullable=True)
+    # Sum and count of non-null weights, for averaging without raw logs
+    weight_sum_kg = Column(Float, nullable=False, default=0.0)
+    weighted_log_count = Column(Integer, nullable=False, default=0)
+    total_sets = Column(Integer, nullable=False, default=0)
+    total_reps = Column(Integer, nullable=False, default=0)
@@ -1,6 +1,6 @@
 from sqlalchemy import Column, Integer, String, DateTime, func, ForeignKey
 from sqlalchemy.orm import relationship
-from app.db.base_class import Base
+from app.db.base_class import Base, new_row_version
 
 class Trainer(Base):
     __tablename__ = 'trainers'
@@ -23,6 +23,9 @@ class Trainer(Base):
     gym_id = Column(Integer, ForeignKey("gyms.id"))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    version_id = Column(String(32), nullable=False, default=new_row_version, server_default="0")
+    __mapper_args__ = {"version_id_col": version_id, "version_id_generator": new_row_version}
+
     user = relationship("User", back_populates="trainer_profile")
     gym = relationship("Gym", back_populates="trainers")
     programs = relationship("Program", back_populates="trainer")
@@ -1,9 +1,14 @@
-from sqlalchemy import Column, Integer, String, Date, ForeignKey
+from sqlalchemy import Column, Integer, String, Date, ForeignKey, Index
 from sqlalchemy.orm import relationship
-from app.db.base_class import Base
+from app.db.base_class import Base, new_row_version
 
 class WorkoutSession(Base):
     __tablename__ = 'workout_sessions'
+    __table_args__ = (
+        # Per-trainee date ranges (analytics, streaks, keyset pages) and status counts
+        Index("ix_workout_sessions_trainee_id_session_date", "trainee_id", "session_date"),
+        Index("ix_workout_sessions_trainee_id_status", "trainee_id", "status"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     trainee_id = Column(Integer, ForeignKey("trainees.id"), index=True)
@@ -11,6 +16,9 @@ class WorkoutSession(Base):
     session_date = Column(Date, nullable=False, index=True)
     status = Column(String, nullable=False)
 
+    version_id = Column(String(32), nullable=False, default=new_row_version, server_default="0")
+    __mapper_args__ = {"version_id_col": version_id, "version_id_generator": new_row_version}
+
     trainee = relationship("Trainee", back_populates="workout_sessions")
     program = relationship("Program", back_populates="workout_sessions")
     exercise_logs = relationship("ExerciseLog", back_populates="session")
@@ -4,3 +4,13 @@ class WorkoutSessionStatus(str, Enum):
     PLANNED = "planned"
     IN_PROGRESS = "in-progress"
     COMPLETED = "completed"
+
+class PersonalRecordMetric(str, Enum):
+    MAX_WEIGHT = "max_weight"
+    MAX_VOLUME = "max_volume"
+    ESTIMATED_1RM_EPLEY = "estimated_1rm_epley"
+    ESTIMATED_1RM_BRZYCKI = "estimated_1rm_brzycki"
+
+class ListView(str, Enum):
+    FULL = "full"
+    SUMMARY = "summary"
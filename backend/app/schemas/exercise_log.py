@@ -2,6 +2,7 @@ from pydantic import BaseModel, validator, Field
 from datetime import datetime
 from typing import Optional
 from .exercise import Exercise
+from .enums import PersonalRecordMetric
 from app.core.validation import validate_positive_number, validate_positive_integer
 
 # Shared properties
@@ -30,6 +31,15 @@ class ExerciseLogBase(BaseModel):
 class ExerciseLogCreate(ExerciseLogBase):
     pass
 
+# Upper bound on sets accepted by one bulk log request (a long session is ~50)
+MAX_BULK_EXERCISE_LOGS = 500
+
+# Properties to receive on bulk creation (whole session synced at once)
+class ExerciseLogBulkCreate(BaseModel):
+    logs: list[ExerciseLogCreate] = Field(
+        ..., min_length=1, max_length=MAX_BULK_EXERCISE_LOGS, description="Sets to log, in order"
+    )
+
 # Properties to receive on item update
 class ExerciseLogUpdate(BaseModel):
     session_id: Optional[int] = Field(None, ge=1)
@@ -63,6 +73,9 @@ class ExerciseLog(ExerciseLogBase):
     id: int
     logged_at: datetime
     exercise: Optional[Exercise] = None
+    new_personal_records: list[PersonalRecordMetric] = Field(
+        default_factory=list, description="Metrics in which this set is a new personal record (set on creation only)"
+    )
 
     class Config:
         orm_mode = True
@@ -81,3 +81,12 @@ class HealthMetric(HealthMetricBase):
 
     class Config:
         orm_mode = True
+
+# Row returned by list endpoints with ``view=summary``
+class HealthMetricSummary(BaseModel):
+    id: int
+    recorded_at: datetime
+    weight_kg: Optional[float] = None
+    body_fat_percentage: Optional[float] = None
+    skeletal_muscle_mass_kg: Optional[float] = None
+    bmi: Optional[float] = None
@@ -0,0 +1,11 @@
+from typing import Generic, Optional, TypeVar
+
+from pydantic import BaseModel, Field
+
+T = TypeVar("T")
+
+
+# Envelope returned by list endpoints when a ``cursor`` query parameter is sent
+class Page(BaseModel, Generic[T]):
+    items: list[T]
+    next_cursor: Optional[str] = Field(None, description="Pass as ?cursor= to fetch the next page; null on the last page")
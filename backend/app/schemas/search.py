@@ -0,0 +1,15 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+
+class SearchHit(BaseModel):
+    id: int
+    name: str
+    name_highlight: str = Field(..., description="HTML-escaped name with matched terms wrapped in <mark>")
+    description_snippet: Optional[str] = Field(None, description="HTML-escaped excerpt around the matches, or null without a description")
+    score: float = Field(..., description="Relevance; higher is better, comparable within one list only")
+
+
+class SearchResults(BaseModel):
+    exercises: List[SearchHit]
+    programs: List[SearchHit]
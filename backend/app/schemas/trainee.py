@@ -64,3 +64,12 @@ class Trainee(TraineeBase):
 
     class Config:
         orm_mode = True
+
+# Row returned by list endpoints with ``view=summary``
+class TraineeSummary(BaseModel):
+    id: int
+    first_name: str
+    last_name: str
+    email: Optional[str] = None
+    trainer_id: Optional[int] = None
+    program_id: Optional[int] = None
@@ -35,4 +35,12 @@ class WorkoutSession(WorkoutSessionInDBBase):
 
 # Properties stored in DB
 class WorkoutSessionInDB(WorkoutSessionInDBBase):
-    pass
\ No newline at end of file
+    pass
+# Row returned by list endpoints with ``view=summary``
+class WorkoutSessionSummary(BaseModel):
+    id: int
+    program_id: Optional[int] = None
+    session_date: date
+    status: WorkoutSessionStatus
+    log_count: int = Field(..., description="Number of exercise logs in the session")
+    total_volume_kg: float = Field(..., description="Sum of the logs' volume_kg")
@@ -0,0 +1,54 @@
+"""
+Microbenchmark: access-token verification throughput per JWT backend.
+
+For every backend in app.auth.jwt_backends that can be loaded here, times
+--iterations decodes of a freshly issued access token, then times the
+cached path of decode_token for comparison. Backends whose optional package
+is missing (PyJWT) are reported as skipped.
+
+Run:
+  python -m app.scripts.bench_jwt_decode [--iterations 20000]
+"""
+import argparse
+import sys
+import time
+
+from app.auth import token as auth_token
+from app.auth.jwt_backends import BACKENDS, get_backend
+from app.core.config import settings
+
+
+def _rate(fn, token: str, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn(token)
+    return iterations / (time.perf_counter() - started)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20000, help="Decodes per measurement")
+    args = parser.parse_args()
+
+    token = auth_token.create_access_token(1, token_version=0)
+    print(f"{settings.ALGORITHM}, {len(token)}-byte token, {args.iterations} decodes each")
+    baseline = None
+    for name in BACKENDS:
+        try:
+            backend = get_backend(name, settings.SECRET_KEY, settings.ALGORITHM)
+        except (RuntimeError, ValueError) as exc:
+            print(f"  {name:<8} skipped: {exc}")
+            continue
+        backend.decode(token)
+        rate = _rate(backend.decode, token, args.iterations)
+        baseline = baseline or rate
+        print(f"  {name:<8} {rate:>12,.0f} decodes/s  ({rate / baseline:.1f}x jose)")
+
+    auth_token.decode_token(token)
+    rate = _rate(auth_token.decode_token, token, args.iterations)
+    print(f"  {'cached':<8} {rate:>12,.0f} decodes/s  (decode_token cache hit)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""
+Benchmark: latency of unrelated requests while logins are in flight.
+
+Starts the API in a uvicorn subprocess on a scratch SQLite database, once
+per PASSWORD_HASH_WORKERS value, and for --duration seconds sends logins at
+--login-rate per second while a probe polls GET /exercises/ at
+--probe-rate per second. Prints p50/p95/p99 of both. With
+PASSWORD_HASH_WORKERS=0 the pbkdf2 work runs inside the server process and
+the probe queues behind it; with a pool it should stay close to its idle
+latency, given spare cores.
+
+Run:
+  python -m app.scripts.bench_login_load [--workers 0 2] [--login-rate 50] [--duration 10]
+"""
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+from app.core.config import settings
+
+EMAIL = "bench@example.com"
+PASSWORD = "BenchPassword123!"
+
+
+def _seed(database_url: str) -> None:
+    from app.db.session import create_db_engine
+    from sqlalchemy.orm import sessionmaker
+    from app.db.base import Base
+    from app.auth.crud import create_user
+    from app.crud.crud_exercise import exercise as crud_exercise
+    from app.schemas.trainee import TraineeCreate
+
+    settings.PASSWORD_HASH_WORKERS = 0
+    engine = create_db_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    try:
+        create_user(db, obj_in=TraineeCreate(email=EMAIL, password=PASSWORD, first_name="Bench", last_name="User"))
+        for i in range(50):
+            crud_exercise.create(db, obj_in={"name": f"Bench Exercise {i}"})
+    finally:
+        db.close()
+        engine.dispose()
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _percentiles(samples: list[float]) -> str:
+    if len(samples) < 2:
+        return "n/a"
+    cuts = statistics.quantiles(samples, n=100)
+    return f"p50={cuts[49] * 1000:7.1f}ms  p95={cuts[94] * 1000:7.1f}ms  p99={cuts[98] * 1000:7.1f}ms  n={len(samples)}"
+
+
+async def _run_load(base_url: str, login_rate: float, probe_rate: float, duration: float) -> tuple[list[float], list[float], int]:
+    login_latencies: list[float] = []
+    probe_latencies: list[float] = []
+    failures = 0
+    form = {"username": EMAIL, "password": PASSWORD}
+    async with httpx.AsyncClient(base_url=base_url, timeout=60) as client:
+        token = (await client.post("/api/v1/auth/login/access-token", data=form)).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        await client.get("/api/v1/exercises/?limit=20", headers=headers)  # warm the principal cache
+
+        async def login() -> None:
+            nonlocal failures
+            started = time.perf_counter()
+            r = await client.post("/api/v1/auth/login/access-token", data=form)
+            login_latencies.append(time.perf_counter() - started)
+            failures += r.status_code != 200
+
+        async def probe() -> None:
+            started = time.perf_counter()
+            r = await client.get("/api/v1/exercises/?limit=20", headers=headers)
+            probe_latencies.append(time.perf_counter() - started)
+            r.raise_for_status()
+
+        async def every(rate: float, make) -> list:
+            tasks = []
+            start = time.perf_counter()
+            n = 0
+            while (now := time.perf_counter()) - start < duration:
+                tasks.append(asyncio.create_task(make()))
+                n += 1
+                await asyncio.sleep(max(0.0, start + n / rate - now))
+            return tasks
+
+        logins, probes = await asyncio.gather(every(login_rate, login), every(probe_rate, probe))
+        await asyncio.gather(*logins, *probes)
+    return login_latencies, probe_latencies, failures
+
+
+def _bench(database_url: str, runtime_dir: str, workers: int, args: argparse.Namespace) -> None:
+    port = _free_port()
+    env = {
+        **os.environ,
+        "SQLALCHEMY_DATABASE_URI": database_url,
+        "RUNTIME_DIR": runtime_dir,
+        "PASSWORD_HASH_WORKERS": str(workers),
+        "EXERCISE_CATALOG_PRELOAD": "false",
+        "RATE_LIMIT_AUTH": "1000000 per minute",
+    }
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        env=env,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        for _ in range(100):
+            try:
+                httpx.get(base_url + "/", timeout=1)
+                break
+            except httpx.TransportError:
+                time.sleep(0.1)
+        logins, probes, failures = asyncio.run(_run_load(base_url, args.login_rate, args.probe_rate, args.duration))
+    finally:
+        server.terminate()
+        server.wait()
+    print(f"PASSWORD_HASH_WORKERS={workers}")
+    print(f"  login : {_percentiles(logins)}  failed={failures}")
+    print(f"  probe : {_percentiles(probes)}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 2], help="PASSWORD_HASH_WORKERS values to compare")
+    parser.add_argument("--login-rate", type=float, default=50, help="Logins started per second")
+    parser.add_argument("--probe-rate", type=float, default=20, help="Probe requests started per second")
+    parser.add_argument("--duration", type=float, default=10, help="Seconds of load per run")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        _seed(database_url)
+        print(f"{os.cpu_count()} CPU(s); {args.login_rate:g} logins/s, {args.probe_rate:g} probes/s for {args.duration:g}s")
+        for workers in args.workers:
+            _bench(database_url, tmp, workers, args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
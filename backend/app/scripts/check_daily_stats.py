@@ -0,0 +1,43 @@
+"""
+Maintenance utility: verify the trainee_daily_stats rollup against raw exercise logs.
+
+Reports every bucket whose stored figures differ from an aggregate over
+exercise_logs. With --rebuild the rollup is regenerated from raw logs after
+reporting.
+
+Run:
+  python -m app.scripts.check_daily_stats [--trainee-id ID] [--rebuild]
+"""
+import argparse
+import json
+import sys
+
+from app.db.session import SessionLocal
+import app.db.base  # noqa: F401  (register all models)
+from app.crud.crud_trainee_daily_stat import trainee_daily_stat as crud_trainee_daily_stat
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--trainee-id", type=int, default=None, help="Only check a single trainee")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild the rollup from raw logs")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        problems = crud_trainee_daily_stat.find_inconsistencies(db, trainee_id=args.trainee_id)
+        for problem in problems:
+            print(json.dumps(problem, default=str))
+        print(f"{len(problems)} inconsistent bucket(s) found.")
+
+        if args.rebuild:
+            rows = crud_trainee_daily_stat.backfill(db, trainee_id=args.trainee_id)
+            print(f"Rebuilt rollup: {rows} bucket(s).")
+            return 0
+        return 1 if problems else 0
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
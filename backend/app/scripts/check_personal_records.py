@@ -0,0 +1,43 @@
+"""
+Maintenance utility: verify the personal_records table against raw exercise logs.
+
+Reports every record that differs from the best set ranked from
+exercise_logs. With --rebuild the table is regenerated from raw logs after
+reporting.
+
+Run:
+  python -m app.scripts.check_personal_records [--trainee-id ID] [--rebuild]
+"""
+import argparse
+import json
+import sys
+
+from app.db.session import SessionLocal
+import app.db.base  # noqa: F401  (register all models)
+from app.crud.crud_personal_record import personal_record as crud_personal_record
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--trainee-id", type=int, default=None, help="Only check a single trainee")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild the records from raw logs")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        problems = crud_personal_record.find_inconsistencies(db, trainee_id=args.trainee_id)
+        for problem in problems:
+            print(json.dumps(problem, default=str))
+        print(f"{len(problems)} inconsistent record(s) found.")
+
+        if args.rebuild:
+            rows = crud_personal_record.backfill(db, trainee_id=args.trainee_id)
+            print(f"Rebuilt personal records: {rows} record(s).")
+            return 0
+        return 1 if problems else 0
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
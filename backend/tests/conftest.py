@@ -1,11 +1,11 @@
 import os
 import sys
 import tempfile
-from typing import Generator
+from typing import Any, Generator
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import event
 from sqlalchemy.orm import sessionmaker
 
 # Ensure the 'backend' directory is on sys.path so we can import the 'app' package
@@ -14,17 +14,34 @@ BACKEND_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, ".."))
 if BACKEND_ROOT not in sys.path:
     sys.path.insert(0, BACKEND_ROOT)
 
+# Keep the limiter's counters out of the app's runtime directory
+os.environ.setdefault("RATE_LIMIT_STORAGE_URI", f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'rate-limits.db')}")
+
 from app.main import app  # noqa: E402
 from app.db.base import Base  # noqa: E402
-from app.api.deps import get_db  # noqa: E402
+from app.db.session import async_session_factory, create_async_db_engine, create_db_engine  # noqa: E402
+from app.api.deps import get_async_db, get_db  # noqa: E402
 from app.schemas.trainee import TraineeCreate  # noqa: E402
 from app.auth.crud import create_user  # noqa: E402
 from app.core.config import settings  # noqa: E402
 from app.models.user import UserRole  # noqa: E402
 from app.core.rate_limit import limiter  # noqa: E402
+from app.auth.cache import principal_cache  # noqa: E402
+from app.crud.analytics_cache import analytics_cache, trainee_versions  # noqa: E402
+from app.crud.exercise_catalog import exercise_catalog  # noqa: E402
+from app.auth.token import token_cache  # noqa: E402
+from app.auth.refresh_store import revoked_families  # noqa: E402
 
 # Disable rate limiting for tests
 limiter.enabled = False
+# The app's own database is not the test database
+settings.EXERCISE_CATALOG_PRELOAD = False
+# Hash in-process; test_auth covers the process pool explicitly
+settings.PASSWORD_HASH_WORKERS = 0
+# Revocations are tested against the in-process set; nothing to sync from
+settings.REVOKED_FAMILIES_SYNC_SECONDS = 0
+# The test app is one process, so the in-process analytics cache is safe
+settings.ANALYTICS_CACHE_ENABLED = True
 
 
 @pytest.fixture(scope="session")
@@ -37,7 +54,7 @@ def sqlite_db_url() -> str:
 
 @pytest.fixture(scope="session")
 def engine(sqlite_db_url: str):
-    engine = create_engine(sqlite_db_url, connect_args={"check_same_thread": False})
+    engine = create_db_engine(sqlite_db_url)
     # Create all tables for the duration of the test session
     Base.metadata.create_all(bind=engine)  # type: ignore[attr-defined]
     yield engine
@@ -50,9 +67,35 @@ def engine(sqlite_db_url: str):
         pass
 
 
+@pytest.fixture(scope="session")
+def async_engine(sqlite_db_url: str, engine):
+    """Async engine on the same database file; None unless DB_ASYNC_ENABLED is set."""
+    if not settings.DB_ASYNC_ENABLED:
+        yield None
+        return
+    async_db_engine = create_async_db_engine(sqlite_db_url)
+    yield async_db_engine
+    async_db_engine.sync_engine.dispose()
+
+
 @pytest.fixture()
-def db_session(engine) -> Generator:
-    """Yield a SQLAlchemy session with a transaction that is rolled back after the test."""
+def db_session(engine, async_engine) -> Generator:
+    """Yield a SQLAlchemy session with a transaction that is rolled back after the test.
+
+    In async mode the app talks to the database over its own connections, so
+    test data is committed for real and the tables are emptied afterwards.
+    """
+    if async_engine is not None:
+        db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+        try:
+            yield db
+        finally:
+            db.close()
+            with engine.begin() as connection:
+                for table in reversed(Base.metadata.sorted_tables):
+                    connection.execute(table.delete())
+        return
+
     connection = engine.connect()
     transaction = connection.begin()
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=connection)
@@ -66,8 +109,53 @@ def db_session(engine) -> Generator:
         connection.close()
 
 
+@pytest.fixture(autouse=True)
+def clear_caches() -> Generator:
+    """Rolled-back tests reuse user ids, so cached principals and responses must not leak between tests."""
+    for cache in (principal_cache, analytics_cache, trainee_versions, exercise_catalog, token_cache, revoked_families):
+        cache.clear()
+    yield
+    for cache in (principal_cache, analytics_cache, trainee_versions, exercise_catalog, token_cache, revoked_families):
+        cache.clear()
+
+
+class QueryCounter:
+    """Collects the SQL statements sent to the database while active."""
+
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+        self.executions: list[tuple[str, Any]] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def reset(self) -> None:
+        self.statements.clear()
+        self.executions.clear()
+
+
+@pytest.fixture()
+def query_counter(engine, async_engine) -> Generator:
+    """Count statements executed against the test engines (use ``reset()`` before measuring)."""
+    counter = QueryCounter()
+    engines = [engine] if async_engine is None else [engine, async_engine.sync_engine]
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        counter.statements.append(statement)
+        counter.executions.append((statement, parameters))
+
+    for target in engines:
+        event.listen(target, "before_cursor_execute", _record)
+    try:
+        yield counter
+    finally:
+        for target in engines:
+            event.remove(target, "before_cursor_execute", _record)
+
+
 @pytest.fixture()
-def client(db_session) -> Generator:
+def client(db_session, async_engine) -> Generator:
     # Override the dependency to use our test DB session
     def override_get_db():
         try:
@@ -76,10 +164,19 @@ def client(db_session) -> Generator:
             pass
 
     app.dependency_overrides[get_db] = override_get_db
+    if async_engine is not None:
+        AsyncTestingSessionLocal = async_session_factory(async_engine)
+
+        async def override_get_async_db():
+            async with AsyncTestingSessionLocal() as db:
+                yield db
+
+        app.dependency_overrides[get_async_db] = override_get_async_db
     with TestClient(app) as c:
         yield c
     # Cleanup override
     app.dependency_overrides.pop(get_db, None)
+    app.dependency_overrides.pop(get_async_db, None)
 
 
 @pytest.fixture()
@@ -0,0 +1,364 @@
+from datetime import date, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.cache import RedisCache
+from app.core.config import settings
+from app.crud.analytics_cache import analytics_cache
+from app.crud.crud_analytics import analytics as crud_analytics
+from app.crud.crud_exercise import exercise as crud_exercise
+from app.crud.crud_exercise_log import exercise_log as crud_exercise_log
+from app.crud.crud_personal_record import personal_record as crud_personal_record
+from app.crud.crud_trainee_daily_stat import trainee_daily_stat as crud_trainee_daily_stat
+from app.crud.crud_workout_session import workout_session as crud_workout_session
+from app.models.exercise_log import ExerciseLog
+from app.schemas.enums import WorkoutSessionStatus
+from app.schemas.exercise_log import ExerciseLogCreate, ExerciseLogUpdate
+from app.schemas.workout_session import WorkoutSessionBase
+
+
+def _create_session(db_session: Session, trainee_id: int, days_ago: int, status=WorkoutSessionStatus.COMPLETED):
+    return crud_workout_session.create(db_session, obj_in=WorkoutSessionBase(
+        trainee_id=trainee_id,
+        program_id=1,
+        session_date=date.today() - timedelta(days=days_ago),
+        status=status,
+    ))
+
+
+def _log(db_session: Session, session_id: int, exercise_id: int, sets: int, reps: int, weight: float):
+    return crud_exercise_log.create(db_session, obj_in=ExerciseLogCreate(
+        session_id=session_id,
+        exercise_id=exercise_id,
+        completed_sets=sets,
+        completed_reps=reps,
+        completed_weight_kg=weight,
+        volume_kg=sets * reps * weight,
+    ))
+
+
+def test_analytics_summary(client: TestClient, db_session: Session, trainee_user: dict, trainee_headers: dict[str, str]) -> None:
+    trainee_id = trainee_user["id"]
+    exercise = crud_exercise.create(db_session, obj_in={"name": "Summary Squat"})
+
+    today_session = _create_session(db_session, trainee_id, 0)
+    yesterday_session = _create_session(db_session, trainee_id, 1, WorkoutSessionStatus.IN_PROGRESS)
+    _create_session(db_session, trainee_id, 10)
+    _create_session(db_session, trainee_id, 60)
+    _log(db_session, today_session.id, exercise.id, 3, 10, 50)
+    _log(db_session, today_session.id, exercise.id, 2, 5, 100)
+    _log(db_session, yesterday_session.id, exercise.id, 1, 1, 20)
+
+    r = client.get(f"{settings.API_V1_STR}/analytics/me/summary", headers=trainee_headers)
+    assert r.status_code == 200, r.text
+    assert r.json() == {
+        "total_workouts": 3,
+        "total_exercises_logged": 3,
+        "total_volume_kg": 1500.0 + 1000.0 + 20.0,
+        "current_streak_days": 2,
+        "workouts_this_week": 2,
+        "workouts_this_month": 3,
+    }
+
+
+def test_current_streak_spans_scan_batches(db_session: Session, trainee_user: dict) -> None:
+    trainee_id = trainee_user["id"]
+    for days_ago in range(7):
+        _create_session(db_session, trainee_id, days_ago)
+    # Gap on day 7, older history must not be counted
+    for days_ago in range(8, 12):
+        _create_session(db_session, trainee_id, days_ago)
+
+    assert crud_analytics.get_current_streak(db_session, trainee_id=trainee_id, batch_size=3) == 7
+    assert crud_analytics.get_current_streak(db_session, trainee_id=trainee_id, batch_size=7) == 7
+    assert crud_analytics.get_current_streak(db_session, trainee_id=trainee_id) == 7
+
+
+def test_personal_records_read_from_table(client: TestClient, db_session: Session, trainee_user: dict, trainee_headers: dict[str, str], query_counter) -> None:
+    trainee_id = trainee_user["id"]
+    bench = crud_exercise.create(db_session, obj_in={"name": "PR Bench"})
+    curl = crud_exercise.create(db_session, obj_in={"name": "PR Curl"})
+    old = _create_session(db_session, trainee_id, days_ago=10)
+    recent = _create_session(db_session, trainee_id, days_ago=2)
+    # Tied top weight: the more recent session wins
+    _log(db_session, old.id, bench.id, sets=5, reps=5, weight=100.0)
+    _log(db_session, recent.id, bench.id, sets=3, reps=2, weight=100.0)
+    # Lighter set with more reps carries the best 1RM estimate
+    _log(db_session, old.id, bench.id, sets=3, reps=10, weight=90.0)
+    _log(db_session, recent.id, curl.id, sets=1, reps=40, weight=20.0)
+    # Another trainee's heavier bench is ignored
+    other = crud_workout_session.create(db_session, obj_in=WorkoutSessionBase(
+        trainee_id=trainee_id + 1000, program_id=1, session_date=date.today(), status=WorkoutSessionStatus.COMPLETED,
+    ))
+    _log(db_session, other.id, bench.id, sets=1, reps=1, weight=200.0)
+
+    query_counter.reset()
+    records = crud_analytics.get_personal_records(db_session, trainee_id=trainee_id)
+    assert query_counter.count == 1
+    assert "FROM personal_records" in query_counter.statements[0]
+    assert "exercise_logs" not in query_counter.statements[0]
+
+    assert records == [
+        {
+            "exercise_id": bench.id,
+            "exercise_name": "PR Bench",
+            "max_weight_kg": 100.0,
+            "achieved_date": recent.session_date.isoformat(),
+            "sets": 3,
+            "reps": 2,
+            "max_volume_kg": 2700.0,
+            "estimated_1rm_epley_kg": 120.0,
+            "estimated_1rm_brzycki_kg": 120.0,
+        },
+        {
+            "exercise_id": curl.id,
+            "exercise_name": "PR Curl",
+            "max_weight_kg": 20.0,
+            "achieved_date": recent.session_date.isoformat(),
+            "sets": 1,
+            "reps": 40,
+            "max_volume_kg": 800.0,
+            "estimated_1rm_epley_kg": 46.7,
+            "estimated_1rm_brzycki_kg": None,
+        },
+    ]
+
+    response = client.get(f"{settings.API_V1_STR}/analytics/me/personal-records", headers=trainee_headers)
+    assert response.status_code == 200
+    assert response.json() == records
+    assert crud_personal_record.find_inconsistencies(db_session) == []
+
+
+def test_personal_records_track_log_writes(db_session: Session, trainee_user: dict) -> None:
+    trainee_id = trainee_user["id"]
+    squat = crud_exercise.create(db_session, obj_in={"name": "Record Squat"})
+    session = _create_session(db_session, trainee_id, 1, WorkoutSessionStatus.IN_PROGRESS)
+
+    first = _log(db_session, session.id, squat.id, 3, 5, 100)
+    assert first.new_personal_records == ["max_weight", "max_volume", "estimated_1rm_epley", "estimated_1rm_brzycki"]
+    # Heavier single: new max weight only (1RM 110 < Epley 116.7 / Brzycki 112.5)
+    single = _log(db_session, session.id, squat.id, 1, 1, 110)
+    assert single.new_personal_records == ["max_weight"]
+    # A tie is not a new record
+    assert _log(db_session, session.id, squat.id, 1, 1, 110).new_personal_records == []
+
+    bulk = crud_exercise_log.create_multi(db_session, session_id=session.id, objs_in=[
+        ExerciseLogCreate(exercise_id=squat.id, completed_sets=2, completed_reps=10, completed_weight_kg=95),
+        ExerciseLogCreate(exercise_id=squat.id, completed_sets=1, completed_reps=3, completed_weight_kg=60),
+    ])
+    assert [log.new_personal_records for log in bulk] == [["max_volume", "estimated_1rm_epley", "estimated_1rm_brzycki"], []]
+    assert crud_personal_record.find_inconsistencies(db_session, trainee_id=trainee_id) == []
+
+    # Editing and removing logs falls back to the next-best set
+    crud_exercise_log.update(db_session, db_obj=bulk[0], obj_in=ExerciseLogUpdate(completed_reps=1))
+    crud_exercise_log.remove(db_session, id=single.id)
+    assert crud_personal_record.find_inconsistencies(db_session, trainee_id=trainee_id) == []
+    records = {record.metric: record for record in crud_personal_record.get_by_trainee(db_session, trainee_id=trainee_id)}
+    assert records["max_weight"].value == 110
+    assert records["max_weight"].exercise_log_id != single.id
+    assert records["estimated_1rm_epley"].value == 100 * (1 + 5 / 30)
+
+    # Drift is reported and repaired by a rebuild
+    records["max_volume"].value = 1.0
+    db_session.flush()
+    problems = crud_personal_record.find_inconsistencies(db_session, trainee_id=trainee_id)
+    assert [(p["metric"], p["problem"]) for p in problems] == [("max_volume", "mismatch")]
+    assert crud_personal_record.backfill(db_session, trainee_id=trainee_id) == 4
+    assert crud_personal_record.find_inconsistencies(db_session) == []
+
+
+def test_personal_records_flush_pending_logs(db_session: Session, trainee_user: dict) -> None:
+    deadlift = crud_exercise.create(db_session, obj_in={"name": "Pending Deadlift"})
+    session = _create_session(db_session, trainee_user["id"], 1)
+    log = ExerciseLog(session_id=session.id, exercise_id=deadlift.id, completed_sets=1, completed_reps=1, completed_weight_kg=180)
+    db_session.add(log)
+    assert log.id is None
+
+    new_records = crud_personal_record.add_logs(db_session, session_id=session.id, logs=[log])
+    assert log.id is not None
+    assert "max_weight" in new_records[log.id]
+    records = crud_personal_record.get_by_trainee(db_session, trainee_id=trainee_user["id"])
+    assert {record.exercise_log_id for record in records} == {log.id}
+
+
+def test_analytics_responses_cached_until_trainee_writes(client: TestClient, db_session: Session, trainee_user: dict, trainee_headers: dict[str, str], query_counter) -> None:
+    trainee_id = trainee_user["id"]
+    squat = crud_exercise.create(db_session, obj_in={"name": "Cached Squat"})
+    session = _create_session(db_session, trainee_id, 0)
+    _log(db_session, session.id, squat.id, 3, 5, 100)
+    url = f"{settings.API_V1_STR}/analytics/me/summary"
+
+    first = client.get(url, headers=trainee_headers)
+    assert first.status_code == 200, first.text
+    etag = first.headers["etag"]
+    assert first.json()["total_exercises_logged"] == 1
+
+    query_counter.reset()
+    again = client.get(url, headers=trainee_headers)
+    assert again.json() == first.json()
+    assert again.headers["etag"] == etag
+    assert query_counter.count == 0
+
+    not_modified = client.get(url, headers={**trainee_headers, "If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert query_counter.count == 0
+
+    # Other parameters are cached separately
+    r = client.get(f"{settings.API_V1_STR}/analytics/me/top-exercises", params={"limit": 1}, headers=trainee_headers)
+    assert r.json()[0]["exercise_id"] == squat.id
+    assert query_counter.count > 0
+
+    # Logging a set invalidates every cached response of this trainee
+    crud_exercise_log.create_multi(db_session, session_id=session.id, objs_in=[
+        ExerciseLogCreate(exercise_id=squat.id, completed_sets=1, completed_reps=5, completed_weight_kg=100),
+    ])
+    r = client.get(url, headers={**trainee_headers, "If-None-Match": etag})
+    assert r.status_code == 200
+    assert r.json()["total_exercises_logged"] == 2
+    assert r.headers["etag"] != etag
+
+    etag = r.headers["etag"]
+    _log(db_session, session.id, squat.id, 1, 1, 120)
+    r = client.get(url, headers={**trainee_headers, "If-None-Match": etag})
+    assert r.json()["total_exercises_logged"] == 3
+
+    # Another trainee's writes leave the entry alone
+    etag = r.headers["etag"]
+    _create_session(db_session, trainee_id + 1000, 0)
+    query_counter.reset()
+    r = client.get(url, headers={**trainee_headers, "If-None-Match": etag})
+    assert r.status_code == 304
+    assert query_counter.count == 0
+
+
+def test_analytics_cache_needs_shared_backend(client: TestClient, db_session: Session, trainee_user: dict, trainee_headers: dict[str, str], query_counter, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "ANALYTICS_CACHE_ENABLED", None)
+    assert settings.CACHE_BACKEND == "memory"
+    _create_session(db_session, trainee_user["id"], 0)
+    url = f"{settings.API_V1_STR}/analytics/me/summary"
+
+    etag = client.get(url, headers=trainee_headers).headers["etag"]
+    # Other workers could not see this worker's invalidations, so nothing is cached...
+    query_counter.reset()
+    r = client.get(url, headers={**trainee_headers, "If-None-Match": etag})
+    assert query_counter.count > 0
+    assert len(analytics_cache) == 0
+    # ...but the ETag still spares the body
+    assert r.status_code == 304
+
+
+def test_redis_cache_misses_while_server_is_down() -> None:
+    class DownClient:
+        def get(self, key):
+            raise ConnectionError("Connection refused")
+
+        def set(self, key, value, px):
+            raise ConnectionError("Connection refused")
+
+    cache = RedisCache("redis://unused", prefix="test", client=DownClient())
+    cache.set(("summary", 1), {"total": 1})
+    assert cache.get(("summary", 1), "default") == "default"
+    assert cache.stats()["misses"] == 1
+
+
+def test_rollup_backed_endpoints(client: TestClient, db_session: Session, trainee_user: dict, trainee_headers: dict[str, str]) -> None:
+    trainee_id = trainee_user["id"]
+    squat = crud_exercise.create(db_session, obj_in={"name": "Rollup Squat"})
+    bench = crud_exercise.create(db_session, obj_in={"name": "Rollup Bench"})
+    recent = _create_session(db_session, trainee_id, 2)
+    older = _create_session(db_session, trainee_id, 20)
+    _log(db_session, recent.id, squat.id, 3, 5, 100)
+    _log(db_session, recent.id, squat.id, 3, 5, 80)
+    _log(db_session, older.id, bench.id, 3, 10, 60)
+
+    r = client.get(f"{settings.API_V1_STR}/analytics/me/exercise-frequency", headers=trainee_headers)
+    assert r.status_code == 200, r.text
+    assert r.json() == {
+        "daily": [
+            {"date": older.session_date.isoformat(), "count": 1},
+            {"date": recent.session_date.isoformat(), "count": 2},
+        ],
+        "weekly_total": 2,
+        "monthly_total": 3,
+    }
+
+    r = client.get(f"{settings.API_V1_STR}/analytics/me/volume-trend", headers=trainee_headers)
+    assert r.json() == [
+        {"date": older.session_date.isoformat(), "volume_kg": 1800.0},
+        {"date": recent.session_date.isoformat(), "volume_kg": 2700.0},
+    ]
+
+    r = client.get(f"{settings.API_V1_STR}/analytics/me/top-exercises", headers=trainee_headers)
+    top = r.json()
+    assert top[0] == {
+        "exercise_id": squat.id,
+        "exercise_name": "Rollup Squat",
+        "count": 2,
+        "total_volume_kg": 2700.0,
+        "avg_weight_kg": 90.0,
+    }
+    assert top[1]["exercise_id"] == bench.id
+
+
+def test_rollup_tracks_log_updates_and_removals(db_session: Session, trainee_user: dict) -> None:
+    trainee_id = trainee_user["id"]
+    squat = crud_exercise.create(db_session, obj_in={"name": "Tracked Squat"})
+    deadlift = crud_exercise.create(db_session, obj_in={"name": "Tracked Deadlift"})
+    session = _create_session(db_session, trainee_id, 0)
+    heavy = _log(db_session, session.id, squat.id, 1, 1, 140)
+    light = _log(db_session, session.id, squat.id, 3, 5, 100)
+
+    [stat] = crud_trainee_daily_stat.get_by_trainee(db_session, trainee_id=trainee_id)
+    assert (stat.log_count, stat.max_weight_kg, stat.total_volume_kg) == (2, 140, 1640)
+
+    # Removing the heaviest set must lower the stored max
+    crud_exercise_log.remove(db_session, id=heavy.id)
+    [stat] = crud_trainee_daily_stat.get_by_trainee(db_session, trainee_id=trainee_id)
+    assert (stat.log_count, stat.max_weight_kg, stat.total_volume_kg) == (1, 100, 1500)
+
+    # Moving the remaining log to another exercise moves its bucket
+    crud_exercise_log.update(db_session, db_obj=light, obj_in=ExerciseLogUpdate(exercise_id=deadlift.id))
+    stats = crud_trainee_daily_stat.get_by_trainee(db_session, trainee_id=trainee_id)
+    assert [(s.exercise_id, s.log_count) for s in stats] == [(deadlift.id, 1)]
+
+    assert crud_trainee_daily_stat.find_inconsistencies(db_session, trainee_id=trainee_id) == []
+
+
+def test_rollup_tracks_session_moves_and_deletes(db_session: Session, trainee_user: dict) -> None:
+    trainee_id = trainee_user["id"]
+    squat = crud_exercise.create(db_session, obj_in={"name": "Moved Squat"})
+    session = _create_session(db_session, trainee_id, 3)
+    _log(db_session, session.id, squat.id, 3, 5, 100)
+
+    # Moving the session to another day moves its bucket
+    crud_workout_session.update(db_session, db_obj=session, obj_in={"session_date": date.today()})
+    [stat] = crud_trainee_daily_stat.get_by_trainee(db_session, trainee_id=trainee_id)
+    assert (stat.session_date, stat.log_count) == (date.today(), 1)
+    assert crud_trainee_daily_stat.find_inconsistencies(db_session, trainee_id=trainee_id) == []
+
+    # Deleting it removes its stats and the records set in it
+    crud_workout_session.remove(db_session, id=session.id)
+    assert crud_trainee_daily_stat.get_by_trainee(db_session, trainee_id=trainee_id) == []
+    assert crud_personal_record.get_by_trainee(db_session, trainee_id=trainee_id) == []
+    assert crud_trainee_daily_stat.find_inconsistencies(db_session, trainee_id=trainee_id) == []
+    assert crud_personal_record.find_inconsistencies(db_session, trainee_id=trainee_id) == []
+
+
+def test_rollup_consistency_checker_and_backfill(db_session: Session, trainee_user: dict) -> None:
+    trainee_id = trainee_user["id"]
+    squat = crud_exercise.create(db_session, obj_in={"name": "Checked Squat"})
+    session = _create_session(db_session, trainee_id, 0)
+    _log(db_session, session.id, squat.id, 3, 5, 100)
+
+    [stat] = crud_trainee_daily_stat.get_by_trainee(db_session, trainee_id=trainee_id)
+    stat.log_count = 7
+    db_session.commit()
+
+    [problem] = crud_trainee_daily_stat.find_inconsistencies(db_session, trainee_id=trainee_id)
+    assert problem["problem"] == "mismatch"
+    assert problem["fields"] == {"log_count": {"expected": 1, "actual": 7}}
+
+    assert crud_trainee_daily_stat.backfill(db_session, trainee_id=trainee_id) == 1
+    assert crud_trainee_daily_stat.find_inconsistencies(db_session, trainee_id=trainee_id) == []
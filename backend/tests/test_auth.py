@@ -75,3 +75,165 @@ def test_login_malformed_payload(client: TestClient) -> None:
     assert "detail" in error
     assert error["detail"][0]["msg"] == "Field required"
     assert error["detail"][0]["loc"] == ["body", "username"]
+
+
+def test_cached_principal_skips_user_lookup(client: TestClient, trainee_headers: dict[str, str], query_counter) -> None:
+    """A repeat request with the same token authenticates without touching the users table."""
+    url = f"{settings.API_V1_STR}/analytics/me/summary"
+    assert client.get(url, headers=trainee_headers).status_code == 200
+
+    query_counter.reset()
+    assert client.get(url, headers=trainee_headers).status_code == 200
+    assert not [s for s in query_counter.statements if "FROM users" in s]
+
+
+def test_role_change_invalidates_cached_principal(client: TestClient, db_session: Session, trainee_user: dict, trainee_headers: dict[str, str]) -> None:
+    """Promoting a user takes effect on the next request, not after the cache TTL."""
+    from app.models.user import User, UserRole
+
+    url = f"{settings.API_V1_STR}/metrics/caches"
+    assert client.get(url, headers=trainee_headers).status_code == 403
+
+    user = db_session.get(User, trainee_user["id"])
+    user.role = UserRole.ADMIN
+    db_session.commit()
+
+    r = client.get(url, headers=trainee_headers)
+    assert r.status_code == 200, r.text
+    stats = r.json()["principal"]
+    assert stats["misses"] >= 2
+    assert {"size", "hits", "hit_ratio", "evictions"} <= stats.keys()
+
+
+def test_token_version_bump_rejects_old_tokens(client: TestClient, db_session: Session, trainee_user: dict, trainee_headers: dict[str, str]) -> None:
+    """Bumping token_version revokes tokens issued before it, cached or not."""
+    from app.models.user import User
+
+    url = f"{settings.API_V1_STR}/analytics/me/summary"
+    assert client.get(url, headers=trainee_headers).status_code == 200
+
+    user = db_session.get(User, trainee_user["id"])
+    user.token_version += 1
+    db_session.commit()
+
+    r = client.get(url, headers=trainee_headers)
+    assert r.status_code == 403
+    assert r.json() == {"detail": "Could not validate credentials"}
+
+
+def test_password_hasher_process_pool() -> None:
+    import asyncio
+    from app.auth.hashing import PasswordHasher
+
+    hasher = PasswordHasher(workers=1)
+    try:
+        hashed = hasher.hash("s3cret-pass")
+        assert hashed.startswith("$pbkdf2-sha256$")
+        assert hasher.verify("s3cret-pass", hashed)
+
+        async def round_trip() -> tuple[bool, bool]:
+            hashed_async = await hasher.hash_async("other-pass")
+            return await hasher.verify_async("other-pass", hashed_async), await hasher.verify_async("wrong", hashed_async)
+
+        assert asyncio.run(round_trip()) == (True, False)
+    finally:
+        hasher.shutdown()
+
+
+@pytest.mark.parametrize("backend", ["jose", "hmac"])
+def test_jwt_backends_agree(backend: str) -> None:
+    from datetime import timedelta
+    from jose import JWTError, jwt
+    from app.auth import token as auth_token
+    from app.auth.jwt_backends import get_backend
+
+    decoder = get_backend(backend, settings.SECRET_KEY, settings.ALGORITHM)
+    valid = auth_token.create_access_token(7, token_version=3)
+    claims = decoder.decode(valid)
+    assert (claims["sub"], claims["type"], claims["ver"]) == ("7", "access", 3)
+
+    header, payload, signature = valid.split(".")
+    expired = auth_token.create_access_token(7, expires_delta=timedelta(seconds=-5))
+    other_key = jwt.encode({"sub": "7"}, "another-secret", algorithm=settings.ALGORITHM)
+    other_alg = jwt.encode({"sub": "7"}, settings.SECRET_KEY, algorithm="HS512")
+    for bad in (expired, other_key, other_alg, f"{header}.{payload}.{signature[::-1]}", f"{header}.{payload}", "garbage"):
+        with pytest.raises(JWTError):
+            decoder.decode(bad)
+
+
+def test_decoded_token_cache_respects_exp(client: TestClient, trainee_headers: dict[str, str]) -> None:
+    import time
+    from datetime import timedelta
+    from app.auth import token as auth_token
+
+    token = trainee_headers["Authorization"].split()[1]
+    hits = auth_token.token_cache.hits
+    for _ in range(2):
+        assert client.get(f"{settings.API_V1_STR}/auth/me", headers=trainee_headers).status_code == 200
+    assert auth_token.token_cache.hits == hits + 1
+
+    short_lived = auth_token.create_access_token(1, expires_delta=timedelta(seconds=30))
+    auth_token.decode_token(short_lived)
+    expires_at, _ = auth_token.token_cache._data[short_lived]
+    assert expires_at - time.monotonic() <= 30
+    assert token in auth_token.token_cache._data
+
+
+def _login(client: TestClient, user: dict) -> dict:
+    r = client.post(
+        f"{settings.API_V1_STR}/auth/login/access-token",
+        data={"username": user["email"], "password": user["password"]},
+    )
+    assert r.status_code == 200, r.text
+    return r.json()
+
+
+def test_refresh_token_reuse_revokes_family(client: TestClient, trainee_user: dict) -> None:
+    first = _login(client, trainee_user)
+    r = client.post(f"{settings.API_V1_STR}/auth/refresh", json={"refresh_token": first["refresh_token"]})
+    assert r.status_code == 200
+    second = r.json()
+    me = f"{settings.API_V1_STR}/auth/me"
+    assert client.get(me, headers={"Authorization": f"Bearer {second['access_token']}"}).status_code == 200
+
+    # Replaying the rotated token revokes the whole family, including the current pair
+    r = client.post(f"{settings.API_V1_STR}/auth/refresh", json={"refresh_token": first["refresh_token"]})
+    assert r.status_code == 401
+    r = client.post(f"{settings.API_V1_STR}/auth/refresh", json={"refresh_token": second["refresh_token"]})
+    assert r.status_code == 401
+    for pair in (first, second):
+        assert client.get(me, headers={"Authorization": f"Bearer {pair['access_token']}"}).status_code == 403
+
+    # Other sessions of the same user are unaffected
+    other = _login(client, trainee_user)
+    assert client.get(me, headers={"Authorization": f"Bearer {other['access_token']}"}).status_code == 200
+
+
+def test_logout_revokes_family_without_queries_on_auth(client: TestClient, trainee_user: dict, query_counter) -> None:
+    tokens = _login(client, trainee_user)
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+    me = f"{settings.API_V1_STR}/auth/me"
+    assert client.get(me, headers=headers).status_code == 200
+
+    query_counter.reset()
+    assert client.get(me, headers=headers).status_code == 200
+    assert not any("refresh_tokens" in statement for statement in query_counter.statements)
+
+    assert client.post(f"{settings.API_V1_STR}/auth/logout", json={"refresh_token": tokens["refresh_token"]}).status_code == 204
+    assert client.get(me, headers=headers).status_code == 403
+    r = client.post(f"{settings.API_V1_STR}/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert r.status_code == 401
+
+
+def test_revoked_families_sync_from_database(client: TestClient, db_session: Session, trainee_user: dict) -> None:
+    from app.auth import refresh_store
+
+    tokens = _login(client, trainee_user)
+    assert client.post(f"{settings.API_V1_STR}/auth/logout", json={"refresh_token": tokens["refresh_token"]}).status_code == 204
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+
+    # A worker that did not handle the logout learns about it on its next sync
+    refresh_store.revoked_families.clear()
+    assert client.get(f"{settings.API_V1_STR}/auth/me", headers=headers).status_code == 200
+    refresh_store.sync(db_session)
+    assert client.get(f"{settings.API_V1_STR}/auth/me", headers=headers).status_code == 403
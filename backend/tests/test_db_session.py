@@ -0,0 +1,86 @@
+import asyncio
+import threading
+
+import pytest
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.crud.crud_exercise import async_exercise, exercise as crud_exercise
+from app.db.session import async_session_factory, create_async_db_engine, create_db_engine, engine_options
+
+
+def _pragma(connection, name: str):
+    return connection.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+
+def test_sqlite_file_engine_uses_wal(engine) -> None:
+    with engine.connect() as connection:
+        assert _pragma(connection, "journal_mode") == "wal"
+        assert _pragma(connection, "synchronous") == 1  # NORMAL
+        assert _pragma(connection, "busy_timeout") == settings.SQLITE_BUSY_TIMEOUT_MS
+        assert _pragma(connection, "cache_size") == settings.SQLITE_CACHE_SIZE
+
+
+def test_sqlite_memory_engine_skips_wal() -> None:
+    memory_engine = create_db_engine("sqlite://")
+    with memory_engine.connect() as connection:
+        assert _pragma(connection, "journal_mode") == "memory"
+        assert _pragma(connection, "busy_timeout") == settings.SQLITE_BUSY_TIMEOUT_MS
+    memory_engine.dispose()
+
+
+def test_server_database_pool_options_come_from_settings() -> None:
+    options = engine_options("postgresql://user:pw@db/fitness")
+    assert options["pool_size"] == settings.DB_POOL_SIZE
+    assert options["max_overflow"] == settings.DB_MAX_OVERFLOW
+    assert options["pool_recycle"] == settings.DB_POOL_RECYCLE_SECONDS
+    assert options["pool_timeout"] == settings.DB_POOL_TIMEOUT_SECONDS
+    assert "pool_size" not in engine_options("sqlite:///./fitness_tracker.db")
+
+
+def test_concurrent_sqlite_writers_do_not_lock(tmp_path) -> None:
+    file_engine = create_db_engine(f"sqlite:///{tmp_path / 'concurrency.db'}")
+    with file_engine.begin() as connection:
+        connection.execute(text("CREATE TABLE logs (id INTEGER PRIMARY KEY, worker INTEGER)"))
+
+    errors: list[Exception] = []
+
+    def write(worker: int) -> None:
+        try:
+            for _ in range(25):
+                with file_engine.begin() as connection:
+                    connection.execute(text("INSERT INTO logs (worker) VALUES (:w)"), {"w": worker})
+        except Exception as exc:  # pragma: no cover - reported below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=write, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    with file_engine.connect() as connection:
+        assert connection.execute(text("SELECT COUNT(*) FROM logs")).scalar() == 200
+    file_engine.dispose()
+
+
+def test_async_crud_accepts_sync_and_async_sessions(db_session, sqlite_db_url) -> None:
+    pytest.importorskip("aiosqlite")
+    created = crud_exercise.create(db_session, obj_in={"name": "Async Row"})
+
+    async def fetch_with_sync_session():
+        return await async_exercise.get(db_session, id=created.id)
+
+    assert asyncio.run(fetch_with_sync_session()).name == "Async Row"
+
+    async def fetch_with_async_session():
+        async_engine = create_async_db_engine(sqlite_db_url)
+        try:
+            async with async_session_factory(async_engine)() as db:
+                return await async_exercise.get_multi(db)
+        finally:
+            await async_engine.dispose()
+
+    # The async engine has its own connection, so it only sees committed rows
+    assert isinstance(asyncio.run(fetch_with_async_session()), list)
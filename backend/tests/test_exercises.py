@@ -75,3 +75,48 @@ def test_delete_exercise(client: TestClient, db_session: Session, trainer_header
     # verify 404 after delete
     r2 = client.get(f"{settings.API_V1_STR}/exercises/{created['id']}", headers=auth_headers)
     assert r2.status_code == 404
+
+
+def test_read_exercises_conditional_get(client: TestClient, db_session: Session, trainer_headers: dict[str, str], auth_headers: dict[str, str], query_counter) -> None:
+    created = client.post(f"{settings.API_V1_STR}/exercises/", json={"name": "ETag Curl"}, headers=trainer_headers).json()
+    url = f"{settings.API_V1_STR}/exercises/?skip=0&limit=100"
+
+    r = client.get(url, headers=auth_headers)
+    etag = r.headers["etag"]
+
+    query_counter.reset()
+    r = client.get(url, headers={**auth_headers, "If-None-Match": f'W/{etag}'})
+    assert r.status_code == 304
+    assert not any("exercises.description" in s for s in query_counter.statements)
+
+    client.put(f"{settings.API_V1_STR}/exercises/{created['id']}", json={"description": "Biceps"}, headers=trainer_headers)
+    r = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+    assert r.status_code == 200
+    assert r.headers["etag"] != etag
+
+
+def test_search_exercises(client: TestClient, db_session: Session, trainer_headers: dict[str, str], query_counter) -> None:
+    url = f"{settings.API_V1_STR}/exercises/search"
+    ids = {}
+    for name in ["Squat", "Back Squat", "Squat Jump", "Front Squat", "Bench Press", "Pull-Up"]:
+        ids[name] = client.post(f"{settings.API_V1_STR}/exercises/", json={"name": name}, headers=trainer_headers).json()["id"]
+
+    r = client.get(url, params={"q": "squat"}, headers=trainer_headers)
+    assert r.status_code == 200, r.text
+    assert [e["name"] for e in r.json()] == ["Squat", "Squat Jump", "Back Squat", "Front Squat"]
+    assert [e["name"] for e in client.get(url, params={"q": "SQU", "limit": 2}, headers=trainer_headers).json()] == ["Squat", "Squat Jump"]
+    assert [e["name"] for e in client.get(url, params={"q": "pull up"}, headers=trainer_headers).json()] == ["Pull-Up"]
+    assert client.get(url, params={"q": "deadlift"}, headers=trainer_headers).json() == []
+
+    # Served from memory once loaded
+    query_counter.reset()
+    assert client.get(url, params={"q": "bench"}, headers=trainer_headers).json()[0]["id"] == ids["Bench Press"]
+    assert query_counter.count == 0
+
+    # Writes through the API are visible to the next search
+    client.put(f"{settings.API_V1_STR}/exercises/{ids['Squat Jump']}", json={"name": "Box Jump"}, headers=trainer_headers)
+    client.delete(f"{settings.API_V1_STR}/exercises/{ids['Front Squat']}", headers=trainer_headers)
+    assert [e["name"] for e in client.get(url, params={"q": "squat"}, headers=trainer_headers).json()] == ["Squat", "Back Squat"]
+    assert [e["name"] for e in client.get(url, params={"q": "jump"}, headers=trainer_headers).json()] == ["Box Jump"]
+
+    assert client.get(url, params={"q": ""}, headers=trainer_headers).status_code == 422
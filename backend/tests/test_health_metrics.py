@@ -80,3 +80,19 @@ def test_delete_health_metric(client: TestClient, db_session: Session, auth_head
 
     response = client.get(f"{settings.API_V1_STR}/health_metrics/{health_metric.id}", headers=trainer_headers)
     assert response.status_code == 404
+
+
+def test_read_my_health_metrics_summary_view(client: TestClient, db_session: Session, trainee_user: dict, trainee_headers: dict[str, str]) -> None:
+    for weight in (80.0, 79.0):
+        crud_health_metric.create(db_session, obj_in=HealthMetricCreate(trainee_id=trainee_user["id"], weight_kg=weight, body_fat_percentage=18.0, protein_kg=12.0))
+
+    r = client.get(f"{settings.API_V1_STR}/health_metrics/me?view=summary", headers=trainee_headers)
+    assert r.status_code == 200, r.text
+    rows = r.json()
+    assert sorted(row["weight_kg"] for row in rows) == [79.0, 80.0]
+    assert set(rows[0]) == {"id", "recorded_at", "weight_kg", "body_fat_percentage", "skeletal_muscle_mass_kg", "bmi"}
+
+    page = client.get(f"{settings.API_V1_STR}/health_metrics/me?view=summary&cursor=&limit=1", headers=trainee_headers).json()
+    assert len(page["items"]) == 1
+    rest = client.get(f"{settings.API_V1_STR}/health_metrics/me?view=summary&cursor={page['next_cursor']}&limit=1", headers=trainee_headers).json()
+    assert {page["items"][0]["id"], rest["items"][0]["id"]} == {row["id"] for row in rows}
@@ -0,0 +1,93 @@
+from datetime import date, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.crud.crud_exercise import exercise as crud_exercise
+from app.crud.crud_health_metric import health_metric as crud_health_metric
+from app.crud.crud_workout_session import workout_session as crud_workout_session
+from app.crud.pagination import MAX_PAGE_SIZE, paginate
+from app.models.exercise import Exercise
+from app.schemas.enums import WorkoutSessionStatus
+from app.schemas.health_metric import HealthMetricCreate
+from app.schemas.workout_session import WorkoutSessionBase
+
+
+def _walk(client: TestClient, url: str, headers: dict[str, str], limit: int) -> list[list[dict]]:
+    pages, cursor = [], ""
+    while cursor is not None:
+        r = client.get(url, params={"cursor": cursor, "limit": limit}, headers=headers)
+        assert r.status_code == 200, r.text
+        body = r.json()
+        pages.append(body["items"])
+        cursor = body["next_cursor"]
+    return pages
+
+
+def test_workout_sessions_cursor_pages_follow_date_then_id(client: TestClient, db_session: Session, trainee_user: dict, trainee_headers: dict[str, str], query_counter) -> None:
+    trainee_id = trainee_user["id"]
+    # Several sessions share a date, so the id tiebreak decides their order
+    for days_ago in [0, 0, 1, 1, 1, 3, 5]:
+        crud_workout_session.create(db_session, obj_in=WorkoutSessionBase(
+            trainee_id=trainee_id, program_id=1,
+            session_date=date.today() - timedelta(days=days_ago),
+            status=WorkoutSessionStatus.COMPLETED,
+        ))
+    url = f"{settings.API_V1_STR}/workout_sessions/"
+    expected = client.get(url, params={"limit": 100}, headers=trainee_headers).json()
+    expected.sort(key=lambda s: (s["session_date"], s["id"]), reverse=True)
+
+    query_counter.reset()
+    pages = _walk(client, url, trainee_headers, limit=3)
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert [s["id"] for page in pages for s in page] == [s["id"] for s in expected]
+    # Later pages seek past the previous key instead of skipping rows
+    seeks = [s for s in query_counter.statements if "(workout_sessions.session_date, workout_sessions.id) <" in s]
+    assert len(seeks) == 2
+
+
+def test_cursor_envelope_is_opt_in(client: TestClient, db_session: Session, trainee_headers: dict[str, str]) -> None:
+    for i in range(3):
+        crud_exercise.create(db_session, obj_in={"name": f"Paged Exercise {i}"})
+    url = f"{settings.API_V1_STR}/exercises/"
+
+    # Legacy skip/limit keeps returning a bare list
+    r = client.get(url, params={"skip": 1, "limit": 1}, headers=trainee_headers)
+    assert isinstance(r.json(), list) and len(r.json()) == 1
+
+    pages = _walk(client, url, trainee_headers, limit=2)
+    ids = [e["id"] for page in pages for e in page]
+    assert ids == sorted(ids) and len(ids) >= 3
+
+    r = client.get(url, params={"cursor": "not-a-cursor"}, headers=trainee_headers)
+    assert r.status_code == 400
+    assert r.json() == {"detail": "Invalid pagination cursor"}
+
+
+def test_health_metrics_cursor_handles_equal_timestamps(db_session: Session, trainee_user: dict) -> None:
+    trainee_id = trainee_user["id"]
+    # Created within the same second: recorded_at ties are broken by id
+    created = [
+        crud_health_metric.create(db_session, obj_in=HealthMetricCreate(trainee_id=trainee_id, weight_kg=70 + i))
+        for i in range(5)
+    ]
+
+    seen, cursor = [], ""
+    while cursor is not None:
+        items, cursor = crud_health_metric.get_page_by_trainee(db_session, trainee_id=trainee_id, cursor=cursor, limit=2)
+        seen.extend(item.id for item in items)
+    assert seen == sorted((m.id for m in created), reverse=True)
+
+
+@pytest.mark.parametrize("path", ["/exercises/", "/programs/", "/workout_sessions/", "/health_metrics/me", "/trainees/", "/trainer-dashboard/me/clients"])
+def test_list_limit_is_bounded(client: TestClient, trainer_headers: dict[str, str], path: str) -> None:
+    url = f"{settings.API_V1_STR}{path}"
+    for params in ({"cursor": "", "limit": 0}, {"cursor": "", "limit": -1}, {"limit": 0}, {"limit": MAX_PAGE_SIZE + 1}, {"skip": -1}):
+        assert client.get(url, params=params, headers=trainer_headers).status_code == 422, params
+
+
+def test_paginate_rejects_empty_pages(db_session: Session) -> None:
+    with pytest.raises(ValueError):
+        paginate(db_session.query(Exercise), id_column=Exercise.id, cursor="", limit=0)
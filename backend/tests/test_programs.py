@@ -209,3 +209,35 @@ def test_delete_program(client: TestClient, db_session: Session, trainer_headers
     # verify 404 after delete (authenticated request)
     r2 = client.get(f"{settings.API_V1_STR}/programs/{created['id']}", headers=trainer_headers)
     assert r2.status_code == 404
+
+
+def test_read_program_conditional_get(client: TestClient, db_session: Session, trainer_headers: dict[str, str], trainer_user: dict, query_counter) -> None:
+    created = client.post(f"{settings.API_V1_STR}/programs/", json={"name": "ETag Program", "description": "Test", "trainer_id": trainer_user["id"]}, headers=trainer_headers).json()
+    url = f"{settings.API_V1_STR}/programs/{created['id']}"
+
+    r = client.get(url, headers=trainer_headers)
+    assert r.status_code == 200
+    etag = r.headers["etag"]
+    assert r.headers["cache-control"] == "private, no-cache"
+
+    # A matching If-None-Match is answered from the version query alone
+    query_counter.reset()
+    r = client.get(url, headers={**trainer_headers, "If-None-Match": etag})
+    assert r.status_code == 304
+    assert r.content == b""
+    assert r.headers["etag"] == etag
+    assert not any("programs.description" in s for s in query_counter.statements)
+
+    r = client.get(f"{settings.API_V1_STR}/programs/?skip=0&limit=50", headers=trainer_headers)
+    list_etag = r.headers["etag"]
+    assert client.get(f"{settings.API_V1_STR}/programs/?skip=0&limit=50", headers={**trainer_headers, "If-None-Match": list_etag}).status_code == 304
+    assert client.get(f"{settings.API_V1_STR}/programs/?skip=0&limit=1", headers={**trainer_headers, "If-None-Match": list_etag}).status_code == 200
+
+    client.put(url, json={"description": "Changed"}, headers=trainer_headers)
+    r = client.get(url, headers={**trainer_headers, "If-None-Match": etag})
+    assert r.status_code == 200
+    assert r.json()["description"] == "Changed"
+    assert r.headers["etag"] != etag
+    assert client.get(f"{settings.API_V1_STR}/programs/?skip=0&limit=50", headers={**trainer_headers, "If-None-Match": list_etag}).status_code == 200
+
+    assert client.get(f"{settings.API_V1_STR}/programs/999999", headers={**trainer_headers, "If-None-Match": "*"}).status_code == 404
@@ -0,0 +1,84 @@
+"""EXPLAIN QUERY PLAN checks for the analytics and dashboard queries.
+
+Every SELECT issued by these endpoints must reach the hot tables through an
+index seek; ``SCAN <table>``, with or without ``USING INDEX``, walks the whole
+table or index and grows with the whole gym's history.
+"""
+import re
+from datetime import date, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.crud.crud_exercise import exercise as crud_exercise
+from app.crud.crud_exercise_log import exercise_log as crud_exercise_log
+from app.crud.crud_workout_session import workout_session as crud_workout_session
+from app.models.trainer import Trainer
+from app.schemas.enums import WorkoutSessionStatus
+from app.schemas.exercise_log import ExerciseLogCreate
+from app.schemas.workout_session import WorkoutSessionBase
+
+HOT_TABLES = ("workout_sessions", "exercise_logs", "health_metrics", "trainee_daily_stats")
+FULL_SCAN = re.compile(r"^SCAN (\w+)(?: USING (?:COVERING )?INDEX \w+)?$")
+
+
+def _full_scans(db_session: Session, executions) -> list[tuple[str, str]]:
+    connection = db_session.connection()
+    scans = []
+    for statement, parameters in executions:
+        if not statement.lstrip().upper().startswith("SELECT"):
+            continue
+        plan = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", tuple(parameters)).all()
+        for row in plan:
+            match = FULL_SCAN.match(row[-1])
+            if match and match.group(1) in HOT_TABLES:
+                scans.append((row[-1], statement))
+    return scans
+
+
+def _seed(db_session: Session, trainee_id: int) -> None:
+    exercise = crud_exercise.create(db_session, obj_in={"name": "Plan Squat"})
+    for days_ago in range(5):
+        session = crud_workout_session.create(db_session, obj_in=WorkoutSessionBase(
+            trainee_id=trainee_id, program_id=1,
+            session_date=date.today() - timedelta(days=days_ago),
+            status=WorkoutSessionStatus.COMPLETED,
+        ))
+        crud_exercise_log.create(db_session, obj_in=ExerciseLogCreate(
+            session_id=session.id, exercise_id=exercise.id,
+            completed_sets=3, completed_reps=5, completed_weight_kg=100, volume_kg=1500,
+        ))
+
+
+def test_analytics_queries_use_indexes(client: TestClient, db_session: Session, trainee_user: dict, trainee_headers: dict[str, str], query_counter) -> None:
+    _seed(db_session, trainee_user["id"])
+    query_counter.reset()
+    for path in ("summary", "exercise-frequency", "top-exercises", "volume-trend", "personal-records"):
+        r = client.get(f"{settings.API_V1_STR}/analytics/me/{path}", headers=trainee_headers)
+        assert r.status_code == 200, r.text
+    r = client.get(f"{settings.API_V1_STR}/workout_sessions/", params={"cursor": "", "limit": 2}, headers=trainee_headers)
+    r = client.get(f"{settings.API_V1_STR}/workout_sessions/", params={"cursor": r.json()["next_cursor"], "limit": 2}, headers=trainee_headers)
+    assert r.status_code == 200, r.text
+
+    assert query_counter.executions
+    assert _full_scans(db_session, query_counter.executions) == []
+
+
+def test_trainer_dashboard_queries_use_indexes(client: TestClient, db_session: Session, trainee_user: dict, trainer_user: dict, trainer_headers: dict[str, str], query_counter) -> None:
+    from app.models.trainee import Trainee
+
+    trainer = Trainer(user_id=trainer_user["id"], first_name="Plan", last_name="Trainer")
+    db_session.add(trainer)
+    db_session.commit()
+    client_profile = db_session.query(Trainee).filter(Trainee.user_id == trainee_user["id"]).first()
+    client_profile.trainer_id = trainer.id
+    db_session.commit()
+    _seed(db_session, client_profile.id)
+
+    query_counter.reset()
+    for path in ("me/clients", "me/dashboard-stats", f"me/clients/{client_profile.id}/progress"):
+        r = client.get(f"{settings.API_V1_STR}/trainer-dashboard/{path}", headers=trainer_headers)
+        assert r.status_code == 200, r.text
+
+    assert _full_scans(db_session, query_counter.executions) == []
@@ -0,0 +1,115 @@
+import multiprocessing
+import os
+
+import pytest
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import FixedWindowRateLimiter, MovingWindowRateLimiter
+
+from starlette.requests import Request
+
+from app.auth.token import create_access_token, create_refresh_token
+from app.core.config import settings
+from app.core.rate_limit import RATE_LIMIT_AUTH, get_rate_limit_key, limiter
+from app.core.rate_limit_storage import SQLiteStorage
+from app.core.token_bucket import TokenBucketRateLimiter, bucket_limit
+
+STRATEGIES = {
+    "fixed-window": FixedWindowRateLimiter,
+    "moving-window": MovingWindowRateLimiter,
+    "token-bucket": TokenBucketRateLimiter,
+}
+
+
+def _hit_many(uri: str, strategy: str, limit: str, hits: int) -> int:
+    limiter = STRATEGIES[strategy](storage_from_string(uri))
+    return sum(limiter.hit(parse(limit), "login", "203.0.113.7") for _ in range(hits))
+
+
+@pytest.fixture()
+def storage_uri(tmp_path) -> str:
+    return f"sqlite:///{tmp_path / 'rate-limits.db'}"
+
+
+def test_sqlite_storage_creates_its_directory_on_first_use(tmp_path) -> None:
+    runtime_dir = tmp_path / "run"
+    storage = storage_from_string(f"sqlite:///{runtime_dir / 'rate-limits.db'}")
+    assert not runtime_dir.exists()
+    assert storage.incr("k", 60) == 1
+    assert runtime_dir.stat().st_mode & 0o777 == 0o700
+
+
+def test_sqlite_storage_is_registered(storage_uri: str) -> None:
+    storage = storage_from_string(storage_uri)
+    assert isinstance(storage, SQLiteStorage)
+    assert storage.check()
+    assert storage.incr("k", 60) == 1
+    assert storage.incr("k", 60, amount=2) == 3
+    assert storage.get("k") == 3
+    storage.clear("k")
+    assert storage.get("k") == 0
+
+
+@pytest.mark.parametrize("strategy", list(STRATEGIES))
+def test_limit_is_shared_across_worker_processes(storage_uri: str, strategy: str) -> None:
+    # Four "workers" send 25 requests each against a limit of 30: exactly 30 may pass in total
+    ctx = multiprocessing.get_context("fork" if hasattr(os, "fork") else "spawn")
+    with ctx.Pool(4) as pool:
+        allowed = pool.starmap(_hit_many, [(storage_uri, strategy, "30 per minute", 25)] * 4)
+    assert sum(allowed) == 30
+    assert _hit_many(storage_uri, strategy, "30 per minute", 1) == 0
+
+
+def test_bucket_limit_encodes_rate_and_burst() -> None:
+    assert bucket_limit("10 per minute", 30) == "30 per 180 second"
+    assert bucket_limit("5 per minute", 5) == "5 per 60 second"
+
+
+def test_token_bucket_allows_burst_then_refills(storage_uri: str, monkeypatch) -> None:
+    import time
+
+    limiter = TokenBucketRateLimiter(storage_from_string(storage_uri))
+    item = parse(bucket_limit("1 per second", 3))
+    clock = [1000.0]
+    monkeypatch.setattr(time, "time", lambda: clock[0])
+
+    assert [limiter.hit(item, "user:1") for _ in range(4)] == [True, True, True, False]
+    assert limiter.get_window_stats(item, "user:1") == (1001.0, 0)
+    # Another key has its own bucket
+    assert limiter.hit(item, "user:2")
+
+    clock[0] += 1.5
+    assert limiter.test(item, "user:1")
+    assert [limiter.hit(item, "user:1") for _ in range(2)] == [True, False]
+    clock[0] += 60
+    assert limiter.get_window_stats(item, "user:1").remaining == 3
+
+
+def _request(authorization: str | None = None, ip: str = "198.51.100.20") -> Request:
+    headers = [(b"authorization", authorization.encode())] if authorization else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers, "client": (ip, 5000)})
+
+
+def test_rate_limit_key_prefers_authenticated_user() -> None:
+    # Two members behind the same gym NAT get separate buckets
+    assert get_rate_limit_key(_request(f"Bearer {create_access_token(1)}")) == "user:1"
+    assert get_rate_limit_key(_request(f"Bearer {create_access_token(2)}")) == "user:2"
+    # Anything that is not a valid access token is keyed by IP
+    for authorization in (None, "Bearer not-a-jwt", f"Bearer {create_refresh_token(1)}", "Basic dXNlcjpwYXNz"):
+        assert get_rate_limit_key(_request(authorization)) == "ip:198.51.100.20"
+
+
+def test_login_is_limited_per_ip_even_with_a_bearer_token(client, monkeypatch) -> None:
+    monkeypatch.setattr(limiter, "enabled", True)
+    limiter.reset()
+    url = f"{settings.API_V1_STR}/auth/login/access-token"
+    form = {"username": "nobody@example.com", "password": "WrongPassword123!"}
+    burst = parse(RATE_LIMIT_AUTH).amount
+
+    # A fresh valid token per attempt must not buy a fresh bucket
+    statuses = [
+        client.post(url, data=form, headers={"Authorization": f"Bearer {create_access_token(user_id)}"}).status_code
+        for user_id in range(1, burst + 2)
+    ]
+    limiter.reset()
+    assert statuses == [401] * burst + [429]
@@ -0,0 +1,49 @@
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.crud import crud_search
+from app.crud.crud_exercise import exercise as crud_exercise
+from app.crud.crud_program import program as crud_program
+from app.schemas.exercise import ExerciseCreate
+from app.schemas.program import ProgramCreate
+
+
+def test_search_exercises_and_programs(client: TestClient, db_session: Session, trainer_headers: dict[str, str], trainer_user: dict) -> None:
+    url = f"{settings.API_V1_STR}/search/"
+    press = crud_exercise.create(db_session, obj_in=ExerciseCreate(name="Bench Press", description="Flat barbell press for chest & triceps"))
+    dips = crud_exercise.create(db_session, obj_in=ExerciseCreate(name="Dips", description="Bodyweight triceps work, finish with a press-up"))
+    crud_exercise.create(db_session, obj_in=ExerciseCreate(name="Squat"))
+    program = crud_program.create(db_session, obj_in=ProgramCreate(name="Push Day", description="Bench press, overhead press and dips", trainer_id=trainer_user["id"]))
+
+    r = client.get(url, params={"q": "press"}, headers=trainer_headers)
+    assert r.status_code == 200, r.text
+    data = r.json()
+    # A match in the name outranks one in the description
+    assert [hit["id"] for hit in data["exercises"]] == [press.id, dips.id]
+    best = data["exercises"][0]
+    assert best["name_highlight"] == "Bench <mark>Press</mark>"
+    assert best["description_snippet"] == "Flat barbell <mark>press</mark> for chest &amp; triceps"
+    assert best["score"] > data["exercises"][1]["score"]
+    assert [hit["id"] for hit in data["programs"]] == [program.id]
+    assert data["programs"][0]["name_highlight"] == "Push Day"
+
+    # Every word must match, each as a prefix; query syntax is not interpreted
+    assert [hit["id"] for hit in client.get(url, params={"q": "tri BOD"}, headers=trainer_headers).json()["exercises"]] == [dips.id]
+    assert client.get(url, params={"q": 'squat OR "dips'}, headers=trainer_headers).json()["exercises"] == []
+    assert client.get(url, params={"q": "squat"}, headers=trainer_headers).json()["exercises"][0]["description_snippet"] is None
+
+    # The index follows updates and deletes
+    crud_exercise.update(db_session, db_obj=dips, obj_in={"description": "Bodyweight triceps work"})
+    crud_exercise.remove(db_session, id=press.id)
+    assert client.get(url, params={"q": "press"}, headers=trainer_headers).json()["exercises"] == []
+
+    assert client.get(url, params={"q": "press", "limit": 0}, headers=trainer_headers).status_code == 422
+    assert client.get(url, params={"q": "press"}).status_code == 401
+
+
+def test_search_unsupported_database(client: TestClient, trainer_headers: dict[str, str], monkeypatch) -> None:
+    monkeypatch.setattr(crud_search, "SUPPORTED_DIALECTS", ("postgresql",))
+    r = client.get(f"{settings.API_V1_STR}/search/", params={"q": "press"}, headers=trainer_headers)
+    assert r.status_code == 501
+    assert r.json()["detail"] == "Search is not available on this database"
@@ -114,3 +114,21 @@ def test_assign_nonexistent_program_to_trainee(client: TestClient, db_session: S
     assign_response = client.put(f"{settings.API_V1_STR}/trainees/{trainee['id']}/assign-program/{non_existent_program_id}", headers=trainer_headers)
     assert assign_response.status_code == 404
     assert "Program not found" in assign_response.json()["detail"]
+
+
+def test_read_trainees_summary_view(client: TestClient, db_session: Session, trainer_headers: dict[str, str], query_counter) -> None:
+    for i in range(3):
+        client.post(f"{settings.API_V1_STR}/trainees/", json={"first_name": f"S{i}", "last_name": "Summary", "email": f"s{i}.summary@example.com", "password": "testpass123"})
+
+    query_counter.reset()
+    r = client.get(f"{settings.API_V1_STR}/trainees/?view=summary", headers=trainer_headers)
+    assert r.status_code == 200, r.text
+    rows = [t for t in r.json() if t["last_name"] == "Summary"]
+    assert [t["email"] for t in rows] == ["s0.summary@example.com", "s1.summary@example.com", "s2.summary@example.com"]
+    assert set(rows[0]) == {"id", "first_name", "last_name", "email", "trainer_id", "program_id"}
+    # One statement for the rows, with emails joined in rather than loaded per trainee
+    assert len([s for s in query_counter.statements if "FROM trainees" in s]) == 1
+
+    page = client.get(f"{settings.API_V1_STR}/trainees/?view=summary&cursor=&limit=2", headers=trainer_headers).json()
+    assert len(page["items"]) == 2 and page["next_cursor"]
+    assert client.get(f"{settings.API_V1_STR}/trainees/?view=compact", headers=trainer_headers).status_code == 422
@@ -0,0 +1,162 @@
+from datetime import date, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.crud.crud_exercise import exercise as crud_exercise
+from app.crud.crud_exercise_log import exercise_log as crud_exercise_log
+from app.crud.crud_trainee import trainee as crud_trainee
+from app.crud.crud_workout_session import workout_session as crud_workout_session
+from app.models.trainer import Trainer
+from app.models.user import User, UserRole
+from app.schemas.enums import WorkoutSessionStatus
+from app.schemas.exercise_log import ExerciseLogCreate
+from app.schemas.workout_session import WorkoutSessionBase
+
+
+def _create_trainer_profile(db_session: Session, user_id: int) -> Trainer:
+    trainer = Trainer(user_id=user_id, first_name="Dash", last_name="Trainer")
+    db_session.add(trainer)
+    db_session.commit()
+    db_session.refresh(trainer)
+    return trainer
+
+
+def _add_clients(db_session: Session, trainer: Trainer, start: int, count: int) -> list:
+    clients = []
+    for i in range(start, start + count):
+        client = crud_trainee.create(db_session, obj_in={
+            "first_name": "Client",
+            "last_name": f"Number {i}",
+            "email": f"dashboard.client{i}@example.com",
+            "trainer_id": trainer.id,
+        })
+        for days_ago, session_status in ((1, WorkoutSessionStatus.COMPLETED), (45, WorkoutSessionStatus.COMPLETED), (2, WorkoutSessionStatus.IN_PROGRESS)):
+            crud_workout_session.create(db_session, obj_in=WorkoutSessionBase(
+                trainee_id=client.id,
+                program_id=1,
+                session_date=date.today() - timedelta(days=days_ago),
+                status=session_status,
+            ))
+        clients.append(client)
+    return clients
+
+
+def test_get_my_clients_returns_metrics(client: TestClient, db_session: Session, trainer_user: dict, trainer_headers: dict[str, str]) -> None:
+    trainer = _create_trainer_profile(db_session, trainer_user["id"])
+    _add_clients(db_session, trainer, 0, 2)
+
+    r = client.get(f"{settings.API_V1_STR}/trainer-dashboard/me/clients", headers=trainer_headers)
+    assert r.status_code == 200, r.text
+    clients = r.json()
+    assert len(clients) == 2
+    first = clients[0]
+    assert first["email"] == "dashboard.client0@example.com"
+    assert first["program_name"] == "No program assigned"
+    assert first["total_workouts"] == 2
+    assert first["workouts_last_30_days"] == 2
+    assert first["last_workout_date"] == (date.today() - timedelta(days=1)).isoformat()
+    assert first["adherence_rate"] == round((2 / 12) * 100, 1)
+
+
+def test_get_my_clients_query_count_is_constant(client: TestClient, db_session: Session, trainer_user: dict, trainer_headers: dict[str, str], query_counter) -> None:
+    trainer = _create_trainer_profile(db_session, trainer_user["id"])
+    url = f"{settings.API_V1_STR}/trainer-dashboard/me/clients"
+
+    _add_clients(db_session, trainer, 0, 2)
+    # Warm the principal cache so both measurements are cache hits
+    client.get(url, headers=trainer_headers)
+    query_counter.reset()
+    r = client.get(url, headers=trainer_headers)
+    assert r.status_code == 200, r.text
+    assert len(r.json()) == 2
+    small_roster_queries = query_counter.count
+
+    _add_clients(db_session, trainer, 2, 6)
+    query_counter.reset()
+    r = client.get(url, headers=trainer_headers)
+    assert r.status_code == 200, r.text
+    assert len(r.json()) == 8
+    assert query_counter.count == small_roster_queries
+
+
+def test_dashboard_stats_scoped_to_clients_in_constant_queries(client: TestClient, db_session: Session, trainer_user: dict, trainer_headers: dict[str, str], query_counter) -> None:
+    trainer = _create_trainer_profile(db_session, trainer_user["id"])
+    other_user = User(email="dashboard.other.trainer@example.com", hashed_password="x", role=UserRole.TRAINER)
+    db_session.add(other_user)
+    db_session.commit()
+    other_trainer = _create_trainer_profile(db_session, other_user.id)
+    url = f"{settings.API_V1_STR}/trainer-dashboard/me/dashboard-stats"
+
+    _add_clients(db_session, trainer, 0, 2)
+    # A client with no sessions lowers the average but is not active
+    crud_trainee.create(db_session, obj_in={
+        "first_name": "Idle", "last_name": "Client", "email": "dashboard.idle@example.com", "trainer_id": trainer.id,
+    })
+    _add_clients(db_session, other_trainer, 100, 3)
+    client.get(url, headers=trainer_headers)
+    query_counter.reset()
+    r = client.get(url, headers=trainer_headers)
+    assert r.status_code == 200, r.text
+    assert r.json() == {
+        "total_clients": 3,
+        "active_clients": 2,
+        "total_programs": 0,
+        "average_adherence_rate": round((2 / 12) * 100 * 2 / 3, 1),
+    }
+    small_roster_queries = query_counter.count
+    assert small_roster_queries == 2
+
+    _add_clients(db_session, trainer, 2, 6)
+    query_counter.reset()
+    r = client.get(url, headers=trainer_headers)
+    assert r.json()["total_clients"] == 9
+    assert r.json()["active_clients"] == 8
+    assert query_counter.count == small_roster_queries
+
+
+def test_client_progress_has_fixed_query_budget(client: TestClient, db_session: Session, trainer_user: dict, trainer_headers: dict[str, str], query_counter) -> None:
+    trainer = _create_trainer_profile(db_session, trainer_user["id"])
+    trainee = _add_clients(db_session, trainer, 0, 1)[0]
+    squat = crud_exercise.create(db_session, obj_in={"name": "Progress Squat"})
+    url = f"{settings.API_V1_STR}/trainer-dashboard/me/clients/{trainee.id}/progress"
+
+    def log_sessions(count: int) -> None:
+        for days_ago in range(3, 3 + count):
+            session = crud_workout_session.create(db_session, obj_in=WorkoutSessionBase(
+                trainee_id=trainee.id, program_id=1,
+                session_date=date.today() - timedelta(days=days_ago),
+                status=WorkoutSessionStatus.COMPLETED,
+            ))
+            for _ in range(2):
+                crud_exercise_log.create(db_session, obj_in=ExerciseLogCreate(
+                    session_id=session.id, exercise_id=squat.id,
+                    completed_sets=1, completed_reps=10, completed_weight_kg=10, volume_kg=100,
+                ))
+
+    log_sessions(1)
+    client.get(url, headers=trainer_headers)
+    query_counter.reset()
+    r = client.get(url, headers=trainer_headers)
+    assert r.status_code == 200, r.text
+    data = r.json()
+    # The client, per-day aggregate and recent sessions
+    assert query_counter.count == 3
+    assert data["client"]["email"] == "dashboard.client0@example.com"
+    # The summary covers the 30-day window, not the session 45 days ago
+    assert data["summary"]["total_workouts"] == 2
+    assert data["summary"]["total_volume_kg"] == 200.0
+    assert [s["exercise_count"] for s in data["recent_sessions"]] == [0, 0, 2, 0]
+    assert [p["count"] for p in data["workout_frequency"]] == [1, 1, 1]
+    assert len(data["volume_trend"]) == 1
+
+    log_sessions(15)
+    query_counter.reset()
+    r = client.get(url, headers=trainer_headers)
+    data = r.json()
+    assert query_counter.count == 3
+    assert data["summary"]["total_workouts"] == 17
+    assert len(data["recent_sessions"]) == 10
+    assert [s["exercise_count"] for s in data["recent_sessions"]] == [0, 0] + [2] * 8
+    assert data["summary"]["total_volume_kg"] == sum(p["volume_kg"] for p in data["volume_trend"])
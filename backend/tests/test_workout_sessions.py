@@ -89,3 +89,188 @@ def test_read_workout_session(client: TestClient, db_session: Session, auth_head
     read_data = read_response.json()
     assert read_data["id"] == session["id"]
     assert len(read_data["exercise_logs"]) > 0
+
+
+def test_log_exercises_in_session_bulk(client: TestClient, db_session: Session, trainee_user: dict, trainee_headers: dict[str, str], trainer_user: dict, query_counter) -> None:
+    from app.crud.crud_trainee_daily_stat import trainee_daily_stat as crud_trainee_daily_stat
+
+    program = crud_program.create(db_session, obj_in=ProgramCreate(name="Bulk Program", description="A program for testing", trainer_id=trainer_user["id"]))
+    session = client.post(f"{settings.API_V1_STR}/workout_sessions/start", json={"trainee_id": trainee_user["id"], "program_id": program.id}, headers=trainee_headers).json()
+    squat = crud_exercise.create(db_session, obj_in=ExerciseCreate(name="Bulk Squat"))
+    bench = crud_exercise.create(db_session, obj_in=ExerciseCreate(name="Bulk Bench"))
+
+    logs = [
+        {"exercise_id": squat.id, "completed_sets": 1, "completed_reps": 5, "completed_weight_kg": 100},
+        {"exercise_id": squat.id, "completed_sets": 1, "completed_reps": 5, "completed_weight_kg": 110},
+        {"exercise_id": bench.id, "completed_sets": 3, "completed_reps": 8, "completed_weight_kg": 60},
+        {"exercise_id": bench.id, "completed_sets": 2, "completed_reps": 10, "is_completed": False},
+    ]
+    query_counter.reset()
+    r = client.post(f"{settings.API_V1_STR}/workout_sessions/{session['id']}/log-exercises", json={"logs": logs}, headers=trainee_headers)
+    assert r.status_code == 200, r.text
+    data = r.json()
+    assert [log["exercise_id"] for log in data] == [squat.id, squat.id, bench.id, bench.id]
+    assert [log["volume_kg"] for log in data] == [500, 550, 1440, 0]
+    # Same rule as the single log-exercise endpoint: logged sets are completed
+    assert all(log["is_completed"] for log in data)
+    assert data[0]["exercise"]["name"] == "Bulk Squat"
+    assert all(log["session_id"] == session["id"] for log in data)
+    # Each weighted set beats the records set before it; the unweighted one cannot
+    assert [bool(log["new_personal_records"]) for log in data] == [True, True, True, False]
+    # One batched INSERT for all sets
+    assert len([s for s in query_counter.statements if s.startswith("INSERT INTO exercise_logs")]) == 1
+
+    stats = {s.exercise_id: s for s in crud_trainee_daily_stat.get_by_trainee(db_session, trainee_id=trainee_user["id"])}
+    assert (stats[squat.id].log_count, stats[squat.id].max_weight_kg) == (2, 110)
+    assert stats[bench.id].total_volume_kg == 1440
+
+
+def test_log_exercises_in_session_rejects_unknown_exercise(client: TestClient, db_session: Session, trainee_user: dict, trainee_headers: dict[str, str], trainer_user: dict) -> None:
+    program = crud_program.create(db_session, obj_in=ProgramCreate(name="Bulk Program 2", description="A program for testing", trainer_id=trainer_user["id"]))
+    session = client.post(f"{settings.API_V1_STR}/workout_sessions/start", json={"trainee_id": trainee_user["id"], "program_id": program.id}, headers=trainee_headers).json()
+    squat = crud_exercise.create(db_session, obj_in=ExerciseCreate(name="Bulk Squat 2"))
+
+    logs = [
+        {"exercise_id": squat.id, "completed_sets": 1, "completed_reps": 5, "completed_weight_kg": 100},
+        {"exercise_id": 999999, "completed_sets": 1, "completed_reps": 5, "completed_weight_kg": 100},
+    ]
+    r = client.post(f"{settings.API_V1_STR}/workout_sessions/{session['id']}/log-exercises", json={"logs": logs}, headers=trainee_headers)
+    assert r.status_code == 422
+    assert "999999" in r.json()["detail"]
+
+    r = client.get(f"{settings.API_V1_STR}/workout_sessions/{session['id']}", headers=trainee_headers)
+    assert r.json()["exercise_logs"] == []
+
+    r = client.post(f"{settings.API_V1_STR}/workout_sessions/{session['id']}/log-exercises", json={"logs": []}, headers=trainee_headers)
+    assert r.status_code == 422
+
+
+def test_auto_complete_session_logs_program_in_one_insert(client: TestClient, db_session: Session, trainee_user: dict, trainee_headers: dict[str, str], trainer_user: dict, query_counter) -> None:
+    from app.crud.crud_program_exercise import program_exercise as crud_program_exercise
+    from app.crud.crud_trainee_daily_stat import trainee_daily_stat as crud_trainee_daily_stat
+    from app.schemas.program_exercise import ProgramExerciseCreate
+
+    program = crud_program.create(db_session, obj_in=ProgramCreate(name="Auto Program", description="A program for testing", trainer_id=trainer_user["id"]))
+    exercises = [crud_exercise.create(db_session, obj_in=ExerciseCreate(name=f"Auto Exercise {i}")) for i in range(5)]
+    for i, exercise in enumerate(exercises):
+        crud_program_exercise.create(db_session, obj_in=ProgramExerciseCreate(
+            program_id=program.id, exercise_id=exercise.id, order=i + 1,
+            prescribed_sets=3, prescribed_reps=10, prescribed_weight_kg=20.0 * (i + 1) if i else None,
+        ))
+    session = client.post(f"{settings.API_V1_STR}/workout_sessions/start", json={"trainee_id": trainee_user["id"], "program_id": program.id}, headers=trainee_headers).json()
+
+    query_counter.reset()
+    r = client.post(f"{settings.API_V1_STR}/workout_sessions/{session['id']}/auto-complete", headers=trainee_headers)
+    assert r.status_code == 200, r.text
+    data = r.json()
+    assert data["status"] == "completed"
+    assert len([s for s in query_counter.statements if s.startswith("INSERT INTO exercise_logs")]) == 1
+
+    logs = sorted(data["exercise_logs"], key=lambda log: log["exercise_id"])
+    assert [log["exercise_id"] for log in logs] == [e.id for e in exercises]
+    assert [log["volume_kg"] for log in logs] == [0, 1200, 1800, 2400, 3000]
+    assert logs[0]["completed_weight_kg"] == 0
+
+    stats = crud_trainee_daily_stat.get_by_trainee(db_session, trainee_id=trainee_user["id"])
+    assert sum(s.log_count for s in stats) == 5
+    assert sum(s.total_volume_kg for s in stats) == 8400
+
+
+def test_auto_complete_session_without_exercises_changes_nothing(client: TestClient, db_session: Session, trainee_user: dict, trainee_headers: dict[str, str], trainer_user: dict) -> None:
+    program = crud_program.create(db_session, obj_in=ProgramCreate(name="Empty Program", description="A program for testing", trainer_id=trainer_user["id"]))
+    session = client.post(f"{settings.API_V1_STR}/workout_sessions/start", json={"trainee_id": trainee_user["id"], "program_id": program.id}, headers=trainee_headers).json()
+
+    r = client.post(f"{settings.API_V1_STR}/workout_sessions/{session['id']}/auto-complete", headers=trainee_headers)
+    assert r.status_code == 400
+    assert r.json() == {"detail": "Linked program has no exercises to log"}
+
+    r = client.get(f"{settings.API_V1_STR}/workout_sessions/{session['id']}", headers=trainee_headers)
+    assert r.json()["status"] == "in-progress"
+    assert r.json()["exercise_logs"] == []
+
+
+def test_read_workout_session_conditional_get(client: TestClient, db_session: Session, trainee_user: dict, trainee_headers: dict[str, str], trainer_user: dict, query_counter) -> None:
+    program = crud_program.create(db_session, obj_in=ProgramCreate(name="ETag Program", description="A program for testing", trainer_id=trainer_user["id"]))
+    session = client.post(f"{settings.API_V1_STR}/workout_sessions/start", json={"trainee_id": trainee_user["id"], "program_id": program.id}, headers=trainee_headers).json()
+    squat = crud_exercise.create(db_session, obj_in=ExerciseCreate(name="ETag Squat"))
+    url = f"{settings.API_V1_STR}/workout_sessions/{session['id']}"
+
+    etag = client.get(url, headers=trainee_headers).headers["etag"]
+    query_counter.reset()
+    r = client.get(url, headers={**trainee_headers, "If-None-Match": etag})
+    assert r.status_code == 304
+    assert not any("workout_sessions.session_date" in s for s in query_counter.statements)
+
+    # Logging a set changes the representation, and so the ETag
+    log = {"exercise_id": squat.id, "completed_sets": 1, "completed_reps": 5, "completed_weight_kg": 100}
+    client.post(f"{url}/log-exercises", json={"logs": [log]}, headers=trainee_headers)
+    r = client.get(url, headers={**trainee_headers, "If-None-Match": etag})
+    assert r.status_code == 200
+    assert len(r.json()["exercise_logs"]) == 1
+    etag = r.headers["etag"]
+    assert client.get(url, headers={**trainee_headers, "If-None-Match": etag}).status_code == 304
+
+    # So does renaming an exercise nested in the response
+    crud_exercise.update(db_session, db_obj=crud_exercise.get(db_session, id=squat.id), obj_in={"name": "ETag Back Squat"})
+    r = client.get(url, headers={**trainee_headers, "If-None-Match": etag})
+    assert r.status_code == 200
+    assert r.json()["exercise_logs"][0]["exercise"]["name"] == "ETag Back Squat"
+
+    # Other trainees are still refused, even with the current ETag
+    other = crud_trainee.create(db_session, obj_in=TraineeCreate(first_name="Other", last_name="Trainee", email="etag.other@example.com", password="testpass123"))
+    token = client.post(f"{settings.API_V1_STR}/auth/login/access-token", data={"username": other.email, "password": "testpass123"}).json()["access_token"]
+    r = client.get(url, headers={"Authorization": f"Bearer {token}", "If-None-Match": r.headers["etag"]})
+    assert r.status_code == 403
+
+
+def test_read_workout_sessions_eager_loads_logs(client: TestClient, db_session: Session, trainee_user: dict, trainee_headers: dict[str, str], trainer_user: dict, query_counter) -> None:
+    from datetime import date, timedelta
+    from app.models.exercise_log import ExerciseLog
+    from app.models.workout_session import WorkoutSession
+
+    program = crud_program.create(db_session, obj_in=ProgramCreate(name="Eager Program", description="A program for testing", trainer_id=trainer_user["id"]))
+    exercises = [crud_exercise.create(db_session, obj_in=ExerciseCreate(name=f"Eager Exercise {i}")) for i in range(3)]
+    for day in range(100):
+        session = WorkoutSession(trainee_id=trainee_user["id"], program_id=program.id, session_date=date.today() - timedelta(days=day), status="completed")
+        session.exercise_logs = [
+            ExerciseLog(exercise_id=exercise.id, completed_sets=3, completed_reps=10, completed_weight_kg=20.0, volume_kg=600.0)
+            for exercise in exercises
+        ]
+        db_session.add(session)
+    db_session.commit()
+    # Authenticate once so the principal is cached
+    client.get(f"{settings.API_V1_STR}/workout_sessions/?limit=1", headers=trainee_headers)
+
+    query_counter.reset()
+    r = client.get(f"{settings.API_V1_STR}/workout_sessions/?limit=100", headers=trainee_headers)
+    assert r.status_code == 200, r.text
+    data = r.json()
+    assert len(data) == 100
+    assert all(len(s["exercise_logs"]) == 3 for s in data)
+    assert {log["exercise"]["name"] for log in data[-1]["exercise_logs"]} == {e.name for e in exercises}
+    # Sessions, then logs joined to their exercises; never one query per row
+    assert query_counter.count <= 3, query_counter.statements
+
+
+def test_read_workout_sessions_summary_view(client: TestClient, db_session: Session, trainee_user: dict, trainee_headers: dict[str, str], trainer_user: dict, query_counter) -> None:
+    program = crud_program.create(db_session, obj_in=ProgramCreate(name="Summary Program", description="A program for testing", trainer_id=trainer_user["id"]))
+    squat = crud_exercise.create(db_session, obj_in=ExerciseCreate(name="Summary Squat"))
+    first = client.post(f"{settings.API_V1_STR}/workout_sessions/start", json={"trainee_id": trainee_user["id"], "program_id": program.id}, headers=trainee_headers).json()
+    second = client.post(f"{settings.API_V1_STR}/workout_sessions/start", json={"trainee_id": trainee_user["id"], "program_id": program.id}, headers=trainee_headers).json()
+    logs = [{"exercise_id": squat.id, "completed_sets": 1, "completed_reps": 5, "completed_weight_kg": weight} for weight in (100, 110)]
+    client.post(f"{settings.API_V1_STR}/workout_sessions/{first['id']}/log-exercises", json={"logs": logs}, headers=trainee_headers)
+
+    query_counter.reset()
+    r = client.get(f"{settings.API_V1_STR}/workout_sessions/?view=summary", headers=trainee_headers)
+    assert r.status_code == 200, r.text
+    rows = {row["id"]: row for row in r.json()}
+    assert rows[first["id"]] == {
+        "id": first["id"], "program_id": program.id, "session_date": first["session_date"],
+        "status": "in-progress", "log_count": 2, "total_volume_kg": 1050.0,
+    }
+    assert (rows[second["id"]]["log_count"], rows[second["id"]]["total_volume_kg"]) == (0, 0.0)
+    # Counts and volume come from the same statement as the sessions
+    assert not any("FROM exercise_logs" in s and "IN (" in s for s in query_counter.statements)
+
+    page = client.get(f"{settings.API_V1_STR}/workout_sessions/?view=summary&cursor=&limit=1", headers=trainee_headers).json()
+    assert page["items"][0]["id"] == second["id"] and page["next_cursor"]